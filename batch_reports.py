@@ -0,0 +1,143 @@
+"""
+ReHealth - Batch Report Renderer
+Renders the weekly graphs for every user without opening a window.
+
+Usage:
+    python batch_reports.py [--output DIR] [--formats png pdf] [--workers N] [--dpi DPI]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import partial
+
+import matplotlib
+
+# Agg must be selected before anything else touches matplotlib so no GUI toolkit is loaded
+matplotlib.use("Agg")
+
+from matplotlib.backends.backend_pdf import PdfPages  # noqa: E402
+
+# Add the current directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from db.db_handler import get_all_users  # noqa: E402
+from ui.graph_render import GRAPH_THEME, THEME_COLOURS, create_figure, fetch_graph_data, plot_line  # noqa: E402
+
+REPORT_GRAPHS = ["steps", "sleep", "calories", "bmi"]
+REPORT_FORMATS = ["png", "pdf"]
+
+# Each worker process draws every graph on the same figure
+_worker_fig = None
+_worker_ax = None
+
+
+def _init_worker() -> None:
+    """Creates the figure reused for every graph rendered by this worker."""
+    global _worker_fig, _worker_ax
+    _worker_fig, _worker_ax = create_figure()
+
+
+def render_user_reports(user: tuple[int, str], output_dir: str, formats: list[str], dpi: int) -> int:
+    """
+    Renders every report graph for one user.
+
+    Args:
+        user: A (UserID, Username) tuple.
+        output_dir: Folder the graphs are written to.
+        formats: Any of "png" (one file per graph) and "pdf" (one file per user).
+        dpi: Resolution used for the saved images.
+
+    Returns:
+        The number of graphs rendered.
+    """
+    if _worker_fig is None:
+        _init_worker()
+
+    user_id, username = user
+    facecolor = THEME_COLOURS[GRAPH_THEME]["figure"]
+    renders = 0
+
+    pdf = None
+    if "pdf" in formats:
+        pdf = PdfPages(os.path.join(output_dir, f"{username}_weekly_report.pdf"))
+
+    try:
+        for graph_type in REPORT_GRAPHS:
+            days, values = fetch_graph_data(graph_type, user_id)
+            plot_line(_worker_ax, days, values, graph_type)
+
+            if "png" in formats:
+                filename = os.path.join(output_dir, f"{username}_{graph_type}_graph_week.png")
+                _worker_fig.savefig(filename, dpi=dpi, facecolor=facecolor)
+            if pdf is not None:
+                pdf.savefig(_worker_fig, facecolor=facecolor)
+
+            renders += 1
+    finally:
+        if pdf is not None:
+            pdf.close()
+
+    return renders
+
+
+def render_all_reports(output_dir: str, formats: list[str], workers: int | None, dpi: int) -> tuple[int, int, float]:
+    """
+    Spreads every user across a process pool and renders their reports.
+
+    Returns:
+        A tuple of (users rendered, graphs rendered, seconds taken).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    users = get_all_users()
+    if not users:
+        return 0, 0, 0.0
+
+    workers = workers or os.cpu_count() or 1
+    # Hand out users in chunks so each worker keeps its figure busy between messages
+    chunksize = max(1, len(users) // (workers * 4))
+    render = partial(render_user_reports, output_dir=output_dir, formats=formats, dpi=dpi)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        total_renders = sum(pool.map(render, users, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    return len(users), total_renders, elapsed
+
+
+def main() -> None:
+    """
+    Parses command line arguments and renders the reports.
+    """
+    default_output = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "reports",
+        date.today().strftime("%Y-%m-%d")
+    )
+
+    parser = argparse.ArgumentParser(description="Render weekly ReHealth graphs for every user.")
+    parser.add_argument("--output", default=default_output, help="folder to write the reports to")
+    parser.add_argument("--formats", nargs="+", choices=REPORT_FORMATS, default=REPORT_FORMATS)
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--dpi", type=int, default=100)
+    args = parser.parse_args()
+
+    user_count, renders, elapsed = render_all_reports(args.output, args.formats, args.workers, args.dpi)
+    if not user_count:
+        print("No users found.")
+        return
+
+    rate = renders / elapsed if elapsed else 0.0
+    print(f"Rendered {renders} graphs for {user_count} users in {elapsed:.2f}s ({rate:.1f} renders/sec)")
+    print(f"Reports saved to {args.output}")
+
+
+if __name__ == "__main__":
+    """
+    Ensures file will not be ran if imported to a different file
+    """
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark - ReHealth account archives
+
+Fills a scratch database with one user's multi-year history (daily steps and
+sleep, three meals a day, a few workouts a week and weekly measurements), then
+times exporting the account to an archive and importing it back as a second
+account, checking the copy holds the same rows.
+
+Usage:
+    python benchmarks/bench_account_archive.py [--years N]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+# A scratch database, set before db_handler reads REHEALTH_DB_PATH
+SCRATCH_DIR = tempfile.mkdtemp(prefix="rehealth_bench_")
+os.environ["REHEALTH_DB_PATH"] = os.path.join(SCRATCH_DIR, "bench.db")
+
+# Add the project root to the Python path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from db.db_handler import get_db_connection  # noqa: E402
+from db.db_make import initialise_db  # noqa: E402
+from logic.account_archive import ARCHIVE_TABLES, export_account, import_account  # noqa: E402
+
+USER_ID = 1
+EXERCISES = ["Bench Press", "Squat", "Deadlift", "Overhead Press", "Barbell Row", "Pull Up"]
+FOODS = ["Porridge Oats", "Chicken Salad", "Pasta Bake", "Banana", "Greek Yoghurt", "Rice And Beans"]
+
+
+def fill_database(years: int) -> None:
+    """Creates the schema and one user with a history covering the last few years."""
+    initialise_db()
+    connection = get_db_connection()
+    connection.execute("""
+        INSERT INTO User (UserID, Username, Password, Sex, DateOfBirth, JoinDate)
+        VALUES (?, 'bench', 'x', 'Female', '1990-01-01', ?)
+    """, (USER_ID, date.today() - timedelta(days=365 * years)))
+    connection.executemany(
+        "INSERT INTO ExerciseCatalog (CanonicalName, DisplayName) VALUES (?, ?)",
+        [(name.lower(), name) for name in EXERCISES]
+    )
+    connection.executemany(
+        "INSERT INTO FoodItem (CanonicalName, DisplayName, DefaultCalories) VALUES (?, ?, 400)",
+        [(name.lower(), name) for name in FOODS]
+    )
+
+    days = [date.today() - timedelta(days=offset) for offset in range(365 * years, 0, -1)]
+    connection.executemany(
+        "INSERT INTO Steps (UserID, Date, StepCount, StepsGoal) VALUES (?, ?, ?, 10000)",
+        [(USER_ID, day, random.randint(2000, 16000)) for day in days]
+    )
+    connection.executemany(
+        "INSERT INTO Sleep (UserID, SleepDate, SleepRating, SleepDuration) VALUES (?, ?, ?, ?)",
+        [(USER_ID, day, random.randint(40, 100), random.choice([6, 6.5, 7, 7.5, 8, 8.5])) for day in days]
+    )
+    connection.executemany(
+        "INSERT INTO Food (UserID, FoodItemID, Calories, MealType, DateConsumed) VALUES (?, ?, ?, ?, ?)",
+        [(USER_ID, random.randint(1, len(FOODS)), random.randint(200, 900), meal, day)
+         for day in days for meal in ("breakfast", "lunch", "dinner")]
+    )
+    connection.executemany(
+        "INSERT INTO Exercises (UserID, CatalogID, Weight, Sets, Reps, DatePerformed) VALUES (?, ?, ?, 3, 8, ?)",
+        [(USER_ID, random.randint(1, len(EXERCISES)), random.randint(20, 200), day)
+         for day in days if day.weekday() in (0, 2, 4) for _ in range(4)]
+    )
+    connection.executemany(
+        "INSERT INTO MetricsTracking (UserID, Height, Weight, MetricDate) VALUES (?, 170, ?, ?)",
+        [(USER_ID, random.randint(60, 80), day) for day in days if day.weekday() == 0]
+    )
+    connection.commit()
+    connection.close()
+
+    # Scores the user, snapshotting today's score as an import does for the copy
+    initialise_db()
+
+
+def user_rows(user_id: int) -> dict[str, list[tuple]]:
+    """Every archived row of a user, in the form written to the archive."""
+    connection = get_db_connection()
+    rows = {
+        table: connection.execute(select_query, (user_id,)).fetchall()
+        for table, (_, _, select_query, _, _) in ARCHIVE_TABLES.items()
+    }
+    connection.close()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time exporting and importing an account archive.")
+    parser.add_argument("--years", type=int, default=5, help="years of history")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    fill_database(args.years)
+    original = user_rows(USER_ID)
+    total = sum(len(rows) for rows in original.values())
+    print(f"Created {total} rows over {args.years} years in {time.perf_counter() - start:.2f}s")
+
+    filename = os.path.join(SCRATCH_DIR, "bench_account.zip")
+    start = time.perf_counter()
+    export_account(USER_ID, filename)
+    print(f"Exported in {time.perf_counter() - start:.2f}s ({os.path.getsize(filename) / 1_000_000:.2f} MB)")
+
+    start = time.perf_counter()
+    copy_id = import_account(filename, "bench_copy")
+    print(f"Imported in {time.perf_counter() - start:.2f}s")
+
+    print("Copy matches original" if user_rows(copy_id) == original else "Copy DOES NOT match original")
+    shutil.rmtree(SCRATCH_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark - ReHealth calculations
+
+Checks the NumPy array formulas give exactly the same results as the scalar
+ones, then times both over a million rows.
+
+Usage:
+    python benchmarks/bench_calculations.py [--rows N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add the project root to the Python path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.calculations import (  # noqa: E402
+    bmi_calc,
+    bmi_calc_array,
+    bmi_status,
+    bmi_status_array,
+    calories_burnt,
+    calories_burnt_array,
+    sleep_calc,
+    sleep_calc_array
+)
+
+
+def _time(function, *args) -> tuple[float, object]:
+    """Runs function once and returns (seconds, result)."""
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def _make_inputs(rows: int) -> dict[str, np.ndarray]:
+    """Random inputs covering every branch of the formulas."""
+    rng = np.random.default_rng(2025)
+    weights = np.round(rng.uniform(30, 250, rows), 1)
+    weights[rng.random(rows) < 0.05] = 0.0  # unknown weight for calories_burnt
+    return {
+        "weights": weights,
+        "heights": np.round(rng.uniform(120, 220, rows), 1),
+        "steps": rng.integers(0, 50000, rows),
+        "durations": np.round(rng.uniform(0, 14, rows), 1),
+        "qualities": rng.integers(1, 6, rows).astype(float),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare scalar and NumPy calculation speed.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    data = _make_inputs(args.rows)
+    bmi_weights = np.where(data["weights"] == 0.0, 70.0, data["weights"])
+    bmis = bmi_calc_array(bmi_weights, data["heights"])
+
+    # The scalar functions are fed plain Python values, as they are in the app
+    weights = data["weights"].tolist()
+    heights = data["heights"].tolist()
+    steps = data["steps"].tolist()
+    durations = data["durations"].tolist()
+    qualities = data["qualities"].tolist()
+    bmi_list = bmis.tolist()
+    bmi_weight_list = bmi_weights.tolist()
+
+    cases = [
+        (
+            "bmi_calc",
+            lambda: [bmi_calc(w, h) for w, h in zip(bmi_weight_list, heights)],
+            lambda: bmi_calc_array(bmi_weights, data["heights"]),
+        ),
+        (
+            "bmi_status",
+            lambda: [bmi_status(bmi) for bmi in bmi_list],
+            lambda: bmi_status_array(bmis),
+        ),
+        (
+            "sleep_calc",
+            lambda: [sleep_calc(d, q) for d, q in zip(durations, qualities)],
+            lambda: sleep_calc_array(data["durations"], data["qualities"]),
+        ),
+        (
+            "calories_burnt",
+            lambda: [calories_burnt(s, w) for s, w in zip(steps, weights)],
+            lambda: calories_burnt_array(data["steps"], data["weights"]),
+        ),
+    ]
+
+    print(f"{'formula':<16}{'scalar (s)':>12}{'array (s)':>12}{'speedup':>10}")
+    for name, scalar, vectorised in cases:
+        scalar_time, scalar_result = _time(scalar)
+        array_time, array_result = _time(vectorised)
+
+        # The array version must agree with the scalar version on every row
+        if array_result.tolist() != scalar_result:
+            raise SystemExit(f"{name}: array results differ from scalar results")
+
+        print(f"{name:<16}{scalar_time:>12.3f}{array_time:>12.3f}{scalar_time / array_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark - ReHealth record export formats
+
+Fills a scratch database with one user's long workout history, then times
+export_history writing it in every available format. The text log is the
+baseline; each format's throughput is reported against it, along with the
+size of the file written.
+
+Usage:
+    python benchmarks/bench_export_formats.py [--rows N] [--repeats N]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+# A scratch database, set before db_handler reads REHEALTH_DB_PATH
+SCRATCH_DIR = tempfile.mkdtemp(prefix="rehealth_bench_")
+os.environ["REHEALTH_DB_PATH"] = os.path.join(SCRATCH_DIR, "bench.db")
+
+# Add the project root to the Python path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from db.db_handler import get_db_connection  # noqa: E402
+from db.db_make import initialise_db  # noqa: E402
+from logic.exports import available_formats, export_history  # noqa: E402
+
+USER_ID = 1
+EXERCISES = ["Bench Press", "Squat", "Deadlift", "Overhead Press", "Barbell Row", "Pull Up"]
+
+
+def fill_database(rows: int) -> None:
+    """Creates the schema and one user with rows workouts spread over the last ten years."""
+    initialise_db()
+    connection = get_db_connection()
+    connection.execute("INSERT INTO User (UserID, Username, Password) VALUES (?, 'bench', 'x')", (USER_ID,))
+    connection.executemany(
+        "INSERT INTO ExerciseCatalog (CanonicalName, DisplayName) VALUES (?, ?)",
+        [(name.lower(), name) for name in EXERCISES]
+    )
+
+    start_day = date.today() - timedelta(days=3650)
+    connection.executemany("""
+        INSERT INTO Exercises (UserID, CatalogID, Weight, Sets, Reps, DatePerformed)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, (
+        (USER_ID, random.randint(1, len(EXERCISES)), random.randint(20, 200), 3, 8,
+         start_day + timedelta(days=random.randint(0, 3650)))
+        for _ in range(rows)
+    ))
+    connection.commit()
+    connection.close()
+
+
+def time_export(file_format: str, repeats: int) -> tuple[float, int]:
+    """Median seconds to export the workouts in a format, and the size of the file written."""
+    filename = os.path.join(SCRATCH_DIR, f"workouts.{file_format}")
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        export_history("workouts", USER_ID, "bench", filename, file_format=file_format)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), os.path.getsize(filename)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time exporting a workout history in each format.")
+    parser.add_argument("--rows", type=int, default=200_000, help="workouts in the history")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    fill_database(args.rows)
+    print(f"Created {args.rows} workouts in {time.perf_counter() - start:.2f}s")
+
+    text_seconds, text_size = time_export("txt", args.repeats)
+
+    # MB/s counts the text log's size so compressed formats are compared on the same data
+    print(f"{'format':>10}{'seconds':>10}{'file (MB)':>12}{'MB/s':>10}{'rows/s':>12}{'vs txt':>9}")
+    for file_format in available_formats():
+        seconds, size = (text_seconds, text_size) if file_format == "txt" else time_export(file_format, args.repeats)
+        print(f"{file_format:>10}{seconds:>10.3f}{size / 1_000_000:>12.2f}"
+              f"{text_size / seconds / 1_000_000:>10.1f}{args.rows / seconds:>12,.0f}"
+              f"{text_seconds / seconds:>8.2f}x")
+
+    shutil.rmtree(SCRATCH_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
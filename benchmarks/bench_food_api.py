@@ -0,0 +1,64 @@
+"""
+Benchmark - ReHealth food API client
+
+Runs FoodApiClient against the local stub server to show the effect of
+request coalescing, the on-disk cache and bounded concurrent lookups.
+No network access or API key is needed. The behaviour itself is covered by
+tests/test_food_api.py.
+
+Usage:
+    python benchmarks/bench_food_api.py [--delay SECONDS] [--foods N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add the project root to the Python path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.food_api import FoodApiClient, ResponseCache  # noqa: E402
+from tests.food_api_stub import StubFoodServer  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the food API client against a local stub.")
+    parser.add_argument("--delay", type=float, default=0.05, help="stub response delay in seconds")
+    parser.add_argument("--foods", type=int, default=40)
+    args = parser.parse_args()
+
+    foods = {f"food {number}": 100 + number for number in range(args.foods)}
+
+    with tempfile.TemporaryDirectory() as folder, StubFoodServer(foods, delay=args.delay) as server:
+        client = FoodApiClient(base_url=server.url, cache=ResponseCache(os.path.join(folder, "cache.db")))
+
+        # Ten identical lookups started together share one request
+        start = time.perf_counter()
+        futures = [client.lookup_async("Food 0") for _ in range(10)]
+        for future in futures:
+            future.result()
+        print(f"10 identical lookups: {server.request_count} request(s), "
+              f"{time.perf_counter() - start:.3f} s")
+
+        # Distinct lookups run MAX_WORKERS at a time
+        before = server.request_count
+        start = time.perf_counter()
+        client.lookup_many(foods)
+        elapsed = time.perf_counter() - start
+        print(f"{len(foods)} distinct lookups: {server.request_count - before} request(s), "
+              f"{elapsed:.3f} s (sequential would take about {len(foods) * args.delay:.3f} s)")
+
+        # Everything is now served from the disk cache
+        before = server.request_count
+        start = time.perf_counter()
+        client.lookup_many(foods)
+        print(f"{len(foods)} cached lookups: {server.request_count - before} request(s), "
+              f"{time.perf_counter() - start:.3f} s")
+
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark - ReHealth nutrition lookups
+
+Times loading the bundled nutrition dataset and the prefix searches and exact
+lookups the Food page makes while the user types.
+
+Usage:
+    python benchmarks/bench_nutrition_lookup.py [--repeats N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the Python path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.nutrition_db import NutritionDatabase  # noqa: E402
+
+PREFIXES = ["a", "ch", "chick", "rice", "pasta b", "yog", "zz"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time offline nutrition lookups.")
+    parser.add_argument("--repeats", type=int, default=10_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    database = NutritionDatabase()
+    print(f"Loaded {len(database)} foods in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    print(f"{'prefix':<10}{'matches':>9}{'per search (us)':>18}")
+    for prefix in PREFIXES:
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            results = database.search(prefix)
+        per_search = (time.perf_counter() - start) / args.repeats
+        print(f"{prefix!r:<10}{len(results):>9}{per_search * 1_000_000:>18.2f}")
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        database.lookup("Chicken Breast")
+    per_lookup = (time.perf_counter() - start) / args.repeats
+    print(f"Exact lookup: {per_lookup * 1_000_000:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
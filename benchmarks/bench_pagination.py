@@ -0,0 +1,136 @@
+"""
+Benchmark - ReHealth history pagination
+
+Fills a scratch database with one user's long workout history, then times
+reading a page at increasing depths with the keyset cursor used by
+get_workouts_page and with the equivalent LIMIT/OFFSET query. Keyset pages
+should take the same time at any depth; OFFSET pages slow down the deeper
+they are, as every skipped row is still read.
+
+Usage:
+    python benchmarks/bench_pagination.py [--rows N] [--page-size N] [--repeats N]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+# A scratch database, set before db_handler reads REHEALTH_DB_PATH
+SCRATCH_DIR = tempfile.mkdtemp(prefix="rehealth_bench_")
+os.environ["REHEALTH_DB_PATH"] = os.path.join(SCRATCH_DIR, "bench.db")
+
+# Add the project root to the Python path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from db.db_handler import get_db_connection, get_workouts_page  # noqa: E402
+from db.db_make import initialise_db  # noqa: E402
+
+USER_ID = 1
+EXERCISES = ["Bench Press", "Squat", "Deadlift", "Overhead Press", "Barbell Row", "Pull Up"]
+
+OFFSET_QUERY = """
+    SELECT Exercises.DatePerformed, ExerciseCatalog.DisplayName,
+           Exercises.Weight, Exercises.Sets, Exercises.Reps
+    FROM Exercises
+    LEFT JOIN ExerciseCatalog ON ExerciseCatalog.CatalogID = Exercises.CatalogID
+    WHERE Exercises.UserID = ?
+    ORDER BY Exercises.DatePerformed DESC, Exercises.ExerciseID DESC
+    LIMIT ? OFFSET ?
+"""
+
+
+def fill_database(rows: int) -> None:
+    """Creates the schema and one user with rows workouts spread over the last ten years."""
+    initialise_db()
+    connection = get_db_connection()
+    connection.execute("INSERT INTO User (UserID, Username, Password) VALUES (?, 'bench', 'x')", (USER_ID,))
+    connection.executemany(
+        "INSERT INTO ExerciseCatalog (CanonicalName, DisplayName) VALUES (?, ?)",
+        [(name.lower(), name) for name in EXERCISES]
+    )
+
+    start_day = date.today() - timedelta(days=3650)
+    connection.executemany("""
+        INSERT INTO Exercises (UserID, CatalogID, Weight, Sets, Reps, DatePerformed)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, (
+        (USER_ID, random.randint(1, len(EXERCISES)), random.randint(20, 200), 3, 8,
+         start_day + timedelta(days=random.randint(0, 3650)))
+        for _ in range(rows)
+    ))
+    connection.commit()
+    connection.close()
+
+
+def cursors_at_depths(depths: list[int], page_size: int) -> dict[int, tuple]:
+    """Walks the whole history once, noting the keyset cursor that starts each depth."""
+    cursors = {0: None}
+    after = None
+    read = 0
+    while True:
+        _, after = get_workouts_page(USER_ID, after, page_size)
+        if after is None:
+            return cursors
+        read += page_size
+        if read in depths:
+            cursors[read] = after
+
+
+def time_keyset(after, page_size: int, repeats: int) -> float:
+    """Median milliseconds to read one page with get_workouts_page."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        get_workouts_page(USER_ID, after, page_size)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def time_offset(offset: int, page_size: int, repeats: int) -> float:
+    """Median milliseconds to read one page with LIMIT/OFFSET."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        connection = get_db_connection()
+        connection.execute(OFFSET_QUERY, (USER_ID, page_size, offset)).fetchall()
+        connection.close()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time keyset and OFFSET pagination at increasing depths.")
+    parser.add_argument("--rows", type=int, default=200_000, help="workouts in the history")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    fill_database(args.rows)
+    print(f"Created {args.rows} workouts in {time.perf_counter() - start:.2f}s")
+
+    depths = [0]
+    depth = args.page_size
+    while depth < args.rows:
+        depths.append(depth)
+        depth *= 10
+    depths.append((args.rows // args.page_size - 1) * args.page_size)
+    cursors = cursors_at_depths(depths, args.page_size)
+
+    print(f"{'depth':>10}{'keyset (ms)':>14}{'offset (ms)':>14}")
+    for depth in depths:
+        keyset_ms = time_keyset(cursors[depth], args.page_size, args.repeats)
+        offset_ms = time_offset(depth, args.page_size, args.repeats)
+        print(f"{depth:>10}{keyset_ms:>14.3f}{offset_ms:>14.3f}")
+
+    shutil.rmtree(SCRATCH_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
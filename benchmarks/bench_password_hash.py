@@ -0,0 +1,67 @@
+"""
+Benchmark - ReHealth password hashing
+
+Finds the PBKDF2 iteration count that makes one password check take about the
+target time on this machine, then confirms it. Set the result as
+REHEALTH_PBKDF2_ITERATIONS for this deployment; existing hashes are upgraded
+to the new cost the next time each user logs in.
+
+Usage:
+    python benchmarks/bench_password_hash.py [--target-ms 250]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add the project root to the Python path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from logic.user import PASSWORD_HASH_ITERATIONS, User  # noqa: E402
+
+PASSWORD = "Calibrate-Pa55word!"
+
+
+def _time_hash(iterations: int, repeats: int) -> float:
+    """Median seconds to hash one password at the given cost."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        User.password_hasher(PASSWORD, iterations)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Calibrate the password hashing cost.")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="target time per login check")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    current = _time_hash(PASSWORD_HASH_ITERATIONS, args.repeats)
+    print(f"Current cost: {PASSWORD_HASH_ITERATIONS:,} iterations, {current * 1000:.1f} ms")
+
+    # PBKDF2 time grows linearly with iterations, so one probe is enough to scale from
+    probe_iterations = 100_000
+    probe = _time_hash(probe_iterations, args.repeats)
+    calibrated = int(probe_iterations * (args.target_ms / 1000) / probe)
+    calibrated = max(10_000, round(calibrated, -4))
+
+    confirmed = _time_hash(calibrated, args.repeats)
+    print(f"Calibrated:   {calibrated:,} iterations, {confirmed * 1000:.1f} ms "
+          f"(target {args.target_ms:.0f} ms)")
+
+    # Verification must cost the same as hashing, with no shortcut for wrong passwords
+    stored = User.password_hasher(PASSWORD, calibrated)
+    start = time.perf_counter()
+    assert User.verify_password(stored, PASSWORD)
+    assert not User.verify_password(stored, PASSWORD + "x")
+    print(f"Verify right + wrong password: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    print(f"\nexport REHEALTH_PBKDF2_ITERATIONS={calibrated}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,22 +2,92 @@ import os
 import sqlite3
 from datetime import date, datetime, timedelta
 
-DB_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "db", "rehealth_db.db"))
+# REHEALTH_DB_PATH lets headless tools point at a different database file
+DB_PATH = os.environ.get("REHEALTH_DB_PATH") or os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "db", "rehealth_db.db")
+)
 
 
-def get_db_connection(enable_foreign_keys=False):
+# Callbacks notified after a save_* function commits, see subscribe_changes
+_change_listeners = []
+
+
+def get_db_connection(enable_foreign_keys=False, check_same_thread=True):
     """Sets up database connection"""
-    connection = sqlite3.connect(DB_PATH)
+    connection = sqlite3.connect(DB_PATH, check_same_thread=check_same_thread)
     if enable_foreign_keys:
         connection.execute("PRAGMA foreign_keys = ON")
     return connection
 
 
+def subscribe_changes(listener):
+    """
+    Registers a callback for changes made through this module.
+
+    Args:
+    listener: Called as listener(table, user_id) on the thread that saved the data
+    """
+    if listener not in _change_listeners:
+        _change_listeners.append(listener)
+
+
+def unsubscribe_changes(listener):
+    """
+    Removes a callback registered with subscribe_changes.
+    """
+    if listener in _change_listeners:
+        _change_listeners.remove(listener)
+
+
+def _publish_change(table, user_id):
+    """
+    Notifies every listener that a table changed for a user.
+    """
+    for listener in list(_change_listeners):
+        try:
+            listener(table, user_id)
+        except Exception as e:
+            print(f"Error notifying change listener: {e}")
+
+
+class DataVersionWatcher:
+    """
+    Detects commits made by any other connection, including other ReHealth instances.
+
+    PRAGMA data_version only changes when a different connection commits,
+    so the watcher keeps its own connection open and never writes with it.
+    A watcher shared between threads must be created with check_same_thread=False
+    and only checked by one thread at a time.
+    """
+
+    def __init__(self, check_same_thread=True):
+        self.connection = get_db_connection(check_same_thread=check_same_thread)
+        self.version = self._read_version()
+
+    def _read_version(self):
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def has_changed(self):
+        """
+        Returns: Whether the database has changed since the last check.
+        """
+        version = self._read_version()
+        changed = version != self.version
+        self.version = version
+        return changed
+
+    def close(self):
+        """Closes the watcher's connection"""
+        self.connection.close()
+
+
 def save_user_to_db(user):
     """
     Saves a new user to the database
 
-    Args: user_id (int): The user's ID.
+    Args: user (User): The user to save, with their password already hashed.
+
+    Returns: True if the user was saved, False if the username is already taken.
     """
     connection = get_db_connection()
     cursor = connection.cursor()
@@ -35,19 +105,36 @@ def save_user_to_db(user):
         );
     """)
 
-    while True:
-        try:
-            cursor.execute("""
-                INSERT INTO User (Username, Password, Sex, DateOfBirth, JoinDate)
-                VALUES (?, ?, ?, ?, ?);
-            """, (user.username, user.password, user.sex, user.dob, user.join_date))
-            connection.commit()
-            print("User successfully saved to database.")
-            break  # Exit loop if user successfully saved
-        except sqlite3.IntegrityError:
-            # Check for duplicate username
-            print("Error: Username already exists. Please choose a different username.")
+    try:
+        cursor.execute("""
+            INSERT INTO User (Username, Password, Sex, DateOfBirth, JoinDate)
+            VALUES (?, ?, ?, ?, ?);
+        """, (user.username, user.password, user.sex, user.dob, user.join_date))
+        connection.commit()
+        print("User successfully saved to database.")
+        return True
+    except sqlite3.IntegrityError:
+        # Duplicate username, retrying the same insert could never succeed
+        print("Error: Username already exists. Please choose a different username.")
+        return False
+    finally:
+        connection.close()
+
+
+def update_password_hash(user_id, password_hash):
+    """
+    Replaces a user's stored password hash, e.g. when upgrading a legacy hash at login.
 
+    Args:
+        user_id: The user's ID
+        password_hash: New hash from User.password_hasher
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute("UPDATE User SET Password = ? WHERE UserID = ?", (password_hash, user_id))
+
+    connection.commit()
     connection.close()
 
 
@@ -71,6 +158,7 @@ def save_metrics(user_id, height, weight):
 
     connection.commit()
     connection.close()
+    _publish_change("MetricsTracking", user_id)
 
 
 def save_steps(user_id, step_count, step_goal):
@@ -83,16 +171,27 @@ def save_steps(user_id, step_count, step_goal):
     step_count: Number of steps taken by the user
     step_goal: Daily step goal
     """
+    # Imported here to avoid a circular import, the engines use this module's connection
+    from logic.leaderboard import record_weekly_steps
+    from logic.score_engine import record_activity
+    from logic.streaks import record_streaks
+
     connection = get_db_connection(enable_foreign_keys=True)
     cursor = connection.cursor()
 
+    record_activity(cursor, user_id, steps=int(step_count))
+    record_weekly_steps(cursor, user_id, int(step_count))
+
     cursor.execute("""
         INSERT INTO Steps (UserID, Date, StepCount, StepsGoal)
         VALUES (?, ?, ?, ?)
     """, (user_id, date.today(), step_count, step_goal))
 
+    record_streaks(cursor, user_id, "Steps")
+
     connection.commit()
     connection.close()
+    _publish_change("Steps", user_id)
 
 
 def save_sleep(user_id, sleep_hours, sleep_quality=None):
@@ -105,16 +204,24 @@ def save_sleep(user_id, sleep_hours, sleep_quality=None):
     sleep_hours: Hours slept by the user
     sleep_quality: User's objective sleep quality
     """
+    from logic.score_engine import record_activity
+    from logic.streaks import record_streaks
+
     connection = get_db_connection(enable_foreign_keys=True)
     cursor = connection.cursor()
 
+    record_activity(cursor, user_id, sleep_hours=float(sleep_hours))
+
     cursor.execute("""
         INSERT INTO Sleep (UserID, SleepDate, SleepRating, SleepDuration)
         VALUES (?, ?, ?, ?)
     """, (user_id, date.today(), sleep_quality, sleep_hours))
 
+    record_streaks(cursor, user_id, "Sleep")
+
     connection.commit()
     connection.close()
+    _publish_change("Sleep", user_id)
 
 
 def save_food(user_id, food_name, calories, meal_type):
@@ -128,16 +235,24 @@ def save_food(user_id, food_name, calories, meal_type):
     calories: Number of calories
     meal_type: Type of meal
     """
+    from logic.food_catalog import get_or_create_food_item
+    from logic.streaks import record_streaks
+
     connection = get_db_connection(enable_foreign_keys=True)
     cursor = connection.cursor()
 
+    food_item_id = get_or_create_food_item(cursor, food_name, calories)
+
     cursor.execute("""
-        INSERT INTO Food (UserID, FoodName, Calories, MealType, DateConsumed)
+        INSERT INTO Food (UserID, FoodItemID, Calories, MealType, DateConsumed)
         VALUES (?, ?, ?, ?, ?)
-    """, (user_id, food_name, calories, meal_type.lower(), date.today()))
+    """, (user_id, food_item_id, calories, meal_type.lower(), date.today()))
+
+    record_streaks(cursor, user_id, "Food")
 
     connection.commit()
     connection.close()
+    _publish_change("Food", user_id)
 
 
 def save_workout(user_id, exercise_name, weight, sets, reps):
@@ -151,40 +266,36 @@ def save_workout(user_id, exercise_name, weight, sets, reps):
     weight: Amount of weight lifted
     sets: Number of sets performed
     reps: Number of reps performed
+
+    Returns:
+        The names of any personal records the workout beat.
     """
+    from logic.exercise_analytics import record_personal_records
+    from logic.exercise_catalog import get_or_create_exercise
+    from logic.score_engine import record_activity
+    from logic.streaks import record_streaks
+
     connection = get_db_connection(enable_foreign_keys=True)
     cursor = connection.cursor()
 
-    cursor.execute("""
-        INSERT INTO Exercises (UserID, ExerciseName, Weight, Sets, Reps, DatePerformed)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (user_id, exercise_name, weight, sets, reps, date.today()))
+    catalog_id = get_or_create_exercise(cursor, exercise_name)
 
-    connection.commit()
-    connection.close()
+    record_activity(cursor, user_id, weight_lifted=float(weight) * int(sets) * int(reps))
+    personal_records = record_personal_records(
+        cursor, user_id, catalog_id, float(weight), int(sets), int(reps)
+    )
 
+    cursor.execute("""
+        INSERT INTO Exercises (UserID, CatalogID, Weight, Sets, Reps, DatePerformed)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, (user_id, catalog_id, weight, sets, reps, date.today()))
 
-def get_weight(user_id):
-    """
-    Fetches weight from the database
+    record_streaks(cursor, user_id, "Exercises")
 
-    Args:
-    user_id:  The user's ID
-
-    Returns: The weight the user recorded in the database
-    """
-    connection = get_db_connection()
-    cursor = connection.cursor()
-    cursor.execute("""
-           SELECT Weight 
-           FROM MetricsTracking
-           WHERE UserID = ?
-           ORDER BY MetricDate DESC
-           LIMIT 1
-       """, (user_id,))
-    result = cursor.fetchone()
+    connection.commit()
     connection.close()
-    return float(result[0]) if result and result[0] is not None else 0.0
+    _publish_change("Exercises", user_id)
+    return personal_records
 
 
 def get_last_7_days_steps(user_id):
@@ -346,56 +457,255 @@ def get_last_7_days_calories_convert(user_id):
     return day_numbers, calories
 
 
-def get_all_days_metrics(user_id):
+def _fetch_keyset_page(query, key_columns, user_id, after, limit):
     """
-    Gets a list of all the measurement information
-    stored by the user from the database
+    Runs one page of a keyset paginated query.
+
+    The query contains an {after} placeholder, which becomes a row value comparison
+    against the cursor so the page starts straight from the index instead of
+    skipping rows like OFFSET, and its last selected columns are the sort key.
+
+    Dates are nullable, and NULL sorts after every date when descending, so rows
+    without a date come last. A row value comparison with NULL is never true, so
+    once the dated rows run out the undated ones are read with a query of their own.
+
+    Args:
+    query: SQL ordered by key_columns descending, with UserID and LIMIT parameters
+    key_columns: The (date, primary key) columns the rows are ordered by
+    user_id: The user's ID
+    after: Cursor returned with the previous page, or None for the first page
+    limit: Most rows to return
+
+    Returns: (rows, cursor). The cursor is None once the last page has been read.
+    """
+    date_column, id_column = key_columns
+    if after is None:
+        after_sql, params = "", (user_id, limit)
+    elif after[0] is None:
+        # The previous page ended among the undated rows
+        after_sql = f"AND {date_column} IS NULL AND {id_column} < ?"
+        params = (user_id, after[1], limit)
+    else:
+        after_sql = f"AND ({date_column}, {id_column}) < (?, ?)"
+        params = (user_id, *after, limit)
+
+    connection = get_db_connection()
+    cursor = connection.cursor()
+    cursor.execute(query.format(after=after_sql), params)
+    rows = cursor.fetchall()
+
+    if after is not None and after[0] is not None and len(rows) < limit:
+        cursor.execute(query.format(after=f"AND {date_column} IS NULL"), (user_id, limit - len(rows)))
+        rows += cursor.fetchall()
+    connection.close()
+
+    key_size = len(key_columns)
+    cursor = tuple(rows[-1][-key_size:]) if len(rows) == limit else None
+    return [row[:-key_size] for row in rows], cursor
+
+
+def get_workouts_page(user_id, after=None, limit=100):
     """
-    try:
-        connection = get_db_connection()
-        cursor = connection.cursor()
+    Gets one page of the user's workouts, newest first, ties broken by ExerciseID.
 
-        # Fetch all metrics for the user
-        cursor.execute("""
-                   SELECT MetricDate, Height, Weight
-                   FROM MetricsTracking
-                   WHERE UserID = ?
-                   ORDER BY MetricDate DESC
-               """, (user_id,))
+    Args:
+    user_id: The user's ID
+    after: Cursor returned with the previous page, or None for the first page
+    limit: Most rows to return
 
-        records = cursor.fetchall()
-        connection.close()
-        return records
-    except Exception as e:
-        print(f"Error fetching user metrics: {e}")
-        return []
+    Returns: (rows, cursor). Rows are (date, exercise name, weight, sets, reps) tuples.
+    """
+    return _fetch_keyset_page("""
+        SELECT Exercises.DatePerformed, ExerciseCatalog.DisplayName,
+               Exercises.Weight, Exercises.Sets, Exercises.Reps,
+               Exercises.DatePerformed, Exercises.ExerciseID
+        FROM Exercises
+        LEFT JOIN ExerciseCatalog ON ExerciseCatalog.CatalogID = Exercises.CatalogID
+        WHERE Exercises.UserID = ? {after}
+        ORDER BY Exercises.DatePerformed DESC, Exercises.ExerciseID DESC
+        LIMIT ?
+    """, ("Exercises.DatePerformed", "Exercises.ExerciseID"), user_id, after, limit)
 
 
-def get_all_workouts(user_id):
+def get_metrics_page(user_id, after=None, limit=100):
     """
-    Gets a list of all the workout information
-    stored by the user from the database
+    Gets one page of the user's measurements, newest first, ties broken by MetricID.
+
+    Args:
+    user_id: The user's ID
+    after: Cursor returned with the previous page, or None for the first page
+    limit: Most rows to return
+
+    Returns: (rows, cursor). Rows are (date, height, weight) tuples.
     """
-    try:
-        connection = get_db_connection()
-        cursor = connection.cursor()
+    return _fetch_keyset_page("""
+        SELECT MetricDate, Height, Weight, MetricDate, MetricID
+        FROM MetricsTracking
+        WHERE UserID = ? {after}
+        ORDER BY MetricDate DESC, MetricID DESC
+        LIMIT ?
+    """, ("MetricDate", "MetricID"), user_id, after, limit)
 
-        # Fetch all workouts for the user
-        cursor.execute("""
-            SELECT DatePerformed, ExerciseName, Weight, Sets, Reps
-            FROM Exercises
-            WHERE UserID = ?
-            ORDER BY DatePerformed DESC
-        """, (user_id,))
 
-        records = cursor.fetchall()
-        connection.close()
+def get_steps_page(user_id, after=None, limit=100):
+    """
+    Gets one page of the user's step entries, newest first, ties broken by StepID.
+
+    Args:
+    user_id: The user's ID
+    after: Cursor returned with the previous page, or None for the first page
+    limit: Most rows to return
+
+    Returns: (rows, cursor). Rows are (date, step count, steps goal) tuples.
+    """
+    return _fetch_keyset_page("""
+        SELECT Date, StepCount, StepsGoal, Date, StepID
+        FROM Steps
+        WHERE UserID = ? {after}
+        ORDER BY Date DESC, StepID DESC
+        LIMIT ?
+    """, ("Date", "StepID"), user_id, after, limit)
 
-        return records
 
-    except Exception as e:
-        print(f"Error fetching workouts: {e}")
-        return []
+def get_sleep_page(user_id, after=None, limit=100):
+    """
+    Gets one page of the user's sleep entries, newest first, ties broken by SleepID.
+
+    Args:
+    user_id: The user's ID
+    after: Cursor returned with the previous page, or None for the first page
+    limit: Most rows to return
+
+    Returns: (rows, cursor). Rows are (date, hours slept, sleep rating) tuples.
+    """
+    return _fetch_keyset_page("""
+        SELECT SleepDate, SleepDuration, SleepRating, SleepDate, SleepID
+        FROM Sleep
+        WHERE UserID = ? {after}
+        ORDER BY SleepDate DESC, SleepID DESC
+        LIMIT ?
+    """, ("SleepDate", "SleepID"), user_id, after, limit)
+
+
+def get_food_page(user_id, after=None, limit=100):
+    """
+    Gets one page of the user's meals, newest first, ties broken by FoodID.
+
+    Args:
+    user_id: The user's ID
+    after: Cursor returned with the previous page, or None for the first page
+    limit: Most rows to return
+
+    Returns: (rows, cursor). Rows are (date, food name, calories, meal type) tuples.
+    """
+    return _fetch_keyset_page("""
+        SELECT Food.DateConsumed, FoodItem.DisplayName, Food.Calories, Food.MealType,
+               Food.DateConsumed, Food.FoodID
+        FROM Food
+        LEFT JOIN FoodItem ON FoodItem.FoodItemID = Food.FoodItemID
+        WHERE Food.UserID = ? {after}
+        ORDER BY Food.DateConsumed DESC, Food.FoodID DESC
+        LIMIT ?
+    """, ("Food.DateConsumed", "Food.FoodID"), user_id, after, limit)
+
+
+def iter_pages(get_page, user_id, page_size):
+    """
+    Yields every page of a keyset paginated history, so only one page is in memory at a time.
+
+    Args:
+    get_page: One of the get_*_page functions
+    user_id: The user's ID
+    page_size: Most rows per page
+
+    Yields: Lists of rows in the form of get_page, newest first.
+    """
+    after = None
+    while True:
+        rows, after = get_page(user_id, after, page_size)
+        yield rows
+        if after is None:
+            return
+
+
+def count_workouts(user_id):
+    """
+    Returns: How many workouts the user has logged.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+    cursor.execute("SELECT COUNT(*) FROM Exercises WHERE UserID = ?", (user_id,))
+    count = cursor.fetchone()[0]
+    connection.close()
+    return count
+
+
+def count_metrics(user_id):
+    """
+    Returns: How many measurements the user has recorded.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+    cursor.execute("SELECT COUNT(*) FROM MetricsTracking WHERE UserID = ?", (user_id,))
+    count = cursor.fetchone()[0]
+    connection.close()
+    return count
+
+
+def count_steps(user_id):
+    """
+    Returns: How many step entries the user has logged.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+    cursor.execute("SELECT COUNT(*) FROM Steps WHERE UserID = ?", (user_id,))
+    count = cursor.fetchone()[0]
+    connection.close()
+    return count
+
+
+def count_sleep(user_id):
+    """
+    Returns: How many sleep entries the user has logged.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+    cursor.execute("SELECT COUNT(*) FROM Sleep WHERE UserID = ?", (user_id,))
+    count = cursor.fetchone()[0]
+    connection.close()
+    return count
+
+
+def count_food(user_id):
+    """
+    Returns: How many meals the user has logged.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+    cursor.execute("SELECT COUNT(*) FROM Food WHERE UserID = ?", (user_id,))
+    count = cursor.fetchone()[0]
+    connection.close()
+    return count
+
+
+def get_all_users():
+    """
+    Gets the ID and username of every registered user.
+
+    Returns: A list of (UserID, Username) tuples ordered by UserID.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute("""
+        SELECT UserID, Username
+        FROM User
+        ORDER BY UserID
+    """)
+
+    users = cursor.fetchall()
+    connection.close()
+    return users
 
 
 def get_total_steps(user_id):
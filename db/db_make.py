@@ -1,4 +1,12 @@
 from db.db_handler import get_db_connection
+from logic.exercise_analytics import backfill_all_personal_records
+from logic.exercise_catalog import migrate_exercise_names
+from logic.food_catalog import migrate_food_names
+from logic.history_search import create_search_tables
+from logic.leaderboard import backfill_weekly_steps
+from logic.score_engine import backfill_all_scores
+from logic.sessions import create_session_table
+from logic.streaks import backfill_all_streaks
 
 
 def initialise_db():
@@ -41,19 +49,32 @@ def initialise_db():
     );
     """)
 
+    # Each exercise name is stored once and referenced by CatalogID
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS ExerciseCatalog (
+      CatalogID INTEGER PRIMARY KEY AUTOINCREMENT,
+      CanonicalName VARCHAR(50) UNIQUE NOT NULL,
+      DisplayName VARCHAR(50) NOT NULL
+    );
+    """)
+
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS Exercises (
       ExerciseID INTEGER PRIMARY KEY AUTOINCREMENT,
       UserID INTEGER,
-      ExerciseName VARCHAR(50),
+      CatalogID INTEGER,
       Weight DECIMAL(5,1),
       Sets INTEGER,
       Reps INTEGER,
       DatePerformed DATE NOT NULL,
-      FOREIGN KEY (UserID) REFERENCES User(UserID)
+      FOREIGN KEY (UserID) REFERENCES User(UserID),
+      FOREIGN KEY (CatalogID) REFERENCES ExerciseCatalog(CatalogID)
     );
     """)
 
+    # Databases from before the catalog still store the name on every row
+    migrate_exercise_names(cursor)
+
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS Sleep (
       SleepID INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -65,18 +86,166 @@ def initialise_db():
     );
     """)
 
+    # Each food is stored once and referenced by FoodItemID
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS FoodItem (
+      FoodItemID INTEGER PRIMARY KEY AUTOINCREMENT,
+      CanonicalName VARCHAR(50) UNIQUE NOT NULL,
+      DisplayName VARCHAR(50) NOT NULL,
+      DefaultCalories INTEGER
+    );
+    """)
+
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS Food (
       FoodID INTEGER PRIMARY KEY AUTOINCREMENT,
       UserID INTEGER,
-      FoodName VARCHAR(50),
+      FoodItemID INTEGER,
       Calories INTEGER,
       MealType VARCHAR(10),
       DateConsumed DATE,
+      FOREIGN KEY (UserID) REFERENCES User(UserID),
+      FOREIGN KEY (FoodItemID) REFERENCES FoodItem(FoodItemID)
+    );
+    """)
+
+    # Databases from before the catalog still store the name on every row
+    migrate_food_names(cursor)
+
+    # Precomputed lifetime totals and score, kept up to date by logic.score_engine
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS UserScore (
+      UserID INTEGER PRIMARY KEY,
+      LifetimeSteps INTEGER NOT NULL DEFAULT 0,
+      LifetimeSleepHours DECIMAL(8,1) NOT NULL DEFAULT 0,
+      LifetimeWeight DECIMAL(12,1) NOT NULL DEFAULT 0,
+      Score INTEGER NOT NULL DEFAULT 0,
+      RankName VARCHAR(20),
+      UpdatedOn DATE,
       FOREIGN KEY (UserID) REFERENCES User(UserID)
     );
     """)
 
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS ScoreHistory (
+      UserID INTEGER,
+      ScoreDate DATE,
+      Score INTEGER,
+      RankName VARCHAR(20),
+      PRIMARY KEY (UserID, ScoreDate),
+      FOREIGN KEY (UserID) REFERENCES User(UserID)
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS RankEvents (
+      EventID INTEGER PRIMARY KEY AUTOINCREMENT,
+      UserID INTEGER,
+      EventDate DATE,
+      OldRank VARCHAR(20),
+      NewRank VARCHAR(20),
+      Score INTEGER,
+      FOREIGN KEY (UserID) REFERENCES User(UserID)
+    );
+    """)
+
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_rankevents_user
+    ON RankEvents (UserID, EventID);
+    """)
+
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_userscore_score
+    ON UserScore (Score DESC, UserID);
+    """)
+
+    # Weekly step totals for the leaderboard, kept up to date by save_steps
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'WeeklySteps'")
+    weekly_steps_exists = cursor.fetchone() is not None
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS WeeklySteps (
+      UserID INTEGER,
+      WeekStart DATE,
+      Steps INTEGER NOT NULL DEFAULT 0,
+      PRIMARY KEY (UserID, WeekStart),
+      FOREIGN KEY (UserID) REFERENCES User(UserID)
+    );
+    """)
+
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_weeklysteps_week
+    ON WeeklySteps (WeekStart, Steps DESC, UserID);
+    """)
+
+    # Per user lookups by date, used by the 7 day graphs, streaks and totals for a day.
+    # SQLite ends every index with the rowid, so these also serve the (date, ID) keyset pages
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_steps_user_date ON Steps (UserID, Date);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_sleep_user_date ON Sleep (UserID, SleepDate);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_food_user_date ON Food (UserID, DateConsumed);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_exercises_user_date ON Exercises (UserID, DatePerformed);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_metrics_user_date ON MetricsTracking (UserID, MetricDate);")
+
+    # Consecutive day streaks, kept up to date by logic.streaks
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'Streaks'")
+    streaks_exist = cursor.fetchone() is not None
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS Streaks (
+      UserID INTEGER,
+      Metric VARCHAR(20),
+      CurrentStreak INTEGER NOT NULL DEFAULT 0,
+      LongestStreak INTEGER NOT NULL DEFAULT 0,
+      LastDate DATE,
+      PRIMARY KEY (UserID, Metric),
+      FOREIGN KEY (UserID) REFERENCES User(UserID)
+    );
+    """)
+
+    # Per exercise lookups for volume, one-rep max and personal records
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_exercises_user_catalog_date
+    ON Exercises (UserID, CatalogID, DatePerformed);
+    """)
+
+    # Best weight, estimated one-rep max and volume per exercise, kept up to date by save_workout
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ExercisePR'")
+    exercise_prs_exist = cursor.fetchone() is not None
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS ExercisePR (
+      UserID INTEGER,
+      CatalogID INTEGER,
+      BestWeight DECIMAL(5,1) NOT NULL DEFAULT 0,
+      BestWeightDate DATE,
+      BestOneRepMax DECIMAL(6,1) NOT NULL DEFAULT 0,
+      BestOneRepMaxDate DATE,
+      BestVolume DECIMAL(9,1) NOT NULL DEFAULT 0,
+      BestVolumeDate DATE,
+      PRIMARY KEY (UserID, CatalogID),
+      FOREIGN KEY (UserID) REFERENCES User(UserID),
+      FOREIGN KEY (CatalogID) REFERENCES ExerciseCatalog(CatalogID)
+    );
+    """)
+
+    # Hashed "remember me" tokens, see logic/sessions.py
+    create_session_table(cursor)
+
+    # Full-text search over food and exercise names, used to find past entries
+    create_search_tables(cursor)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_food_user_item_date
+    ON Food (UserID, FoodItemID, DateConsumed);
+    """)
+
+    backfill_all_scores(cursor)
+    if not weekly_steps_exists:
+        backfill_weekly_steps(cursor)
+    if not streaks_exist:
+        backfill_all_streaks(cursor)
+    if not exercise_prs_exist:
+        backfill_all_personal_records(cursor)
+
     connection.commit()
     connection.close()
 
@@ -0,0 +1,107 @@
+"""
+ReHealth - Record Exporter
+Writes users' histories to files without opening a window.
+
+Usage:
+    python export_records.py [USERNAME ...] [--all] [--history workouts sleep ...]
+                             [--format csv.gz] [--output DIR]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the current directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from db.db_handler import get_all_users  # noqa: E402
+from logic.exports import (  # noqa: E402
+    EXPORTS,
+    RECORD_FORMATS,
+    available_formats,
+    count_export_rows,
+    export_filename,
+    export_history,
+    metric_logs_folder,
+)
+
+
+def export_user(user: tuple[int, str], histories: list[str], file_format: str, output_dir: str) -> tuple[int, int]:
+    """
+    Writes the chosen histories of one user, skipping any with nothing recorded.
+
+    Args:
+        user: A (UserID, Username) tuple.
+        histories: Keys from EXPORTS.
+        file_format: Key from RECORD_FORMATS.
+        output_dir: Folder the files are written to.
+
+    Returns:
+        (records written, bytes written)
+    """
+    user_id, username = user
+    records = 0
+    size = 0
+
+    for history in histories:
+        count = count_export_rows(history, user_id)
+        if not count:
+            continue
+
+        filename = export_filename(history, username, file_format, output_dir)
+        export_history(history, user_id, username, filename, file_format=file_format)
+        records += count
+        size += os.path.getsize(filename)
+
+    return records, size
+
+
+def main() -> None:
+    """
+    Parses command line arguments and exports each user's records.
+    """
+    parser = argparse.ArgumentParser(description="Export ReHealth histories as text, CSV or JSON Lines.")
+    parser.add_argument("usernames", nargs="*", help="users to export")
+    parser.add_argument("--all", action="store_true", help="export every user")
+    parser.add_argument("--history", nargs="+", choices=list(EXPORTS), default=list(EXPORTS))
+    parser.add_argument("--format", choices=list(RECORD_FORMATS), default="csv", dest="file_format")
+    parser.add_argument("--output", default=None, help="folder to write to, defaults to metric_logs")
+    args = parser.parse_args()
+
+    if args.file_format not in available_formats():
+        print(f"Error: {args.file_format} needs the zstandard package (pip install zstandard)")
+        sys.exit(1)
+
+    users = get_all_users()
+    if not args.all:
+        wanted = set(args.usernames)
+        users = [user for user in users if user[1] in wanted]
+        missing = wanted - {username for _, username in users}
+        if missing:
+            print(f"Unknown username(s): {', '.join(sorted(missing))}")
+        if not users:
+            parser.error("give at least one existing username or --all")
+
+    output_dir = args.output or metric_logs_folder()
+    os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    total_records = 0
+    total_size = 0
+    for user in users:
+        records, size = export_user(user, args.history, args.file_format, output_dir)
+        total_records += records
+        total_size += size
+    elapsed = time.perf_counter() - start
+
+    rate = total_size / elapsed / 1_000_000 if elapsed else 0.0
+    print(f"Exported {total_records} records for {len(users)} user(s) to {output_dir} "
+          f"in {elapsed:.2f}s ({total_size / 1_000_000:.1f} MB, {rate:.1f} MB/s)")
+
+
+if __name__ == "__main__":
+    """
+    Ensures file will not be ran if imported to a different file
+    """
+    main()
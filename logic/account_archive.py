@@ -0,0 +1,334 @@
+"""
+Account_Archive Module - ReHealth
+
+Moves a user's whole account between installs as a single zip file holding a
+manifest and one JSON Lines file per table. Exporting reads every table in one
+read transaction so the archive is a consistent snapshot, streaming rows into
+the zip in batches. Importing inserts the rows in batches inside one write
+transaction under a new UserID, maps exercise and food names back to this
+install's catalogs and then rebuilds the tables derived from the history.
+"""
+
+import io
+import json
+import os
+import zipfile
+from datetime import datetime
+
+from db.db_handler import get_db_connection
+from logic.exercise_analytics import backfill_all_personal_records
+from logic.exercise_catalog import get_or_create_exercise
+from logic.exports import jsonl_lines, metric_logs_folder
+from logic.food_catalog import get_or_create_food_item
+from logic.leaderboard import backfill_weekly_steps
+from logic.score_engine import backfill_all_scores
+from logic.streaks import backfill_all_streaks
+from logic.validation import validate_username
+
+ARCHIVE_FORMAT = "rehealth-account"
+ARCHIVE_VERSION = 1
+ARCHIVE_BATCH_SIZE = 2000
+MANIFEST_MEMBER = "manifest.json"
+
+
+def _exercise_id(cursor, name: str, record: list) -> int:
+    """Returns this install's CatalogID for an archived exercise name."""
+    return get_or_create_exercise(cursor, name)
+
+
+def _food_item_id(cursor, name: str, record: list) -> int:
+    """Returns this install's FoodItemID for an archived food name, defaulting to its calories."""
+    return get_or_create_food_item(cursor, name, record[2])
+
+
+# Each archived table: archive member, columns, query for one user's rows in the order
+# they were logged, insert statement, and for tables referencing a catalog a function
+# returning the catalog ID of the name stored in the second column.
+# UserScore, WeeklySteps, Streaks and ExercisePR are rebuilt on import instead.
+ARCHIVE_TABLES = {
+    "MetricsTracking": (
+        "metrics.jsonl",
+        ["date", "height", "weight"],
+        "SELECT MetricDate, Height, Weight FROM MetricsTracking WHERE UserID = ? ORDER BY MetricID",
+        "INSERT INTO MetricsTracking (UserID, MetricDate, Height, Weight) VALUES (?, ?, ?, ?)",
+        None,
+    ),
+    "Steps": (
+        "steps.jsonl",
+        ["date", "step_count", "steps_goal"],
+        "SELECT Date, StepCount, StepsGoal FROM Steps WHERE UserID = ? ORDER BY StepID",
+        "INSERT INTO Steps (UserID, Date, StepCount, StepsGoal) VALUES (?, ?, ?, ?)",
+        None,
+    ),
+    "Sleep": (
+        "sleep.jsonl",
+        ["date", "sleep_rating", "sleep_duration"],
+        "SELECT SleepDate, SleepRating, SleepDuration FROM Sleep WHERE UserID = ? ORDER BY SleepID",
+        "INSERT INTO Sleep (UserID, SleepDate, SleepRating, SleepDuration) VALUES (?, ?, ?, ?)",
+        None,
+    ),
+    "Exercises": (
+        "exercises.jsonl",
+        ["date", "exercise", "weight", "sets", "reps"],
+        """
+        SELECT Exercises.DatePerformed, ExerciseCatalog.DisplayName,
+               Exercises.Weight, Exercises.Sets, Exercises.Reps
+        FROM Exercises
+        LEFT JOIN ExerciseCatalog ON ExerciseCatalog.CatalogID = Exercises.CatalogID
+        WHERE Exercises.UserID = ?
+        ORDER BY Exercises.ExerciseID
+        """,
+        "INSERT INTO Exercises (UserID, DatePerformed, CatalogID, Weight, Sets, Reps) VALUES (?, ?, ?, ?, ?, ?)",
+        _exercise_id,
+    ),
+    "Food": (
+        "food.jsonl",
+        ["date", "food", "calories", "meal_type"],
+        """
+        SELECT Food.DateConsumed, FoodItem.DisplayName, Food.Calories, Food.MealType
+        FROM Food
+        LEFT JOIN FoodItem ON FoodItem.FoodItemID = Food.FoodItemID
+        WHERE Food.UserID = ?
+        ORDER BY Food.FoodID
+        """,
+        "INSERT INTO Food (UserID, DateConsumed, FoodItemID, Calories, MealType) VALUES (?, ?, ?, ?, ?)",
+        _food_item_id,
+    ),
+    "ScoreHistory": (
+        "score_history.jsonl",
+        ["date", "score", "rank"],
+        "SELECT ScoreDate, Score, RankName FROM ScoreHistory WHERE UserID = ? ORDER BY ScoreDate",
+        "INSERT INTO ScoreHistory (UserID, ScoreDate, Score, RankName) VALUES (?, ?, ?, ?)",
+        None,
+    ),
+    "RankEvents": (
+        "rank_events.jsonl",
+        ["date", "old_rank", "new_rank", "score"],
+        "SELECT EventDate, OldRank, NewRank, Score FROM RankEvents WHERE UserID = ? ORDER BY EventID",
+        "INSERT INTO RankEvents (UserID, EventDate, OldRank, NewRank, Score) VALUES (?, ?, ?, ?, ?)",
+        None,
+    ),
+}
+
+
+def archive_filename(username: str, folder: str | None = None) -> str:
+    """
+    Returns the path a user's account archive is saved to today.
+
+    Args:
+        username: The user's username to include in the filename.
+        folder: Folder to write to, defaults to metric_logs.
+    """
+    return os.path.join(folder or metric_logs_folder(), f"{username}_account_{datetime.now():%d-%m-%Y}.zip")
+
+
+def export_account(user_id: int, filename: str, cancel_event=None, report_progress=None) -> str | None:
+    """
+    Writes every table of a user's account to a zip archive.
+
+    The archive is written next to its destination first and renamed into
+    place, so a cancelled or failed export never leaves a half written file.
+
+    Args:
+        user_id: The user's ID.
+        filename: Destination path.
+        cancel_event: Optional threading.Event checked before each batch.
+        report_progress: Optional function called with the fraction written after each batch.
+
+    Returns:
+        The saved filename, or None if the export was cancelled.
+
+    Raises:
+        ValueError: If there is no user with the ID.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+    temp_filename = f"{filename}.part"
+    try:
+        # Every table is read in one transaction so the archive is a single snapshot
+        cursor.execute("BEGIN")
+        cursor.execute("""
+            SELECT Username, Password, Sex, DateOfBirth, JoinDate
+            FROM User
+            WHERE UserID = ?
+        """, (user_id,))
+        account = cursor.fetchone()
+        if account is None:
+            raise ValueError(f"No user with ID {user_id}")
+
+        counts = {}
+        for table, (member, *_) in ARCHIVE_TABLES.items():
+            cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE UserID = ?", (user_id,))
+            counts[member] = cursor.fetchone()[0]
+        total = sum(counts.values())
+
+        manifest = {
+            "format": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "exported_on": datetime.now().isoformat(timespec="seconds"),
+            "account": dict(zip(["username", "password", "sex", "date_of_birth", "join_date"], account)),
+            "counts": counts,
+        }
+
+        with zipfile.ZipFile(temp_filename, "w", zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+            archive.writestr(MANIFEST_MEMBER, json.dumps(manifest, indent=2))
+
+            written = 0
+            for member, columns, select_query, _, _ in ARCHIVE_TABLES.values():
+                with io.TextIOWrapper(archive.open(member, "w"), encoding="utf-8", newline="") as file:
+                    cursor.execute(select_query, (user_id,))
+                    while True:
+                        if cancel_event is not None and cancel_event.is_set():
+                            return None
+
+                        rows = cursor.fetchmany(ARCHIVE_BATCH_SIZE)
+                        if not rows:
+                            break
+                        file.write(jsonl_lines(columns, rows))
+
+                        written += len(rows)
+                        if report_progress is not None and total:
+                            report_progress(written / total)
+
+        os.replace(temp_filename, filename)
+    finally:
+        connection.rollback()
+        connection.close()
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+
+    return filename
+
+
+def _read_manifest(archive: zipfile.ZipFile) -> dict:
+    """Reads and checks an open archive's manifest, raising ValueError if it is not an account archive."""
+    try:
+        manifest = json.loads(archive.read(MANIFEST_MEMBER))
+    except (KeyError, json.JSONDecodeError):
+        raise ValueError("This file is not a ReHealth account archive") from None
+
+    if manifest.get("format") != ARCHIVE_FORMAT:
+        raise ValueError("This file is not a ReHealth account archive")
+    if manifest.get("version", 0) > ARCHIVE_VERSION:
+        raise ValueError("This archive was made by a newer version of ReHealth")
+    return manifest
+
+
+def read_archive_manifest(filename: str) -> dict:
+    """
+    Returns an account archive's manifest without importing it.
+
+    Raises:
+        ValueError: If the file is not an account archive.
+    """
+    try:
+        with zipfile.ZipFile(filename) as archive:
+            return _read_manifest(archive)
+    except zipfile.BadZipFile:
+        raise ValueError("This file is not a ReHealth account archive") from None
+
+
+def _rebuild_derived_tables(cursor, user_id: int) -> None:
+    """Builds the imported user's score, weekly steps, streaks and personal records from their history."""
+    backfill_all_scores(cursor)
+    backfill_weekly_steps(cursor, user_id)
+    backfill_all_streaks(cursor, user_id)
+    backfill_all_personal_records(cursor, user_id)
+
+
+def import_account(filename: str, username: str | None = None,
+                   cancel_event=None, report_progress=None) -> int | None:
+    """
+    Creates a new account from an archive written by export_account.
+
+    Everything is inserted in one transaction, so a cancelled or failed import
+    leaves the database unchanged.
+
+    Args:
+        filename: Path of the archive.
+        username: Username for the new account, defaults to the archived one.
+        cancel_event: Optional threading.Event checked before each batch.
+        report_progress: Optional function called with the fraction imported after each batch.
+
+    Returns:
+        The new account's UserID, or None if the import was cancelled.
+
+    Raises:
+        ValueError: If the file is not an account archive or the username is invalid or taken.
+    """
+    try:
+        archive = zipfile.ZipFile(filename)
+    except zipfile.BadZipFile:
+        raise ValueError("This file is not a ReHealth account archive") from None
+
+    with archive:
+        manifest = _read_manifest(archive)
+        account = manifest["account"]
+        username = username or account["username"]
+
+        valid, message = validate_username(username)
+        if not valid:
+            raise ValueError(message)
+
+        total = sum(manifest.get("counts", {}).values())
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        try:
+            # The write lock is taken before checking the username so it cannot be registered meanwhile
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("SELECT 1 FROM User WHERE Username = ?", (username,))
+            if cursor.fetchone() is not None:
+                raise ValueError(f"The username {username} is already taken")
+
+            cursor.execute("""
+                INSERT INTO User (Username, Password, Sex, DateOfBirth, JoinDate)
+                VALUES (?, ?, ?, ?, ?)
+            """, (username, account["password"], account["sex"], account["date_of_birth"], account["join_date"]))
+            user_id = cursor.lastrowid
+
+            # Catalog IDs differ between installs, so names are looked up once each
+            catalog_ids = {}
+            imported = 0
+            for table, (member, columns, _, insert_query, resolve_name) in ARCHIVE_TABLES.items():
+                if member not in archive.namelist():
+                    continue
+
+                with io.TextIOWrapper(archive.open(member), encoding="utf-8") as file:
+                    batch = []
+                    for line in file:
+                        record = json.loads(line)
+                        values = [record.get(column) for column in columns]
+
+                        if resolve_name is not None and values[1] is not None:
+                            key = (table, values[1])
+                            if key not in catalog_ids:
+                                catalog_ids[key] = resolve_name(cursor, values[1], values)
+                            values[1] = catalog_ids[key]
+                        batch.append((user_id, *values))
+
+                        if len(batch) < ARCHIVE_BATCH_SIZE:
+                            continue
+                        if cancel_event is not None and cancel_event.is_set():
+                            connection.rollback()
+                            return None
+
+                        cursor.executemany(insert_query, batch)
+                        imported += len(batch)
+                        batch = []
+                        if report_progress is not None and total:
+                            report_progress(min(imported / total, 1.0))
+
+                    cursor.executemany(insert_query, batch)
+                    imported += len(batch)
+
+            _rebuild_derived_tables(cursor, user_id)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+    if report_progress is not None:
+        report_progress(1.0)
+    return user_id
@@ -1,5 +1,7 @@
 """Calculations Module - ReHealth"""
 
+import numpy as np
+
 
 def bmi_calc(kg_weight: float, cm_height: float) -> float:
     """
@@ -165,3 +167,147 @@ def get_rehealth_level(score: int) -> str:
         return "Olympian"
     else:
         return "#1 ReHealth User"
+
+
+def epley_one_rep_max(weight: float, reps: int) -> float:
+    """
+    Estimates a one-rep max with the Epley formula.
+
+    Args:
+        weight (float): Weight lifted in kg.
+        reps (int): Reps performed with that weight.
+
+    Returns:
+        float: Estimated one-rep max in kg.
+    """
+    if reps == 1:
+        return float(weight)
+    return float(weight) * (1 + reps / 30)
+
+
+def brzycki_one_rep_max(weight: float, reps: int) -> float:
+    """
+    Estimates a one-rep max with the Brzycki formula.
+    Only meaningful below 37 reps, where the formula's denominator reaches zero.
+
+    Args:
+        weight (float): Weight lifted in kg.
+        reps (int): Reps performed with that weight.
+
+    Returns:
+        float: Estimated one-rep max in kg.
+    """
+    return float(weight) * 36 / (37 - reps)
+
+
+def estimated_one_rep_max(weight: float, reps: int) -> float:
+    """
+    Estimates a one-rep max, using Brzycki for sets of up to 10 reps
+    and Epley for longer sets, where Brzycki overestimates.
+
+    Args:
+        weight (float): Weight lifted in kg.
+        reps (int): Reps performed with that weight.
+
+    Returns:
+        float: Estimated one-rep max in kg rounded to 1 decimal place.
+    """
+    if reps <= 10:
+        return round(brzycki_one_rep_max(weight, reps), 1)
+    return round(epley_one_rep_max(weight, reps), 1)
+
+
+def _round_array(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Rounds every value exactly as Python's round() would.
+
+    np.round scales by 10 ** ndigits before rounding, which can tip values
+    lying next to a halfway point the wrong way. Those few values are
+    re-rounded with round() so the array results match the scalar functions.
+    """
+    rounded = np.round(values, ndigits)
+    scaled = values * 10 ** ndigits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(value, ndigits) for value in values[near_tie].tolist()]
+    return rounded
+
+
+def bmi_calc_array(kg_weights, cm_heights) -> np.ndarray:
+    """
+    Array version of bmi_calc.
+
+    Args:
+        kg_weights: The users' weights.
+        cm_heights: The users' heights.
+
+    Returns:
+        np.ndarray: Each user's bmi value.
+    """
+    m_heights = np.asarray(cm_heights, dtype=float) / 100
+
+    return _round_array(np.asarray(kg_weights, dtype=float) / (m_heights ** 2), 1)
+
+
+def sleep_calc_array(sleep_durations, sleep_qualities) -> np.ndarray:
+    """
+    Array version of sleep_calc.
+
+    Args:
+        sleep_durations: Hours slept for each night.
+        sleep_qualities: Subjective sleep rating logged for each night.
+
+    Returns:
+        np.ndarray: Sleep ratings ranging from 0 to 1.
+    """
+    durations = np.asarray(sleep_durations, dtype=float)
+    qualities = np.asarray(sleep_qualities, dtype=float)
+
+    duration_scores = np.select(
+        [durations < 7, durations <= 9],
+        [durations / 7.0, 1.0],
+        np.maximum(0.7, 1.0 - (durations - 9) * 0.1)
+    )
+    quality_scores = qualities / 5.0
+
+    sleep_ratings = (duration_scores * 0.6) + (quality_scores * 0.4)
+
+    return np.where(durations < 1, 0.0, sleep_ratings)
+
+
+def bmi_status_array(bmis) -> np.ndarray:
+    """
+    Array version of bmi_status.
+
+    Args:
+        bmis: The users' bmi values.
+
+    Returns:
+        np.ndarray: Underweight, Healthy, Overweight or Obese for each bmi.
+    """
+    bmis = np.asarray(bmis, dtype=float)
+
+    # Index 0-3 for how many of the 18.5, 25 and 30 boundaries each bmi has reached
+    categories = np.searchsorted([18.5, 25, 30], bmis, side="right")
+
+    return np.array(["Underweight", "Healthy", "Overweight", "Obese"])[categories]
+
+
+def calories_burnt_array(steps, weights_kg) -> np.ndarray:
+    """
+    Array version of calories_burnt.
+
+    Args:
+        steps: Number of steps taken for each entry.
+        weights_kg: The user's weight for each entry (0.0 if unknown).
+
+    Returns:
+        np.ndarray: Estimated calories burnt rounded.
+    """
+    distances_m = np.asarray(steps, dtype=float) * 0.78
+    distances_km = distances_m / 1000
+    weights_kg = np.asarray(weights_kg, dtype=float)
+
+    calories = np.where(weights_kg == 0.0, distances_km * 50, weights_kg * distances_km)
+
+    return _round_array(calories, 2)
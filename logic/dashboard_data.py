@@ -2,7 +2,11 @@
 Dashboard_Data Module - ReHealth
 """
 
+from datetime import date
+
 from db.db_handler import get_db_connection
+from logic.calculations import bmi_calc
+from logic.streaks import current_streak
 
 
 def get_steps(user_id: int) -> int:
@@ -74,3 +78,66 @@ def get_sleep(user_id: int) -> int:
     connection.close()
     return result[0] if result and result[0] else 0
 
+
+def get_dashboard_snapshot(user_id: int, day: date | None = None) -> dict:
+    """
+    Fetch everything the dashboard shows in a single query on one connection.
+
+    Args:
+        user_id (int): The user's ID.
+        day (date): The day to report on, defaults to today.
+
+    Returns: A dictionary with the day's "steps", "calories" and "sleep" rating,
+        the latest "weight", "height" and "bmi", and the current "logging_streak",
+        "steps_goal_streak" and "sleep_target_streak" in days.
+
+    Raises: DatabaseError: If a database error occurs.
+    """
+    day = day or date.today()
+
+    connection = get_db_connection()
+    cursor = connection.cursor()
+    cursor.execute(
+        """
+        WITH latest_metrics AS (
+            SELECT Height, Weight
+            FROM MetricsTracking
+            WHERE UserID = :user_id
+            ORDER BY MetricDate DESC, MetricID DESC
+            LIMIT 1
+        )
+        SELECT
+            (SELECT SUM(StepCount) FROM Steps WHERE UserID = :user_id AND Date = :day),
+            (SELECT SUM(Calories) FROM Food WHERE UserID = :user_id AND DateConsumed = :day),
+            (SELECT SleepRating FROM Sleep WHERE UserID = :user_id AND SleepDate = :day LIMIT 1),
+            (SELECT Weight FROM latest_metrics),
+            (SELECT Height FROM latest_metrics),
+            (SELECT CurrentStreak FROM Streaks WHERE UserID = :user_id AND Metric = 'logging'),
+            (SELECT LastDate FROM Streaks WHERE UserID = :user_id AND Metric = 'logging'),
+            (SELECT CurrentStreak FROM Streaks WHERE UserID = :user_id AND Metric = 'steps_goal'),
+            (SELECT LastDate FROM Streaks WHERE UserID = :user_id AND Metric = 'steps_goal'),
+            (SELECT CurrentStreak FROM Streaks WHERE UserID = :user_id AND Metric = 'sleep_target'),
+            (SELECT LastDate FROM Streaks WHERE UserID = :user_id AND Metric = 'sleep_target')
+        """,
+        {"user_id": user_id, "day": day.isoformat()}
+    )
+    (steps, calories, sleep, weight, height,
+     logging_streak, logging_date, steps_streak, steps_date, sleep_streak, sleep_date) = cursor.fetchone()
+    connection.close()
+
+    # Return zero for anything the user has not logged
+    weight = float(weight) if weight is not None else 0.0
+    height = float(height) if height is not None else 0.0
+    bmi = bmi_calc(weight, height) if weight and height else 0.0
+
+    return {
+        "steps": steps or 0,
+        "calories": calories or 0,
+        "sleep": sleep or 0,
+        "weight": weight,
+        "height": height,
+        "bmi": bmi,
+        "logging_streak": current_streak(logging_streak or 0, logging_date, day),
+        "steps_goal_streak": current_streak(steps_streak or 0, steps_date, day),
+        "sleep_target_streak": current_streak(sleep_streak or 0, sleep_date, day),
+    }
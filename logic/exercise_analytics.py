@@ -0,0 +1,239 @@
+"""
+Exercise_Analytics Module - ReHealth
+
+Per-exercise volume, estimated one-rep max and personal records. Every query
+filters on (UserID, CatalogID, DatePerformed) so it is served by
+idx_exercises_user_catalog_date, and personal records are kept in the
+ExercisePR table so a new one is spotted without rescanning the history.
+"""
+
+from datetime import date
+from itertools import groupby
+
+from db.db_handler import get_db_connection
+from logic.calculations import estimated_one_rep_max
+from logic.exercise_catalog import canonical_exercise_name
+
+# Names shown to the user for each kind of personal record
+PR_HEAVIEST_WEIGHT = "Heaviest Weight"
+PR_ONE_REP_MAX = "Estimated 1RM"
+PR_VOLUME = "Best Volume"
+
+
+def _best_records(rows) -> tuple:
+    """
+    Finds the best weight, estimated one-rep max and volume in a set of entries.
+
+    Args:
+        rows: (Weight, Sets, Reps, DatePerformed) tuples, oldest first.
+
+    Returns:
+        (weight, weight_date, one_rep_max, one_rep_max_date, volume, volume_date).
+        The earliest date is kept when a record was matched later on.
+    """
+    best = [0.0, None, 0.0, None, 0.0, None]
+    for weight, sets, reps, day in rows:
+        weight = float(weight)
+        one_rep_max = estimated_one_rep_max(weight, reps)
+        volume = weight * sets * reps
+
+        if weight > best[0]:
+            best[0:2] = weight, day
+        if one_rep_max > best[2]:
+            best[2:4] = one_rep_max, day
+        if volume > best[4]:
+            best[4:6] = volume, day
+    return tuple(best)
+
+
+def _insert_records(cursor, user_id: int, catalog_id: int, best: tuple) -> None:
+    """Stores the best records found for one of the user's exercises."""
+    cursor.execute("""
+        INSERT OR IGNORE INTO ExercisePR (
+            UserID, CatalogID,
+            BestWeight, BestWeightDate,
+            BestOneRepMax, BestOneRepMaxDate,
+            BestVolume, BestVolumeDate
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, (user_id, catalog_id, *best))
+
+
+def record_personal_records(cursor, user_id: int, catalog_id: int, weight: float,
+                            sets: int, reps: int, day: date | None = None) -> list[str]:
+    """
+    Compares a new entry against the user's stored records for the exercise.
+
+    Must be called before the Exercises row is inserted, in the same transaction,
+    so an exercise without stored records can be backfilled from its history
+    without counting the new entry.
+
+    Args:
+        cursor: Cursor of the connection saving the entry.
+        user_id: The user's ID.
+        catalog_id: The exercise's CatalogID.
+        weight: Weight lifted in kg.
+        sets: Number of sets performed.
+        reps: Number of reps performed.
+        day: Day the exercise was performed, defaults to today.
+
+    Returns:
+        The names of the records the entry beat. An exercise logged for the
+        first time sets its records without counting as beating them.
+    """
+    day = day or date.today()
+
+    cursor.execute("""
+        SELECT BestWeight, BestOneRepMax, BestVolume
+        FROM ExercisePR
+        WHERE UserID = ? AND CatalogID = ?
+    """, (user_id, catalog_id))
+    stored = cursor.fetchone()
+
+    if stored is None:
+        cursor.execute("""
+            SELECT Weight, Sets, Reps, DatePerformed
+            FROM Exercises
+            WHERE UserID = ? AND CatalogID = ?
+            ORDER BY DatePerformed ASC, ExerciseID ASC
+        """, (user_id, catalog_id))
+        history = cursor.fetchall()
+
+        if not history:
+            _insert_records(cursor, user_id, catalog_id, _best_records([(weight, sets, reps, day)]))
+            return []
+
+        best = _best_records(history)
+        _insert_records(cursor, user_id, catalog_id, best)
+        stored = best[0], best[2], best[4]
+
+    best_weight, best_one_rep_max, best_volume = (float(value) for value in stored)
+    weight = float(weight)
+    one_rep_max = estimated_one_rep_max(weight, reps)
+    volume = weight * sets * reps
+
+    broken = []
+    if weight > best_weight:
+        broken.append(PR_HEAVIEST_WEIGHT)
+        cursor.execute("""
+            UPDATE ExercisePR SET BestWeight = ?, BestWeightDate = ?
+            WHERE UserID = ? AND CatalogID = ?
+        """, (weight, day, user_id, catalog_id))
+    if one_rep_max > best_one_rep_max:
+        broken.append(PR_ONE_REP_MAX)
+        cursor.execute("""
+            UPDATE ExercisePR SET BestOneRepMax = ?, BestOneRepMaxDate = ?
+            WHERE UserID = ? AND CatalogID = ?
+        """, (one_rep_max, day, user_id, catalog_id))
+    if volume > best_volume:
+        broken.append(PR_VOLUME)
+        cursor.execute("""
+            UPDATE ExercisePR SET BestVolume = ?, BestVolumeDate = ?
+            WHERE UserID = ? AND CatalogID = ?
+        """, (volume, day, user_id, catalog_id))
+
+    return broken
+
+
+def backfill_all_personal_records(cursor, user_id: int | None = None) -> None:
+    """
+    Creates personal records for every user's exercises, or one user's, in a single ordered pass.
+    Exercises that already have records are left untouched.
+    """
+    user_filter, params = ("AND UserID = ?", (user_id,)) if user_id is not None else ("", ())
+
+    cursor.execute(f"""
+        SELECT UserID, CatalogID, Weight, Sets, Reps, DatePerformed
+        FROM Exercises
+        WHERE CatalogID IS NOT NULL {user_filter}
+        ORDER BY UserID, CatalogID, DatePerformed, ExerciseID
+    """, params)
+    rows = cursor.fetchall()
+
+    for (user_id, catalog_id), entries in groupby(rows, key=lambda row: row[:2]):
+        best = _best_records(entry[2:] for entry in entries)
+        _insert_records(cursor, user_id, catalog_id, best)
+
+
+def get_exercise_names(user_id: int) -> list[str]:
+    """
+    Fetches the names of every exercise the user has logged, alphabetically.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute("""
+        SELECT ExerciseCatalog.DisplayName
+        FROM ExerciseCatalog
+        WHERE ExerciseCatalog.CatalogID IN (SELECT CatalogID FROM Exercises WHERE UserID = ?)
+        ORDER BY ExerciseCatalog.CanonicalName ASC
+    """, (user_id,))
+
+    names = [name for (name,) in cursor.fetchall()]
+    connection.close()
+    return names
+
+
+def get_exercise_volume(user_id: int, exercise_name: str,
+                        start: date | None = None, end: date | None = None) -> list[tuple]:
+    """
+    Builds the day by day history of one exercise.
+
+    Args:
+        user_id: The user's ID.
+        exercise_name: Name of the exercise, in any spelling variant.
+        start: First day to include, defaults to the first day logged.
+        end: Last day to include, defaults to the last day logged.
+
+    Returns:
+        A list of (DatePerformed, volume, best estimated one-rep max) tuples, oldest first.
+        Volume is the day's total weight * sets * reps.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute("""
+        SELECT DatePerformed, Weight, Sets, Reps
+        FROM Exercises
+        WHERE UserID = ?
+          AND CatalogID = (SELECT CatalogID FROM ExerciseCatalog WHERE CanonicalName = ?)
+          AND DatePerformed >= ? AND DatePerformed <= ?
+        ORDER BY DatePerformed ASC
+    """, (user_id, canonical_exercise_name(exercise_name), start or date.min, end or date.max))
+
+    rows = cursor.fetchall()
+    connection.close()
+
+    history = []
+    for day, entries in groupby(rows, key=lambda row: row[0]):
+        volume = 0.0
+        best_one_rep_max = 0.0
+        for _, weight, sets, reps in entries:
+            volume += float(weight) * sets * reps
+            best_one_rep_max = max(best_one_rep_max, estimated_one_rep_max(weight, reps))
+        history.append((day, round(volume, 1), best_one_rep_max))
+    return history
+
+
+def get_personal_records(user_id: int) -> list[tuple]:
+    """
+    Fetches the user's stored records for every exercise.
+
+    Returns:
+        A list of (exercise name, BestWeight, BestOneRepMax, BestVolume) tuples, alphabetically.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute("""
+        SELECT ExerciseCatalog.DisplayName, ExercisePR.BestWeight,
+               ExercisePR.BestOneRepMax, ExercisePR.BestVolume
+        FROM ExercisePR
+        JOIN ExerciseCatalog ON ExerciseCatalog.CatalogID = ExercisePR.CatalogID
+        WHERE ExercisePR.UserID = ?
+        ORDER BY ExerciseCatalog.CanonicalName ASC
+    """, (user_id,))
+
+    records = cursor.fetchall()
+    connection.close()
+    return records
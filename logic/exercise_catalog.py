@@ -0,0 +1,130 @@
+"""
+Exercise_Catalog Module - ReHealth
+
+Stores each exercise name once in ExerciseCatalog so workouts reference it by
+an integer ID, and spelling variants such as "Bench Press" and "bench  press"
+are grouped as the same exercise.
+"""
+
+from db.db_handler import get_db_connection
+from logic.prefix_index import PrefixIndex
+
+
+def canonical_exercise_name(exercise_name: str) -> str:
+    """
+    Returns the form an exercise name is matched by: lowercase with single spaces.
+    """
+    return " ".join(exercise_name.split()).lower()
+
+
+def display_exercise_name(exercise_name: str) -> str:
+    """
+    Returns the form an exercise name is shown in: as typed, with single spaces.
+    Changing the case would garble names such as "RDL" or "Farmer's Walk".
+    """
+    return " ".join(exercise_name.split())
+
+
+def get_or_create_exercise(cursor, exercise_name: str) -> int:
+    """
+    Looks up an exercise's CatalogID, adding it to the catalog if it is new.
+    Names are matched on their canonical form, so the first spelling seen is the one shown.
+
+    Args:
+        cursor: Cursor of the connection saving the workout.
+        exercise_name: Exercise name as typed by the user.
+
+    Returns:
+        The exercise's CatalogID.
+    """
+    canonical_name = canonical_exercise_name(exercise_name)
+
+    cursor.execute("SELECT CatalogID FROM ExerciseCatalog WHERE CanonicalName = ?", (canonical_name,))
+    result = cursor.fetchone()
+    if result is not None:
+        return result[0]
+
+    cursor.execute("""
+        INSERT INTO ExerciseCatalog (CanonicalName, DisplayName)
+        VALUES (?, ?)
+    """, (canonical_name, display_exercise_name(exercise_name)))
+    return cursor.lastrowid
+
+
+def migrate_exercise_names(cursor) -> None:
+    """
+    Moves Exercises from a free text ExerciseName column to a CatalogID
+    referencing ExerciseCatalog, rebuilding the table since SQLite cannot
+    drop a column that is used by an index.
+
+    Does nothing if the table has already been migrated.
+    """
+    cursor.execute("SELECT name FROM pragma_table_info('Exercises')")
+    if "ExerciseName" not in {column for (column,) in cursor.fetchall()}:
+        return
+
+    # Python handles the canonical form so it matches get_or_create_exercise exactly.
+    # Oldest first, so each exercise is shown with the spelling it was first logged with
+    cursor.execute("""
+        SELECT ExerciseName FROM Exercises
+        WHERE ExerciseName IS NOT NULL
+        GROUP BY ExerciseName
+        ORDER BY MIN(ExerciseID)
+    """)
+    name_ids = [(name, get_or_create_exercise(cursor, name)) for (name,) in cursor.fetchall()]
+
+    cursor.execute("""
+    CREATE TABLE Exercises_migrated (
+      ExerciseID INTEGER PRIMARY KEY AUTOINCREMENT,
+      UserID INTEGER,
+      CatalogID INTEGER,
+      Weight DECIMAL(5,1),
+      Sets INTEGER,
+      Reps INTEGER,
+      DatePerformed DATE NOT NULL,
+      FOREIGN KEY (UserID) REFERENCES User(UserID),
+      FOREIGN KEY (CatalogID) REFERENCES ExerciseCatalog(CatalogID)
+    );
+    """)
+
+    cursor.execute("CREATE TEMP TABLE ExerciseNameMap (ExerciseName VARCHAR(50) PRIMARY KEY, CatalogID INTEGER)")
+    cursor.executemany("INSERT INTO ExerciseNameMap (ExerciseName, CatalogID) VALUES (?, ?)", name_ids)
+
+    cursor.execute("""
+        INSERT INTO Exercises_migrated (ExerciseID, UserID, CatalogID, Weight, Sets, Reps, DatePerformed)
+        SELECT Exercises.ExerciseID, Exercises.UserID, ExerciseNameMap.CatalogID,
+               Exercises.Weight, Exercises.Sets, Exercises.Reps, Exercises.DatePerformed
+        FROM Exercises
+        LEFT JOIN ExerciseNameMap ON ExerciseNameMap.ExerciseName = Exercises.ExerciseName
+    """)
+
+    cursor.execute("DROP TABLE ExerciseNameMap")
+    cursor.execute("DROP TABLE Exercises")
+    cursor.execute("ALTER TABLE Exercises_migrated RENAME TO Exercises")
+
+    # Records keyed by the old names are rebuilt from the migrated rows
+    cursor.execute("DROP TABLE IF EXISTS ExercisePR")
+
+
+def get_exercise_catalog() -> list[tuple]:
+    """
+    Fetches every exercise in the catalog.
+
+    Returns:
+        A list of (CatalogID, DisplayName) tuples, alphabetically.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute("SELECT CatalogID, DisplayName FROM ExerciseCatalog ORDER BY CanonicalName ASC")
+
+    catalog = cursor.fetchall()
+    connection.close()
+    return catalog
+
+
+def build_exercise_index() -> PrefixIndex:
+    """
+    Loads every exercise name into a PrefixIndex for autocomplete.
+    """
+    return PrefixIndex(display_name for _, display_name in get_exercise_catalog())
@@ -0,0 +1,300 @@
+"""
+Exports Module - ReHealth
+
+Writes a user's history to a file without holding it all in memory. Rows are
+read a page at a time through the keyset paginated db_handler functions and
+written one chunk per page, with progress reported and cancellation checked
+between chunks, so exports can run on a worker thread while a progress dialog
+stays responsive.
+
+Every history can be written as the readable text log, as CSV or as JSON Lines,
+and the structured formats can be gzip or zstd compressed. zstd needs the
+optional zstandard package and is only offered when it is installed.
+"""
+
+import csv
+import gzip
+import importlib.util
+import io
+import json
+import os
+from datetime import datetime
+
+from db.db_handler import (
+    count_food,
+    count_metrics,
+    count_sleep,
+    count_steps,
+    count_workouts,
+    get_food_page,
+    get_metrics_page,
+    get_sleep_page,
+    get_steps_page,
+    get_workouts_page,
+    iter_pages,
+)
+from logic.calculations import bmi_calc_array, bmi_status_array
+
+EXPORT_PAGE_SIZE = 1000
+EXPORT_BUFFER_SIZE = 1 << 20
+SEPARATOR = "-" * 60
+
+# Each format: how records are written, compression applied to the file
+RECORD_FORMATS = {
+    "txt": ("txt", None),
+    "csv": ("csv", None),
+    "jsonl": ("jsonl", None),
+    "csv.gz": ("csv", "gz"),
+    "jsonl.gz": ("jsonl", "gz"),
+    "csv.zst": ("csv", "zst"),
+    "jsonl.zst": ("jsonl", "zst"),
+}
+
+
+def metric_logs_folder() -> str:
+    """
+    Create (if needed) and return the absolute path to metric_logs.
+    """
+    directory = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "metric_logs"))
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def zstd_available() -> bool:
+    """Returns True if the optional zstandard package can be imported."""
+    return importlib.util.find_spec("zstandard") is not None
+
+
+def available_formats() -> list[str]:
+    """Returns the keys of RECORD_FORMATS that can be written with the installed packages."""
+    has_zstd = zstd_available()
+    return [
+        file_format for file_format, (_, compression) in RECORD_FORMATS.items()
+        if compression != "zst" or has_zstd
+    ]
+
+
+def _measurement_records(rows: list[tuple]) -> list[tuple]:
+    """Adds the BMI and its status to (date, height, weight) rows, calculating each chunk at once."""
+    bmis = bmi_calc_array([weight for _, _, weight in rows], [height for _, height, _ in rows])
+    statuses = bmi_status_array(bmis).tolist()
+    return [(*row, bmi, status) for row, bmi, status in zip(rows, bmis.tolist(), statuses)]
+
+
+def _format_workouts(records: list[tuple]) -> str:
+    """Formats (date, name, weight, sets, reps) records as text."""
+    return "".join(
+        f"Date: {day}\n"
+        f"Exercise: {exercise_name}\n"
+        f"Weight: {weight} kg\n"
+        f"Sets: {sets}\n"
+        f"Reps: {reps}\n"
+        f"{SEPARATOR}\n"
+        for day, exercise_name, weight, sets, reps in records
+    )
+
+
+def _format_measurements(records: list[tuple]) -> str:
+    """Formats (date, height, weight, bmi, status) records as text."""
+    return "".join(
+        f"Date: {day}\n"
+        f"Height: {height} cm\n"
+        f"Weight: {weight} kg\n"
+        f"BMI: {bmi} ({status})\n"
+        f"{SEPARATOR}\n"
+        for day, height, weight, bmi, status in records
+    )
+
+
+def _format_steps(records: list[tuple]) -> str:
+    """Formats (date, step count, steps goal) records as text."""
+    return "".join(
+        f"Date: {day}\n"
+        f"Steps: {steps}\n"
+        f"Goal: {goal}\n"
+        f"{SEPARATOR}\n"
+        for day, steps, goal in records
+    )
+
+
+def _format_sleep(records: list[tuple]) -> str:
+    """Formats (date, hours slept, rating) records as text."""
+    return "".join(
+        f"Date: {day}\n"
+        f"Hours Slept: {hours}\n"
+        f"Rating: {rating}\n"
+        f"{SEPARATOR}\n"
+        for day, hours, rating in records
+    )
+
+
+def _format_food(records: list[tuple]) -> str:
+    """Formats (date, food name, calories, meal type) records as text."""
+    return "".join(
+        f"Date: {day}\n"
+        f"Food: {food_name}\n"
+        f"Calories: {calories} kcal\n"
+        f"Meal: {meal_type}\n"
+        f"{SEPARATOR}\n"
+        for day, food_name, calories, meal_type in records
+    )
+
+
+# Each history: title, filename stem, columns, page function, count function,
+# function turning a page of rows into records (or None), text formatter
+EXPORTS = {
+    "workouts": (
+        "Workout Records",
+        "{username}_workout_log_{day:%d-%m-%y}",
+        ["date", "exercise", "weight_kg", "sets", "reps"],
+        get_workouts_page,
+        count_workouts,
+        None,
+        _format_workouts,
+    ),
+    "measurements": (
+        "Measurement Records",
+        "{username}_metric_log_{day:%d-%m-%Y}",
+        ["date", "height_cm", "weight_kg", "bmi", "bmi_status"],
+        get_metrics_page,
+        count_metrics,
+        _measurement_records,
+        _format_measurements,
+    ),
+    "steps": (
+        "Step Records",
+        "{username}_steps_log_{day:%d-%m-%Y}",
+        ["date", "steps", "steps_goal"],
+        get_steps_page,
+        count_steps,
+        None,
+        _format_steps,
+    ),
+    "sleep": (
+        "Sleep Records",
+        "{username}_sleep_log_{day:%d-%m-%Y}",
+        ["date", "hours_slept", "sleep_rating"],
+        get_sleep_page,
+        count_sleep,
+        None,
+        _format_sleep,
+    ),
+    "food": (
+        "Food Records",
+        "{username}_food_log_{day:%d-%m-%Y}",
+        ["date", "food", "calories", "meal_type"],
+        get_food_page,
+        count_food,
+        None,
+        _format_food,
+    ),
+}
+
+
+def export_filename(history: str, username: str, file_format: str = "txt", folder: str | None = None) -> str:
+    """
+    Returns the path a history is downloaded to today.
+
+    Args:
+        history: Key from EXPORTS.
+        username: The user's username to include in the filename.
+        file_format: Key from RECORD_FORMATS, used as the file extension.
+        folder: Folder to write to, defaults to metric_logs.
+    """
+    stem = EXPORTS[history][1].format(username=username, day=datetime.now())
+    return os.path.join(folder or metric_logs_folder(), f"{stem}.{file_format}")
+
+
+def count_export_rows(history: str, user_id: int) -> int:
+    """Returns how many records an export of the history would contain."""
+    return EXPORTS[history][4](user_id)
+
+
+def _open_export(filename: str, compression: str | None, newline: str | None):
+    """
+    Opens a buffered text stream writing to filename through the chosen compression.
+
+    Raises:
+        RuntimeError: If zstd is requested without the zstandard package installed.
+    """
+    if compression == "gz":
+        return gzip.open(filename, "wt", encoding="utf-8", newline=newline, compresslevel=6)
+
+    if compression == "zst":
+        if not zstd_available():
+            raise RuntimeError("zstd exports need the zstandard package (pip install zstandard)")
+        # Imported here as zstandard is optional
+        import zstandard
+
+        raw_file = open(filename, "wb")
+        writer = zstandard.ZstdCompressor(level=3).stream_writer(raw_file)
+        return io.TextIOWrapper(writer, encoding="utf-8", newline=newline)
+
+    return open(filename, "w", encoding="utf-8", newline=newline, buffering=EXPORT_BUFFER_SIZE)
+
+
+def jsonl_lines(columns: list[str], records: list[tuple]) -> str:
+    """Formats records as one JSON object per line."""
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str).encode
+    return "".join(encode(dict(zip(columns, record))) + "\n" for record in records)
+
+
+def export_history(history: str, user_id: int, username: str, filename: str,
+                   cancel_event=None, report_progress=None, file_format: str = "txt") -> str | None:
+    """
+    Writes a user's history to a file, one page of records at a time.
+
+    The file is written next to its destination first and renamed into place,
+    so a cancelled or failed export never leaves a half written file behind.
+
+    Args:
+        history: Key from EXPORTS.
+        user_id: The user's ID.
+        username: The user's username for the title of text files.
+        filename: Destination path.
+        cancel_event: Optional threading.Event checked before each chunk is written.
+        report_progress: Optional function called with the fraction written after each chunk.
+        file_format: Key from RECORD_FORMATS.
+
+    Returns:
+        The saved filename, or None if the export was cancelled.
+    """
+    title, _, columns, get_page, count_rows, to_records, format_text = EXPORTS[history]
+    writer_kind, compression = RECORD_FORMATS[file_format]
+    total = count_rows(user_id)
+
+    temp_filename = f"{filename}.part"
+    try:
+        with _open_export(temp_filename, compression, None if writer_kind == "txt" else "") as file:
+            if writer_kind == "txt":
+                file.write(f"{title} for {username}\n")
+                file.write(f"Downloaded on: {datetime.now().strftime('%d-%m-%Y %H:%M')}\n")
+                file.write("=" * 60 + "\n\n")
+            elif writer_kind == "csv":
+                csv_writer = csv.writer(file)
+                csv_writer.writerow(columns)
+
+            written = 0
+            for rows in iter_pages(get_page, user_id, EXPORT_PAGE_SIZE):
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+
+                if rows:
+                    records = to_records(rows) if to_records else rows
+                    if writer_kind == "txt":
+                        file.write(format_text(records))
+                    elif writer_kind == "csv":
+                        csv_writer.writerows(records)
+                    else:
+                        file.write(jsonl_lines(columns, records))
+                written += len(rows)
+
+                if report_progress is not None and total:
+                    report_progress(min(written / total, 1.0))
+
+        os.replace(temp_filename, filename)
+    finally:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+
+    return filename
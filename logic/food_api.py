@@ -1,10 +1,36 @@
 """
+Food_API Module - ReHealth
+
+Online calorie lookups through the Spoonacular API, for foods missing from the
+offline nutrition database. Nothing is requested at import time. Lookups share
+one pooled HTTP session, responses are cached on disk for CACHE_TTL_SECONDS,
+identical lookups in flight at the same time make a single request, and
+background lookups run on a bounded thread pool.
+
 USE OPEN FOOD FACTS INSTEAD
 """
 
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-api_key = "b00818ea914348ce8d881f52088d0e53"
+# Both can be overridden, e.g. to point the client at a local stub server
+API_KEY = os.environ.get("SPOONACULAR_API_KEY", "b00818ea914348ce8d881f52088d0e53")
+API_URL = os.environ.get("FOOD_API_URL", "https://api.spoonacular.com")
+
+CACHE_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "db", "food_api_cache.db")
+)
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+REQUEST_TIMEOUT_SECONDS = 5
+MAX_WORKERS = 4
 
 
 class Consumable:
@@ -32,30 +58,253 @@ class Drink(Consumable):
         self.volume_ml = volume_ml
 
 
+def parse_food_response(data):
+    """
+    Picks the name and calories of the first result in a search response.
+
+    Returns:
+        {"name": ..., "calories": ...}, or None if nothing was found.
+    """
+    if not data.get('results'):
+        return None
+
+    food_result = data['results'][0]
+    calories = 0
+
+    # Spoonacular sometimes returns nutrition in a nested call; this is a simple example:
+    if 'nutrition' in food_result and 'nutrients' in food_result['nutrition']:
+        for nutrient in food_result['nutrition']['nutrients']:
+            if nutrient['name'] == 'Calories':
+                calories = int(nutrient['amount'])
+                break
+
+    return {"name": food_result['name'], "calories": calories}
+
+
+class ResponseCache:
+    """
+    On-disk cache of lookup results that expire after a fixed time.
+    Results of None are cached too, so unknown foods are not requested again.
+    """
+
+    def __init__(self, path=CACHE_PATH, ttl_seconds=CACHE_TTL_SECONDS):
+        """
+        Args:
+            path: SQLite file the cache is kept in.
+            ttl_seconds: How long a cached result stays valid.
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+
+        connection = sqlite3.connect(self.path)
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS FoodLookupCache (
+              Query VARCHAR(100) PRIMARY KEY,
+              Response TEXT,
+              FetchedAt REAL NOT NULL
+            )
+        """)
+        connection.commit()
+        connection.close()
+
+    def get(self, query):
+        """
+        Returns (True, result) for a fresh cached result, otherwise (False, None).
+        """
+        connection = sqlite3.connect(self.path)
+        row = connection.execute(
+            "SELECT Response FROM FoodLookupCache WHERE Query = ? AND FetchedAt > ?",
+            (query, time.time() - self.ttl_seconds)
+        ).fetchone()
+        connection.close()
+
+        if row is None:
+            return False, None
+        return True, json.loads(row[0])
+
+    def put(self, query, result):
+        """Stores a result, replacing any older one for the same query."""
+        connection = sqlite3.connect(self.path)
+        connection.execute(
+            "INSERT OR REPLACE INTO FoodLookupCache (Query, Response, FetchedAt) VALUES (?, ?, ?)",
+            (query, json.dumps(result), time.time())
+        )
+        connection.commit()
+        connection.close()
+
+    def clear_expired(self):
+        """Deletes every result older than the TTL."""
+        connection = sqlite3.connect(self.path)
+        connection.execute(
+            "DELETE FROM FoodLookupCache WHERE FetchedAt <= ?",
+            (time.time() - self.ttl_seconds,)
+        )
+        connection.commit()
+        connection.close()
+
+
+class FoodApiClient:
+    """
+    Looks foods up online with pooled connections, caching and request coalescing.
+    """
+
+    def __init__(self, base_url=API_URL, api_key=API_KEY, cache=None,
+                 timeout=REQUEST_TIMEOUT_SECONDS, max_workers=MAX_WORKERS):
+        """
+        Args:
+            base_url: Root URL of the API.
+            api_key: Spoonacular API key.
+            cache: ResponseCache to use, defaults to one at CACHE_PATH.
+            timeout: Seconds to wait for the server before giving up.
+            max_workers: Most lookups sent at once by lookup_async and lookup_many.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.cache = cache if cache is not None else ResponseCache()
+        self.timeout = timeout
+
+        # Retries cover dropped connections and temporary server errors
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers, max_retries=retry)
+        self.session = requests.Session()
+        # Sent as a header so the key does not appear in URLs or error messages
+        self.session.headers["x-api-key"] = api_key
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _query_key(food_name):
+        """Lookups differing only in case or spacing share a cache entry and a request."""
+        return " ".join(food_name.split()).lower()
+
+    def _fetch(self, query):
+        """Requests one food from the API and caches the result."""
+        response = self.session.get(
+            f"{self.base_url}/food/ingredients/search",
+            params={"query": query},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+
+        result = parse_food_response(response.json())
+        self.cache.put(query, result)
+        return result
+
+    def lookup(self, food_name):
+        """
+        Finds a food's name and calories, blocking until the result is known.
+        If the same food is already being requested, waits for that request instead.
+
+        Returns:
+            {"name": ..., "calories": ...}, or None if the food was not found.
+
+        Raises:
+            requests.RequestException: If the API could not be reached.
+        """
+        query = self._query_key(food_name)
+
+        found, result = self.cache.get(query)
+        if found:
+            return result
+
+        with self._lock:
+            future = self._in_flight.get(query)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._in_flight[query] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            # A request for this food may have finished since the cache was checked
+            found, result = self.cache.get(query)
+            if not found:
+                result = self._fetch(query)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[query]
+
+    def lookup_async(self, food_name):
+        """
+        Starts a lookup on the client's thread pool.
+
+        Returns:
+            A Future resolving to the result of lookup().
+        """
+        return self.executor.submit(self.lookup, food_name)
+
+    def lookup_many(self, food_names):
+        """
+        Looks up several foods, at most max_workers at a time.
+
+        Returns:
+            A dictionary mapping each food name to its result, or None if it failed.
+        """
+        futures = {name: self.lookup_async(name) for name in dict.fromkeys(food_names)}
+
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except requests.RequestException as e:
+                print(f"Error looking up {name}: {e}")
+                results[name] = None
+        return results
+
+    def close(self):
+        """Waits for running lookups, then releases the thread pool and connections."""
+        self.executor.shutdown(wait=True)
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_food_api_client():
+    """
+    Returns the shared FoodApiClient, creating it the first time it is needed.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = FoodApiClient()
+        return _client
+
+
 def fetch_food_from_api(food_name):
-    url = f"https://api.spoonacular.com/food/ingredients/search?query={food_name}&apiKey={api_key}"
-    response = requests.get(url)
-    data = response.json()
-
-    if data.get('results'):
-        # Example: get calories from the first result if available
-        food_result = data['results'][0]
-        calories = 0
-
-        # Spoonacular sometimes returns nutrition in a nested call; this is a simple example:
-        if 'nutrition' in food_result and 'nutrients' in food_result['nutrition']:
-            for nutrient in food_result['nutrition']['nutrients']:
-                if nutrient['name'] == 'Calories':
-                    calories = int(nutrient['amount'])
-                    break
-
-        return {"name": food_result['name'], "calories": calories}
-    return None
-
-
-api_data = fetch_food_from_api("apple")  # Example search
-if api_data:
-    food_obj = Food(api_data['name'], api_data['calories'])
-    print(food_obj.name, food_obj.calories)
-else:
-    print("Food not found")
+    """
+    Looks a food up online through the shared client.
+
+    Returns:
+        {"name": ..., "calories": ...}, or None if the food was not found or the API failed.
+    """
+    try:
+        return get_food_api_client().lookup(food_name)
+    except requests.RequestException as e:
+        print(f"Error fetching food from API: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    """
+    Example search, only made when the file is run directly.
+    """
+    api_data = fetch_food_from_api("apple")
+    if api_data:
+        food_obj = Food(api_data['name'], api_data['calories'])
+        print(food_obj.name, food_obj.calories)
+    else:
+        print("Food not found")
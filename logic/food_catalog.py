@@ -0,0 +1,213 @@
+"""
+Food_Catalog Module - ReHealth
+
+Stores each food once in FoodItem, with the calories it is usually logged at,
+so meal entries reference it by an integer ID instead of repeating its name.
+"""
+
+from datetime import date, datetime
+
+from db.db_handler import get_db_connection
+
+# Days for a food's usage to count half as much towards its ranking
+SUGGESTION_HALF_LIFE_DAYS = 14
+
+
+def canonical_food_name(food_name: str) -> str:
+    """
+    Returns the form a food name is matched by: lowercase with single spaces.
+    """
+    return " ".join(food_name.split()).lower()
+
+
+def display_food_name(food_name: str) -> str:
+    """
+    Returns the form a food name is shown in: as typed, with single spaces.
+    Changing the case would garble names such as "BLT" or "Shepherd's Pie".
+    """
+    return " ".join(food_name.split())
+
+
+def get_or_create_food_item(cursor, food_name: str, calories: int) -> int:
+    """
+    Looks up a food's FoodItemID, adding it to the catalog if it is new.
+    Names are matched on their canonical form, so the first spelling seen is the one shown.
+
+    Args:
+        cursor: Cursor of the connection saving the meal.
+        food_name: Food name as typed by the user.
+        calories: Calories logged, kept as the default for a new food.
+
+    Returns:
+        The food's FoodItemID.
+    """
+    canonical_name = canonical_food_name(food_name)
+
+    cursor.execute("SELECT FoodItemID FROM FoodItem WHERE CanonicalName = ?", (canonical_name,))
+    result = cursor.fetchone()
+    if result is not None:
+        return result[0]
+
+    cursor.execute("""
+        INSERT INTO FoodItem (CanonicalName, DisplayName, DefaultCalories)
+        VALUES (?, ?, ?)
+    """, (canonical_name, display_food_name(food_name), calories))
+    return cursor.lastrowid
+
+
+def migrate_food_names(cursor) -> None:
+    """
+    Moves Food from a free text FoodName column to a FoodItemID referencing
+    FoodItem, rebuilding the table as SQLite cannot drop the column in place.
+
+    Does nothing if the table has already been migrated.
+    """
+    cursor.execute("SELECT name FROM pragma_table_info('Food')")
+    if "FoodName" not in {column for (column,) in cursor.fetchall()}:
+        return
+
+    # Oldest entries first, so each food is shown with the spelling it was first logged with
+    cursor.execute("""
+        SELECT FoodName, Calories FROM Food
+        WHERE FoodName IS NOT NULL
+        ORDER BY FoodID ASC
+    """)
+    name_ids = {}
+    last_calories = {}
+    for name, calories in cursor.fetchall():
+        if name not in name_ids:
+            name_ids[name] = get_or_create_food_item(cursor, name, calories)
+        last_calories[name_ids[name]] = calories
+
+    # Each food's default is the calories it was last logged at
+    cursor.executemany(
+        "UPDATE FoodItem SET DefaultCalories = ? WHERE FoodItemID = ?",
+        [(calories, food_item_id) for food_item_id, calories in last_calories.items()]
+    )
+
+    cursor.execute("""
+    CREATE TABLE Food_migrated (
+      FoodID INTEGER PRIMARY KEY AUTOINCREMENT,
+      UserID INTEGER,
+      FoodItemID INTEGER,
+      Calories INTEGER,
+      MealType VARCHAR(10),
+      DateConsumed DATE,
+      FOREIGN KEY (UserID) REFERENCES User(UserID),
+      FOREIGN KEY (FoodItemID) REFERENCES FoodItem(FoodItemID)
+    );
+    """)
+
+    cursor.execute("CREATE TEMP TABLE FoodNameMap (FoodName VARCHAR(50) PRIMARY KEY, FoodItemID INTEGER)")
+    cursor.executemany("INSERT INTO FoodNameMap (FoodName, FoodItemID) VALUES (?, ?)", name_ids.items())
+
+    cursor.execute("""
+        INSERT INTO Food_migrated (FoodID, UserID, FoodItemID, Calories, MealType, DateConsumed)
+        SELECT Food.FoodID, Food.UserID, FoodNameMap.FoodItemID,
+               Food.Calories, Food.MealType, Food.DateConsumed
+        FROM Food
+        LEFT JOIN FoodNameMap ON FoodNameMap.FoodName = Food.FoodName
+    """)
+
+    cursor.execute("DROP TABLE FoodNameMap")
+    cursor.execute("DROP TABLE Food")
+    cursor.execute("ALTER TABLE Food_migrated RENAME TO Food")
+
+
+class FoodSuggester:
+    """
+    Ranks the foods one user logs by how often and how recently they log them.
+
+    Each food keeps a usage score that halves every SUGGESTION_HALF_LIFE_DAYS,
+    so a food eaten daily last month drops below one eaten every few days now.
+    """
+
+    def __init__(self) -> None:
+        # Canonical name -> [display name, score, day of last use, last calories]
+        self._foods = {}
+
+    def __len__(self) -> int:
+        return len(self._foods)
+
+    def _score_on(self, food: list, day: date) -> float:
+        """Returns a food's usage score decayed to the given day."""
+        days_since = (day - food[2]).days
+        return food[1] * 0.5 ** (days_since / SUGGESTION_HALF_LIFE_DAYS)
+
+    def record(self, food_name: str, calories: int, day: date | None = None) -> None:
+        """
+        Counts one use of a food.
+
+        Args:
+            food_name: Name of the food logged.
+            calories: Calories it was logged at.
+            day: Day it was logged, defaults to today.
+        """
+        day = day or date.today()
+        key = canonical_food_name(food_name)
+
+        food = self._foods.get(key)
+        if food is None:
+            self._foods[key] = [display_food_name(food_name), 1.0, day, calories]
+            return
+
+        food[1] = self._score_on(food, max(day, food[2])) + 1
+        food[2] = max(day, food[2])
+        food[3] = calories
+
+    def suggest(self, prefix: str = "", limit: int = 8, day: date | None = None) -> list[str]:
+        """
+        Finds the user's foods starting with prefix, most used first.
+
+        Args:
+            prefix: Text typed so far, matched ignoring case.
+            limit: Most names to return.
+            day: Day to rank on, defaults to today.
+
+        Returns:
+            Display names of the matching foods.
+        """
+        day = day or date.today()
+        key = canonical_food_name(prefix)
+
+        matches = [food for name, food in self._foods.items() if name.startswith(key)]
+        matches.sort(key=lambda food: self._score_on(food, day), reverse=True)
+        return [food[0] for food in matches[:limit]]
+
+    def calories_for(self, food_name: str) -> int | None:
+        """
+        Returns the calories the user last logged a food at, or None if they never have.
+        """
+        food = self._foods.get(canonical_food_name(food_name))
+        return None if food is None else food[3]
+
+
+# One suggester per user, loaded the first time it is needed in a session
+_suggesters: dict[int, FoodSuggester] = {}
+
+
+def get_food_suggester(user_id: int) -> FoodSuggester:
+    """
+    Returns the user's FoodSuggester, loading it from their meal history once per session.
+    """
+    if user_id in _suggesters:
+        return _suggesters[user_id]
+
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute("""
+        SELECT FoodItem.DisplayName, Food.Calories, Food.DateConsumed
+        FROM Food
+        JOIN FoodItem ON FoodItem.FoodItemID = Food.FoodItemID
+        WHERE Food.UserID = ? AND Food.DateConsumed IS NOT NULL
+        ORDER BY Food.DateConsumed ASC, Food.FoodID ASC
+    """, (user_id,))
+
+    suggester = FoodSuggester()
+    for name, calories, day in cursor.fetchall():
+        suggester.record(name, calories, datetime.strptime(day, '%Y-%m-%d').date())
+    connection.close()
+
+    _suggesters[user_id] = suggester
+    return suggester
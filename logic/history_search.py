@@ -0,0 +1,144 @@
+"""
+History_Search Module - ReHealth
+
+Full-text search over a user's logged meals and workouts. Food and exercise
+names live once in FoodItem and ExerciseCatalog, so the FTS5 tables index
+those catalogs, kept in sync by triggers, and matching entries are then read
+through the per-user indexes on Food and Exercises.
+"""
+
+import re
+
+from db.db_handler import get_db_connection
+
+HISTORY_PAGE_SIZE = 20
+
+# External content FTS5 tables: the catalog row is the content, only the index is stored
+SEARCH_TABLES = {
+    "FoodItemSearch": ("FoodItem", "FoodItemID"),
+    "ExerciseSearch": ("ExerciseCatalog", "CatalogID"),
+}
+
+
+def create_search_tables(cursor) -> None:
+    """
+    Creates the FTS5 tables and the triggers keeping them in sync with the catalogs.
+    A table that is newly created is filled from its catalog.
+    """
+    for search_table, (content_table, id_column) in SEARCH_TABLES.items():
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (search_table,))
+        exists = cursor.fetchone() is not None
+
+        # Prefix indexes on 2 and 3 characters make partially typed words fast to match
+        cursor.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {search_table} USING fts5(
+          DisplayName,
+          content='{content_table}',
+          content_rowid='{id_column}',
+          prefix='2 3'
+        );
+        """)
+
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {search_table}_insert AFTER INSERT ON {content_table} BEGIN
+          INSERT INTO {search_table} (rowid, DisplayName) VALUES (new.{id_column}, new.DisplayName);
+        END;
+        """)
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {search_table}_delete AFTER DELETE ON {content_table} BEGIN
+          INSERT INTO {search_table} ({search_table}, rowid, DisplayName)
+          VALUES ('delete', old.{id_column}, old.DisplayName);
+        END;
+        """)
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {search_table}_update AFTER UPDATE ON {content_table} BEGIN
+          INSERT INTO {search_table} ({search_table}, rowid, DisplayName)
+          VALUES ('delete', old.{id_column}, old.DisplayName);
+          INSERT INTO {search_table} (rowid, DisplayName) VALUES (new.{id_column}, new.DisplayName);
+        END;
+        """)
+
+        if not exists:
+            cursor.execute(f"INSERT INTO {search_table} ({search_table}) VALUES ('rebuild')")
+
+
+def build_match_query(search_text: str) -> str:
+    """
+    Turns typed text into an FTS5 query matching entries containing every word,
+    with the last word allowed to be incomplete, e.g. "bench pr" -> "bench" "pr"*.
+
+    Returns:
+        The query, or an empty string if the text has no searchable words.
+    """
+    words = re.findall(r"\w+", search_text.lower())
+    if not words:
+        return ""
+    # Quoting each word stops FTS5 reading it as an operator such as AND or NEAR
+    return " ".join(f'"{word}"' for word in words) + "*"
+
+
+def search_history(user_id: int, search_text: str, page: int = 0,
+                   page_size: int = HISTORY_PAGE_SIZE) -> tuple[list[tuple], bool]:
+    """
+    Finds the user's meals and workouts whose name matches the search text.
+
+    Results are ranked by how well the name matches (bm25), then newest first.
+
+    Args:
+        user_id: The user's ID.
+        search_text: Words to look for, the last one may be partially typed.
+        page: Page of results to return, starting at 0.
+        page_size: Results per page.
+
+    Returns:
+        (results, has_more). Results are (kind, date, name, details) tuples where
+        kind is "Food" or "Workout"; has_more is True if there is another page.
+    """
+    match_query = build_match_query(search_text)
+    if not match_query:
+        return [], False
+
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    # One extra row is fetched to tell whether another page exists. CROSS JOIN keeps
+    # the few matching catalog rows as the outer loop, so entries are read through
+    # the (UserID, item, date) indexes rather than by scanning all of the user's rows
+    cursor.execute("""
+        WITH food_matches AS (
+            SELECT rowid AS FoodItemID, bm25(FoodItemSearch) AS Rank
+            FROM FoodItemSearch
+            WHERE FoodItemSearch MATCH :query
+        ),
+        exercise_matches AS (
+            SELECT rowid AS CatalogID, bm25(ExerciseSearch) AS Rank
+            FROM ExerciseSearch
+            WHERE ExerciseSearch MATCH :query
+        )
+        SELECT 'Food', Food.DateConsumed, FoodItem.DisplayName,
+               printf('%d cals, %s', Food.Calories, Food.MealType),
+               food_matches.Rank AS Rank, Food.DateConsumed AS EntryDate
+        FROM food_matches
+        CROSS JOIN Food ON Food.UserID = :user_id AND Food.FoodItemID = food_matches.FoodItemID
+        JOIN FoodItem ON FoodItem.FoodItemID = food_matches.FoodItemID
+        UNION ALL
+        SELECT 'Workout', Exercises.DatePerformed, ExerciseCatalog.DisplayName,
+               printf('%gkg x %d sets x %d reps', Exercises.Weight, Exercises.Sets, Exercises.Reps),
+               exercise_matches.Rank AS Rank, Exercises.DatePerformed AS EntryDate
+        FROM exercise_matches
+        CROSS JOIN Exercises ON Exercises.UserID = :user_id AND Exercises.CatalogID = exercise_matches.CatalogID
+        JOIN ExerciseCatalog ON ExerciseCatalog.CatalogID = exercise_matches.CatalogID
+        ORDER BY Rank ASC, EntryDate DESC
+        LIMIT :limit OFFSET :offset
+    """, {
+        "query": match_query,
+        "user_id": user_id,
+        "limit": page_size + 1,
+        "offset": page * page_size,
+    })
+
+    rows = cursor.fetchall()
+    connection.close()
+
+    results = [row[:4] for row in rows[:page_size]]
+    return results, len(rows) > page_size
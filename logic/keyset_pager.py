@@ -0,0 +1,88 @@
+"""
+Keyset_Pager Module - ReHealth
+
+Random access by row number over a keyset paginated query, for scrolling
+through long histories. Only a few pages of rows are held at once; the pager
+remembers the cursor each page starts at, so returning to a page is a single
+indexed query however deep in the history it is.
+"""
+
+from collections import OrderedDict
+
+PAGE_SIZE = 200
+MAX_CACHED_PAGES = 4
+
+
+class KeysetPager:
+    """
+    Reads rows by position from a fetch_page(after, limit) -> (rows, cursor) function.
+    """
+
+    def __init__(self, fetch_page, total: int, page_size: int = PAGE_SIZE,
+                 max_cached_pages: int = MAX_CACHED_PAGES) -> None:
+        """
+        Args:
+            fetch_page: Function returning (rows, cursor) for the page after a cursor,
+                with a cursor of None once the last page has been read.
+            total: Number of rows the query returns.
+            page_size: Rows read per query.
+            max_cached_pages: Most pages of rows kept in memory.
+        """
+        self.fetch_page = fetch_page
+        self.total = total
+        self.page_size = page_size
+        self.max_cached_pages = max_cached_pages
+
+        # The cursor each page starts after; None for the first page
+        self._cursors = [None]
+        self._pages = OrderedDict()
+
+    def _load_page(self, index: int) -> list[tuple]:
+        """Reads a page whose starting cursor is known and caches it."""
+        rows, cursor = self.fetch_page(self._cursors[index], self.page_size)
+        if cursor is not None and index + 1 == len(self._cursors):
+            self._cursors.append(cursor)
+
+        self._pages[index] = rows
+        while len(self._pages) > self.max_cached_pages:
+            self._pages.popitem(last=False)
+        return rows
+
+    def page(self, index: int) -> list[tuple]:
+        """
+        Returns the rows of a page, reading forward from the nearest known cursor if needed.
+
+        Args:
+            index: Page number, starting at 0.
+        """
+        if index in self._pages:
+            self._pages.move_to_end(index)
+            return self._pages[index]
+
+        # Pages past the last known cursor are reached by walking forward through them
+        while len(self._cursors) <= index:
+            known = len(self._cursors)
+            self._load_page(known - 1)
+            if len(self._cursors) == known:
+                return []
+
+        return self._load_page(index)
+
+    def rows(self, offset: int, count: int) -> list[tuple]:
+        """
+        Returns up to count rows starting at a row number.
+
+        Args:
+            offset: Position of the first row, starting at 0.
+            count: Number of rows wanted.
+        """
+        rows = []
+        while len(rows) < count and offset < self.total:
+            index, start = divmod(offset, self.page_size)
+            page = self.page(index)
+            taken = page[start:start + count - len(rows)]
+            if not taken:
+                break
+            rows.extend(taken)
+            offset += len(taken)
+        return rows
@@ -0,0 +1,173 @@
+"""
+Leaderboard Module - ReHealth
+
+Ranks every user by lifetime score and by steps this week using precomputed,
+indexed columns, so neither query has to calculate scores on the fly.
+"""
+
+from datetime import date, timedelta
+
+from db.db_handler import get_db_connection
+
+
+def week_start(day: date | None = None) -> date:
+    """
+    Returns the Monday of the week containing the given day (defaults to today).
+    """
+    day = day or date.today()
+    return day - timedelta(days=day.weekday())
+
+
+def record_weekly_steps(cursor, user_id: int, steps: int, day: date | None = None) -> None:
+    """
+    Adds steps to the user's total for the week.
+
+    Must be called before the Steps row is inserted, in the same transaction,
+    so a week that has no total yet can be backfilled without counting the new row.
+    """
+    start = week_start(day)
+    end = start + timedelta(days=6)
+
+    cursor.execute("SELECT 1 FROM WeeklySteps WHERE UserID = ? AND WeekStart = ?", (user_id, start))
+    if cursor.fetchone() is None:
+        cursor.execute("""
+            INSERT INTO WeeklySteps (UserID, WeekStart, Steps)
+            SELECT :user_id, :start, COALESCE(SUM(StepCount), 0)
+            FROM Steps
+            WHERE UserID = :user_id AND Date >= :start AND Date <= :end
+        """, {"user_id": user_id, "start": start, "end": end})
+
+    cursor.execute("""
+        UPDATE WeeklySteps
+        SET Steps = Steps + ?
+        WHERE UserID = ? AND WeekStart = ?
+    """, (steps, user_id, start))
+
+
+def backfill_weekly_steps(cursor, user_id: int | None = None) -> None:
+    """
+    Builds weekly step totals from the whole Steps table, or one user's entries.
+    Weeks that already have a total are left untouched.
+    """
+    user_filter, params = ("WHERE UserID = ?", (user_id,)) if user_id is not None else ("", ())
+
+    # DATE(x, 'weekday 0', '-6 days') is the Monday of x's week
+    cursor.execute(f"""
+        INSERT OR IGNORE INTO WeeklySteps (UserID, WeekStart, Steps)
+        SELECT UserID, DATE(Date, 'weekday 0', '-6 days'), SUM(StepCount)
+        FROM Steps
+        {user_filter}
+        GROUP BY UserID, DATE(Date, 'weekday 0', '-6 days')
+    """, params)
+
+
+def get_top_scores(limit: int = 10) -> list[tuple]:
+    """
+    Fetches the highest lifetime scores.
+
+    Returns:
+        A list of (position, username, score, rank) tuples.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute("""
+        SELECT User.Username, UserScore.Score, UserScore.RankName
+        FROM UserScore
+        JOIN User ON User.UserID = UserScore.UserID
+        ORDER BY UserScore.Score DESC, UserScore.UserID ASC
+        LIMIT ?
+    """, (limit,))
+
+    results = cursor.fetchall()
+    connection.close()
+    return [(position, *row) for position, row in enumerate(results, start=1)]
+
+
+def get_score_position(user_id: int) -> tuple[int, int] | None:
+    """
+    Finds where the user sits on the lifetime score leaderboard.
+
+    Returns:
+        (position, number of users ranked), or None if the user has no score yet.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute("SELECT Score FROM UserScore WHERE UserID = ?", (user_id,))
+    result = cursor.fetchone()
+    if result is None:
+        connection.close()
+        return None
+    score = result[0]
+
+    # Both counts are range scans on idx_userscore_score; ties are broken by UserID
+    cursor.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM UserScore WHERE Score > :score),
+            (SELECT COUNT(*) FROM UserScore WHERE Score = :score AND UserID < :user_id),
+            (SELECT COUNT(*) FROM UserScore)
+    """, {"score": score, "user_id": user_id})
+    higher, tied_ahead, total = cursor.fetchone()
+    connection.close()
+
+    return higher + tied_ahead + 1, total
+
+
+def get_top_weekly_steps(limit: int = 10, day: date | None = None) -> list[tuple]:
+    """
+    Fetches the users with the most steps in the week containing day.
+
+    Returns:
+        A list of (position, username, steps) tuples.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute("""
+        SELECT User.Username, WeeklySteps.Steps
+        FROM WeeklySteps
+        JOIN User ON User.UserID = WeeklySteps.UserID
+        WHERE WeeklySteps.WeekStart = ?
+        ORDER BY WeeklySteps.Steps DESC, WeeklySteps.UserID ASC
+        LIMIT ?
+    """, (week_start(day), limit))
+
+    results = cursor.fetchall()
+    connection.close()
+    return [(position, *row) for position, row in enumerate(results, start=1)]
+
+
+def get_weekly_steps_position(user_id: int, day: date | None = None) -> tuple[int, int] | None:
+    """
+    Finds where the user sits on this week's steps leaderboard.
+
+    Returns:
+        (position, number of users ranked), or None if the user has no steps this week.
+    """
+    start = week_start(day)
+
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute(
+        "SELECT Steps FROM WeeklySteps WHERE UserID = ? AND WeekStart = ?",
+        (user_id, start)
+    )
+    result = cursor.fetchone()
+    if result is None:
+        connection.close()
+        return None
+    steps = result[0]
+
+    cursor.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM WeeklySteps WHERE WeekStart = :start AND Steps > :steps),
+            (SELECT COUNT(*) FROM WeeklySteps
+             WHERE WeekStart = :start AND Steps = :steps AND UserID < :user_id),
+            (SELECT COUNT(*) FROM WeeklySteps WHERE WeekStart = :start)
+    """, {"start": start, "steps": steps, "user_id": user_id})
+    higher, tied_ahead, total = cursor.fetchone()
+    connection.close()
+
+    return higher + tied_ahead + 1, total
@@ -0,0 +1,78 @@
+"""
+Nutrition_DB Module - ReHealth
+
+Offline nutrition lookups from the dataset bundled in data/nutrition.csv.
+The file is read once into memory and searched through a PrefixIndex, so
+finding a food's calories needs no network connection.
+"""
+
+import csv
+import os
+
+from logic.prefix_index import PrefixIndex
+
+NUTRITION_DATA_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "data", "nutrition.csv")
+)
+
+
+class NutritionDatabase:
+    """
+    In-memory table of foods with their typical serving and its calories.
+    Foods are found by the start of their name or of any word in it.
+    """
+
+    def __init__(self, path: str = NUTRITION_DATA_PATH) -> None:
+        """
+        Args:
+            path: CSV file with name, serving and calories columns.
+        """
+        self.foods = {}
+        self.index = PrefixIndex()
+
+        with open(path, newline="", encoding="utf-8") as file:
+            for row in csv.DictReader(file):
+                name = row["name"].strip()
+                self.foods[name.lower()] = (name, row["serving"].strip(), int(row["calories"]))
+
+                self.index.add(name)
+                # "White Rice" is also found by typing "rice"
+                words = name.split()
+                for position in range(1, len(words)):
+                    self.index.add(name, " ".join(words[position:]))
+
+    def __len__(self) -> int:
+        return len(self.foods)
+
+    def lookup(self, food_name: str) -> tuple | None:
+        """
+        Finds a food by its exact name, ignoring case.
+
+        Returns:
+            (name, serving, calories), or None if the food is not in the dataset.
+        """
+        return self.foods.get(" ".join(food_name.split()).lower())
+
+    def search(self, prefix: str, limit: int = 8) -> list[tuple]:
+        """
+        Finds foods whose name, or a word in it, starts with prefix.
+
+        Returns:
+            A list of (name, serving, calories) tuples.
+        """
+        if not prefix.strip():
+            return []
+        return [self.foods[name.lower()] for name in self.index.search(prefix, limit)]
+
+
+_database = None
+
+
+def get_nutrition_database() -> NutritionDatabase:
+    """
+    Returns the bundled nutrition database, reading the dataset the first time it is needed.
+    """
+    global _database
+    if _database is None:
+        _database = NutritionDatabase()
+    return _database
@@ -0,0 +1,78 @@
+"""
+Prefix_Index Module - ReHealth
+
+A small in-memory index for autocomplete. Names are kept sorted by their
+lowercase form, so every name starting with a prefix sits in one contiguous
+slice found with two binary searches.
+"""
+
+from bisect import bisect_left
+
+
+class PrefixIndex:
+    """
+    Sorted list of names supporting case-insensitive prefix lookups.
+
+    A name can also be added under extra keys, e.g. each of its later words,
+    so it is found by prefixes that do not start at its first letter.
+    """
+
+    def __init__(self, names=()) -> None:
+        """
+        Args:
+            names: Names to index, duplicates (ignoring case) are kept once.
+        """
+        entries = {}
+        for name in names:
+            entries.setdefault(self._key(name), name)
+        self._entries = sorted(entries.items())
+
+    @staticmethod
+    def _key(name: str) -> str:
+        """Lowercase form with runs of whitespace collapsed, used for ordering and matching."""
+        return " ".join(name.split()).lower()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        key = self._key(name)
+        position = bisect_left(self._entries, (key,))
+        return position < len(self._entries) and self._entries[position][0] == key
+
+    def add(self, name: str, key: str | None = None) -> None:
+        """
+        Adds a name to the index unless it is already present under that key.
+
+        Args:
+            name: Name returned by searches.
+            key: Text the name is matched by, defaults to the name itself.
+        """
+        entry = (self._key(key or name), name)
+        position = bisect_left(self._entries, entry)
+        if position == len(self._entries) or self._entries[position] != entry:
+            self._entries.insert(position, entry)
+
+    def search(self, prefix: str, limit: int = 10) -> list[str]:
+        """
+        Finds the names starting with prefix, ignoring case.
+
+        Args:
+            prefix: Text typed so far.
+            limit: Most names to return.
+
+        Returns:
+            Matching names in alphabetical order of the key they matched.
+        """
+        key = self._key(prefix)
+        start = bisect_left(self._entries, (key,))
+        # Every key starting with the prefix sorts before prefix + the highest code point
+        end = bisect_left(self._entries, (key + "\U0010ffff",), lo=start)
+
+        # A name added under several keys can match more than once
+        matches = {}
+        for position in range(start, end):
+            matches.setdefault(self._entries[position][1])
+            if len(matches) == limit:
+                break
+        return list(matches)
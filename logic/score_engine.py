@@ -0,0 +1,278 @@
+"""
+Score_Engine Module - ReHealth
+
+Keeps each user's lifetime totals and ReHealth score up to date as activity is saved,
+so the score never has to be rebuilt from the full history.
+"""
+
+from datetime import date, datetime, timedelta
+
+from db.db_handler import get_db_connection
+from logic.calculations import calculate_lifetime_score, get_rehealth_level
+
+
+def _backfill_user(cursor, user_id: int) -> None:
+    """
+    Creates the user's UserScore row from their full history if it does not exist yet.
+    Runs once per user; every later update is incremental.
+    """
+    # Checked first because INSERT OR IGNORE would still evaluate the SUMs
+    cursor.execute("SELECT 1 FROM UserScore WHERE UserID = ?", (user_id,))
+    if cursor.fetchone() is not None:
+        return
+
+    cursor.execute("""
+        INSERT OR IGNORE INTO UserScore (UserID, LifetimeSteps, LifetimeSleepHours, LifetimeWeight)
+        SELECT
+            :user_id,
+            (SELECT COALESCE(SUM(StepCount), 0) FROM Steps WHERE UserID = :user_id),
+            (SELECT COALESCE(SUM(SleepDuration), 0) FROM Sleep WHERE UserID = :user_id),
+            (SELECT COALESCE(SUM(Weight * Sets * Reps), 0) FROM Exercises WHERE UserID = :user_id)
+    """, {"user_id": user_id})
+
+
+def _rescore(cursor, user_id: int, day: date) -> tuple[str, str] | None:
+    """
+    Recalculates the score from the stored totals, snapshots it for the day
+    and records a rank change event if the rank moved.
+
+    Returns:
+        (old_rank, new_rank) if the rank changed, otherwise None.
+    """
+    cursor.execute("""
+        SELECT LifetimeSteps, LifetimeSleepHours, LifetimeWeight, RankName
+        FROM UserScore
+        WHERE UserID = ?
+    """, (user_id,))
+    steps, sleep_hours, weight, old_rank = cursor.fetchone()
+
+    score = calculate_lifetime_score(steps, float(sleep_hours), float(weight))
+    new_rank = get_rehealth_level(score)
+
+    cursor.execute("""
+        UPDATE UserScore
+        SET Score = ?, RankName = ?, UpdatedOn = ?
+        WHERE UserID = ?
+    """, (score, new_rank, day, user_id))
+
+    # One snapshot per user per day, overwritten by later activity that day
+    cursor.execute("""
+        INSERT INTO ScoreHistory (UserID, ScoreDate, Score, RankName)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (UserID, ScoreDate) DO UPDATE SET Score = excluded.Score, RankName = excluded.RankName
+    """, (user_id, day, score, new_rank))
+
+    # A freshly backfilled row has no previous rank, so it is not a rank change
+    if old_rank is None or old_rank == new_rank:
+        return None
+
+    cursor.execute("""
+        INSERT INTO RankEvents (UserID, EventDate, OldRank, NewRank, Score)
+        VALUES (?, ?, ?, ?, ?)
+    """, (user_id, day, old_rank, new_rank, score))
+    return old_rank, new_rank
+
+
+def record_activity(cursor, user_id: int, steps: int = 0, sleep_hours: float = 0.0,
+                    weight_lifted: float = 0.0, day: date | None = None) -> tuple[str, str] | None:
+    """
+    Adds newly logged activity to the user's lifetime totals and updates their score.
+
+    Must be called on the same cursor, in the same transaction and before the
+    activity row itself is inserted, so the first call can backfill from history
+    without counting the new row twice.
+
+    Args:
+        cursor: Cursor of the connection saving the activity.
+        user_id: The user's ID.
+        steps: Steps being logged.
+        sleep_hours: Hours of sleep being logged.
+        weight_lifted: Weight * sets * reps being logged.
+        day: Day the activity is logged for, defaults to today.
+
+    Returns:
+        (old_rank, new_rank) if the activity changed the user's rank, otherwise None.
+    """
+    _backfill_user(cursor, user_id)
+
+    # Incrementing in SQL takes the write lock before the totals are read back
+    cursor.execute("""
+        UPDATE UserScore
+        SET LifetimeSteps = LifetimeSteps + ?,
+            LifetimeSleepHours = LifetimeSleepHours + ?,
+            LifetimeWeight = LifetimeWeight + ?
+        WHERE UserID = ?
+    """, (steps, sleep_hours, weight_lifted, user_id))
+
+    return _rescore(cursor, user_id, day or date.today())
+
+
+def backfill_all_scores(cursor) -> None:
+    """
+    Creates UserScore rows for every user that does not have one yet.
+    """
+    cursor.execute("""
+        SELECT UserID FROM User
+        WHERE UserID NOT IN (SELECT UserID FROM UserScore)
+    """)
+    for (user_id,) in cursor.fetchall():
+        _backfill_user(cursor, user_id)
+        _rescore(cursor, user_id, date.today())
+
+
+def get_user_score(user_id: int) -> dict:
+    """
+    Fetches the user's precomputed lifetime totals, score and rank.
+
+    Args:
+        user_id (int): The user's ID.
+
+    Returns:
+        A dictionary with "steps", "sleep_hours", "weight_lifted", "score" and "rank".
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    query = """
+        SELECT LifetimeSteps, LifetimeSleepHours, LifetimeWeight, Score, RankName
+        FROM UserScore
+        WHERE UserID = ?
+    """
+    cursor.execute(query, (user_id,))
+    result = cursor.fetchone()
+
+    # Users who have not logged anything since the engine was added are backfilled once
+    if result is None:
+        _backfill_user(cursor, user_id)
+        _rescore(cursor, user_id, date.today())
+        connection.commit()
+        cursor.execute(query, (user_id,))
+        result = cursor.fetchone()
+
+    connection.close()
+    steps, sleep_hours, weight, score, rank = result
+    return {
+        "steps": steps,
+        "sleep_hours": float(sleep_hours),
+        "weight_lifted": float(weight),
+        "score": score,
+        "rank": rank,
+    }
+
+
+def get_rank_events(user_id: int, limit: int = 10) -> list[tuple]:
+    """
+    Fetches the user's most recent rank changes.
+
+    Returns:
+        A list of (EventDate, OldRank, NewRank, Score) tuples, newest first.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute("""
+        SELECT EventDate, OldRank, NewRank, Score
+        FROM RankEvents
+        WHERE UserID = ?
+        ORDER BY EventID DESC
+        LIMIT ?
+    """, (user_id, limit))
+
+    events = cursor.fetchall()
+    connection.close()
+    return events
+
+
+def get_score_history(user_id: int, start: date, end: date) -> list[tuple]:
+    """
+    Fetches the user's daily score snapshots between two dates inclusive.
+
+    Returns:
+        A list of (ScoreDate, Score) tuples, oldest first.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute("""
+        SELECT ScoreDate, Score
+        FROM ScoreHistory
+        WHERE UserID = ? AND ScoreDate >= ? AND ScoreDate <= ?
+        ORDER BY ScoreDate ASC
+    """, (user_id, start, end))
+
+    history = cursor.fetchall()
+    connection.close()
+    return history
+
+
+def get_score_before(user_id: int, day: date) -> int:
+    """
+    Fetches the user's latest daily score snapshot from before a date.
+
+    Returns:
+        The snapshotted score, or 0 if the user has none before the date.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    cursor.execute("""
+        SELECT Score
+        FROM ScoreHistory
+        WHERE UserID = ? AND ScoreDate < ?
+        ORDER BY ScoreDate DESC
+        LIMIT 1
+    """, (user_id, day))
+
+    result = cursor.fetchone()
+    connection.close()
+    return result[0] if result else 0
+
+
+def get_last_7_days_score_convert(user_id: int) -> tuple[list, list]:
+    """
+    Builds a 7 day score series from the stored snapshots.
+    Days without a snapshot carry the previous day's score forward.
+
+    Returns day numbers (1-7) and scores.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    today = datetime.now().date()
+    seven_days_ago = today - timedelta(days=6)
+
+    # Snapshots inside the window plus the latest one before it, so day 1 has a value
+    cursor.execute("""
+        SELECT ScoreDate, Score FROM (
+            SELECT ScoreDate, Score
+            FROM ScoreHistory
+            WHERE UserID = :user_id AND ScoreDate < :start
+            ORDER BY ScoreDate DESC
+            LIMIT 1
+        )
+        UNION ALL
+        SELECT ScoreDate, Score
+        FROM ScoreHistory
+        WHERE UserID = :user_id AND ScoreDate >= :start AND ScoreDate <= :end
+        ORDER BY ScoreDate ASC
+    """, {"user_id": user_id, "start": seven_days_ago, "end": today})
+
+    results = cursor.fetchall()
+    connection.close()
+
+    scores_dict = {}
+    current_score = 0
+    for score_date, score in results:
+        date_obj = datetime.strptime(score_date, '%Y-%m-%d').date()
+        if date_obj < seven_days_ago:
+            current_score = score
+        else:
+            scores_dict[date_obj] = score
+
+    scores = []
+    for i in range(7):
+        current_date = seven_days_ago + timedelta(days=i)
+        current_score = scores_dict.get(current_date, current_score)
+        scores.append(current_score)
+
+    return list(range(1, 8)), scores
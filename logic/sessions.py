@@ -0,0 +1,163 @@
+"""
+Sessions Module - ReHealth
+
+"Remember me" logins. A session token is a random string kept only in a local
+file on this machine; the database stores its SHA-256 hash, so a copy of the
+database cannot be used to log in. Resuming a session is a single indexed
+lookup with no password hashing, which makes switching between remembered
+members on a shared machine immediate.
+"""
+
+import hashlib
+import json
+import os
+import secrets
+from datetime import datetime, timedelta
+
+from db.db_handler import DB_PATH, get_db_connection
+from logic.user import User
+
+SESSION_LIFETIME_DAYS = 30
+TOKEN_BYTES = 32
+
+# Kept beside the database so REHEALTH_DB_PATH moves both together
+REMEMBERED_SESSIONS_PATH = os.path.join(os.path.dirname(DB_PATH), "remembered_sessions.json")
+
+
+def create_session_table(cursor) -> None:
+    """Creates the Sessions table and its index."""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS Sessions (
+      TokenHash CHAR(64) PRIMARY KEY,
+      UserID INTEGER NOT NULL,
+      CreatedAt DATETIME NOT NULL,
+      ExpiresAt DATETIME NOT NULL,
+      FOREIGN KEY (UserID) REFERENCES User(UserID)
+    );
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_user ON Sessions (UserID)")
+
+
+def _hash_token(token: str) -> str:
+    """Tokens are long and random, so a single SHA-256 is enough to protect them."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def create_session(user_id: int) -> str:
+    """
+    Starts a remembered session for a user, clearing out any expired sessions.
+
+    Args:
+        user_id: The user's ID.
+
+    Returns:
+        The session token, to be kept in the remembered sessions file.
+    """
+    token = secrets.token_urlsafe(TOKEN_BYTES)
+    now = datetime.now()
+
+    connection = get_db_connection()
+    cursor = connection.cursor()
+    cursor.execute("DELETE FROM Sessions WHERE ExpiresAt <= ?", (now.isoformat(" "),))
+    cursor.execute("""
+        INSERT INTO Sessions (TokenHash, UserID, CreatedAt, ExpiresAt)
+        VALUES (?, ?, ?, ?)
+    """, (
+        _hash_token(token),
+        user_id,
+        now.isoformat(" "),
+        (now + timedelta(days=SESSION_LIFETIME_DAYS)).isoformat(" ")
+    ))
+    connection.commit()
+    connection.close()
+    return token
+
+
+def resume_session(token: str) -> User | None:
+    """
+    Finds the user a session token belongs to.
+
+    Args:
+        token: Token from the remembered sessions file.
+
+    Returns:
+        The logged-in User, or None if the session has expired or was revoked.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+    cursor.execute("""
+        SELECT User.UserID, User.Username, User.Password, User.Sex, User.DateOfBirth, User.JoinDate
+        FROM Sessions
+        JOIN User ON User.UserID = Sessions.UserID
+        WHERE Sessions.TokenHash = ? AND Sessions.ExpiresAt > ?
+    """, (_hash_token(token), datetime.now().isoformat(" ")))
+    result = cursor.fetchone()
+    connection.close()
+
+    if result is None:
+        return None
+
+    return User(
+        username=result[1],
+        password=result[2],
+        sex=result[3],
+        dob=result[4],
+        join_date=result[5],
+        user_id=result[0]
+    )
+
+
+def revoke_session(token: str) -> None:
+    """Ends a session so its token can no longer be used."""
+    connection = get_db_connection()
+    connection.execute("DELETE FROM Sessions WHERE TokenHash = ?", (_hash_token(token),))
+    connection.commit()
+    connection.close()
+
+
+def load_remembered_sessions(path: str = REMEMBERED_SESSIONS_PATH) -> dict[str, str]:
+    """
+    Returns:
+        A dictionary mapping each remembered username to its session token.
+    """
+    try:
+        with open(path, encoding="utf-8") as file:
+            sessions = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return sessions if isinstance(sessions, dict) else {}
+
+
+def _write_remembered_sessions(sessions: dict[str, str], path: str) -> None:
+    """Replaces the file in one step, readable only by the current user."""
+    temp_path = f"{path}.tmp"
+    descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+        json.dump(sessions, file, indent=2)
+    os.replace(temp_path, path)
+
+
+def remember_session(username: str, token: str, path: str = REMEMBERED_SESSIONS_PATH) -> None:
+    """
+    Saves a session token on this machine, replacing the user's previous one.
+    """
+    sessions = load_remembered_sessions(path)
+    previous_token = sessions.get(username)
+    if previous_token and previous_token != token:
+        revoke_session(previous_token)
+
+    sessions[username] = token
+    _write_remembered_sessions(sessions, path)
+
+
+def forget_session(username: str, path: str = REMEMBERED_SESSIONS_PATH) -> None:
+    """
+    Removes a user's remembered session from this machine and revokes it.
+    """
+    sessions = load_remembered_sessions(path)
+    token = sessions.pop(username, None)
+    if token is None:
+        return
+
+    revoke_session(token)
+    _write_remembered_sessions(sessions, path)
@@ -0,0 +1,209 @@
+"""
+Streaks Module - ReHealth
+
+Tracks consecutive-day streaks for hitting the step goal, reaching the sleep
+target and logging anything at all. Streaks are backfilled once from history
+with window functions and then updated in constant time as entries are saved.
+"""
+
+from datetime import date, datetime, timedelta
+
+from db.db_handler import get_db_connection
+
+# Hours of sleep needed for a night to count towards the sleep streak,
+# the bottom of the 7-9 hour range sleep_calc treats as ideal
+SLEEP_TARGET_HOURS = 7
+
+# Subqueries returning the (UserID, Day) pairs that count towards each streak.
+# {user_filter} is replaced to restrict them to a single user.
+STREAK_DAYS: dict[str, str] = {
+    "logging": """
+        SELECT UserID, Date AS Day FROM Steps WHERE Date IS NOT NULL {user_filter}
+        UNION
+        SELECT UserID, SleepDate FROM Sleep WHERE SleepDate IS NOT NULL {user_filter}
+        UNION
+        SELECT UserID, DateConsumed FROM Food WHERE DateConsumed IS NOT NULL {user_filter}
+        UNION
+        SELECT UserID, DatePerformed FROM Exercises WHERE DatePerformed IS NOT NULL {user_filter}
+    """,
+    "steps_goal": """
+        SELECT UserID, Date AS Day FROM Steps WHERE Date IS NOT NULL {user_filter}
+        GROUP BY UserID, Date
+        HAVING SUM(StepCount) >= MAX(StepsGoal)
+    """,
+    "sleep_target": f"""
+        SELECT UserID, SleepDate AS Day FROM Sleep WHERE SleepDate IS NOT NULL {{user_filter}}
+        GROUP BY UserID, SleepDate
+        HAVING SUM(SleepDuration) >= {SLEEP_TARGET_HOURS}
+    """,
+}
+
+# Checks whether a single day counts towards a streak once an entry is saved
+STREAK_DAY_CHECKS: dict[str, str] = {
+    "steps_goal": """
+        SELECT SUM(StepCount) >= MAX(StepsGoal)
+        FROM Steps
+        WHERE UserID = :user_id AND Date = :day
+    """,
+    "sleep_target": f"""
+        SELECT SUM(SleepDuration) >= {SLEEP_TARGET_HOURS}
+        FROM Sleep
+        WHERE UserID = :user_id AND SleepDate = :day
+    """,
+}
+
+# Streaks that a save to each table can extend
+TABLE_STREAKS: dict[str, tuple[str, ...]] = {
+    "Steps": ("logging", "steps_goal"),
+    "Sleep": ("logging", "sleep_target"),
+    "Food": ("logging",),
+    "Exercises": ("logging",),
+}
+
+# Gaps and islands: consecutive days share the same (julianday - row number),
+# so grouping by it gives each run. Keeps the latest run and the longest one.
+BACKFILL_QUERY = """
+    INSERT OR IGNORE INTO Streaks (UserID, Metric, CurrentStreak, LongestStreak, LastDate)
+    WITH days AS ({days}),
+    islands AS (
+        SELECT UserID, Day,
+               julianday(Day) - ROW_NUMBER() OVER (PARTITION BY UserID ORDER BY Day) AS RunID
+        FROM days
+    ),
+    runs AS (
+        SELECT UserID, MAX(Day) AS EndDay, COUNT(*) AS RunLength
+        FROM islands
+        GROUP BY UserID, RunID
+    ),
+    ranked AS (
+        SELECT UserID, EndDay, RunLength,
+               MAX(RunLength) OVER (PARTITION BY UserID) AS Longest,
+               ROW_NUMBER() OVER (PARTITION BY UserID ORDER BY EndDay DESC) AS Recency
+        FROM runs
+    )
+    SELECT UserID, :metric, RunLength, Longest, EndDay
+    FROM ranked
+    WHERE Recency = 1
+"""
+
+
+def _backfill_user(cursor, user_id: int, metric: str) -> None:
+    """
+    Creates the user's streak row for a metric from their full history if it does not exist yet.
+    """
+    cursor.execute("SELECT 1 FROM Streaks WHERE UserID = ? AND Metric = ?", (user_id, metric))
+    if cursor.fetchone() is not None:
+        return
+
+    days = STREAK_DAYS[metric].format(user_filter="AND UserID = :user_id")
+    cursor.execute(BACKFILL_QUERY.format(days=days), {"user_id": user_id, "metric": metric})
+
+    # Users with no qualifying days still get a row so the backfill is not repeated
+    cursor.execute("""
+        INSERT OR IGNORE INTO Streaks (UserID, Metric, CurrentStreak, LongestStreak, LastDate)
+        VALUES (?, ?, 0, 0, NULL)
+    """, (user_id, metric))
+
+
+def backfill_all_streaks(cursor, user_id: int | None = None) -> None:
+    """
+    Creates streak rows for every user, or one user, and metric that does not have one yet.
+    """
+    if user_id is not None:
+        for metric in STREAK_DAYS:
+            _backfill_user(cursor, user_id, metric)
+        return
+
+    for metric, days in STREAK_DAYS.items():
+        cursor.execute(BACKFILL_QUERY.format(days=days.format(user_filter="")), {"metric": metric})
+
+        cursor.execute("""
+            INSERT OR IGNORE INTO Streaks (UserID, Metric, CurrentStreak, LongestStreak, LastDate)
+            SELECT UserID, ?, 0, 0, NULL FROM User
+        """, (metric,))
+
+
+def record_streaks(cursor, user_id: int, table: str, day: date | None = None) -> None:
+    """
+    Extends the user's streaks after an entry is saved.
+
+    Must be called after the entry is inserted, in the same transaction. Each
+    streak is updated in constant time from its stored row; a day that has
+    already been counted is never counted twice.
+
+    Args:
+        cursor: Cursor of the connection saving the entry.
+        user_id: The user's ID.
+        table: Table the entry was saved to, e.g. "Steps".
+        day: Day the entry was saved for, defaults to today.
+    """
+    day = day or date.today()
+
+    for metric in TABLE_STREAKS.get(table, ()):
+        _backfill_user(cursor, user_id, metric)
+
+        if metric in STREAK_DAY_CHECKS:
+            cursor.execute(STREAK_DAY_CHECKS[metric], {"user_id": user_id, "day": day})
+            if not cursor.fetchone()[0]:
+                continue
+
+        cursor.execute("""
+            SELECT CurrentStreak, LongestStreak, LastDate
+            FROM Streaks
+            WHERE UserID = ? AND Metric = ?
+        """, (user_id, metric))
+        current, longest, last_date = cursor.fetchone()
+
+        if last_date == day.isoformat():
+            continue
+        if last_date == (day - timedelta(days=1)).isoformat():
+            current += 1
+        else:
+            current = 1
+
+        cursor.execute("""
+            UPDATE Streaks
+            SET CurrentStreak = ?, LongestStreak = ?, LastDate = ?
+            WHERE UserID = ? AND Metric = ?
+        """, (current, max(longest, current), day, user_id, metric))
+
+
+def current_streak(streak: int, last_date: str | None, day: date | None = None) -> int:
+    """
+    Returns a stored streak, or 0 if it was broken because a whole day was missed.
+    A streak is still alive on the day after it was last extended.
+    """
+    day = day or date.today()
+    if last_date is None:
+        return 0
+    last_day = datetime.strptime(last_date, '%Y-%m-%d').date()
+    return streak if last_day >= day - timedelta(days=1) else 0
+
+
+def get_streaks(user_id: int, day: date | None = None) -> dict[str, tuple[int, int]]:
+    """
+    Fetches the user's streaks without rescanning their history.
+
+    Returns:
+        A dictionary mapping each metric to (current streak, longest streak).
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    # Users that have not saved anything since streaks were added are backfilled once
+    for metric in STREAK_DAYS:
+        _backfill_user(cursor, user_id, metric)
+    connection.commit()
+
+    cursor.execute("""
+        SELECT Metric, CurrentStreak, LongestStreak, LastDate
+        FROM Streaks
+        WHERE UserID = ?
+    """, (user_id,))
+    rows = cursor.fetchall()
+    connection.close()
+
+    return {
+        metric: (current_streak(current, last_date, day), longest)
+        for metric, current, longest, last_date in rows
+    }
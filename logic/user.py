@@ -1,4 +1,12 @@
 import hashlib
+import hmac
+import os
+
+# PBKDF2 iterations for new hashes. Set per deployment with REHEALTH_PBKDF2_ITERATIONS,
+# see benchmarks/bench_password_hash.py to pick a value for the hardware.
+PASSWORD_HASH_ITERATIONS = int(os.environ.get("REHEALTH_PBKDF2_ITERATIONS", 600_000))
+PASSWORD_HASH_ALGORITHM = "pbkdf2_sha256"
+PASSWORD_SALT_BYTES = 16
 
 
 class User:
@@ -15,16 +23,65 @@ class User:
         self.user_id = user_id
 
     @staticmethod
-    def password_hasher(password: str) -> str:
+    def password_hasher(password: str, iterations: int | None = None, salt: bytes | None = None) -> str:
         """
         Hashes the password securely so it can be stored
 
-        Args: password: The user's password.
+        Args:
+            password: The user's password.
+            iterations: PBKDF2 iterations, defaults to PASSWORD_HASH_ITERATIONS.
+            salt: Random salt, a new one is generated unless given.
+
+        Returns: a hash in the form "pbkdf2_sha256$iterations$salt$hash"
+        """
+        iterations = iterations or PASSWORD_HASH_ITERATIONS
+        salt = salt or os.urandom(PASSWORD_SALT_BYTES)
+        password_hash = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+        return f"{PASSWORD_HASH_ALGORITHM}${iterations}${salt.hex()}${password_hash.hex()}"
+
+    @staticmethod
+    def verify_password(stored_hash: str, input_password: str) -> bool:
+        """
+        Checks a password against a stored hash, in either the current PBKDF2 format
+        or the legacy unsalted SHA-256 format.
+
+        Args:
+            stored_hash: Hash stored in the database.
+            input_password: The password inputted by the user.
 
-        Returns: a hash created from the password
+        Returns: Whether or not the password matches.
+        """
+        if not stored_hash:
+            return False
+
+        if "$" not in stored_hash:
+            legacy_hash = hashlib.sha256(input_password.encode()).hexdigest()
+            return hmac.compare_digest(stored_hash, legacy_hash)
+
+        try:
+            algorithm, iterations, salt, _ = stored_hash.split("$")
+            iterations = int(iterations)
+            salt = bytes.fromhex(salt)
+        except ValueError:
+            return False
+        if algorithm != PASSWORD_HASH_ALGORITHM:
+            return False
+
+        input_hash = User.password_hasher(input_password, iterations, salt)
+        return hmac.compare_digest(stored_hash, input_hash)
+
+    @staticmethod
+    def needs_rehash(stored_hash: str) -> bool:
+        """
+        Checks whether a stored hash is legacy SHA-256 or uses a different
+        iteration count than this deployment, so it should be replaced at login.
         """
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
-        return password_hash
+        parts = stored_hash.split("$")
+        return (
+            len(parts) != 4
+            or parts[0] != PASSWORD_HASH_ALGORITHM
+            or parts[1] != str(PASSWORD_HASH_ITERATIONS)
+        )
 
     def password_check(self, input_password: str) -> bool:
         """
@@ -34,4 +91,4 @@ class User:
 
         Returns: Whether or not the password is correct.
         """
-        return self.password == self.password_hasher(input_password)
+        return self.verify_password(self.password, input_password)
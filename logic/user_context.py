@@ -0,0 +1,111 @@
+"""
+User_Context Module - ReHealth
+
+Per-session cache of a logged-in user's profile. Data every page needs, such
+as the latest height and weight, is read once and reused until save_metrics
+publishes a change through the db_handler change bus. Contexts are kept for
+every user seen in this session, so switching back to a member is instant.
+"""
+
+import threading
+
+from db.db_handler import get_db_connection, subscribe_changes
+from logic.user import User
+
+# Tables whose changes make a cached context out of date
+CONTEXT_TABLES = ("MetricsTracking",)
+
+
+class UserContext:
+    """
+    A user with their cached profile data.
+    """
+
+    def __init__(self, user: User) -> None:
+        """
+        Args:
+            user: The logged-in user.
+        """
+        self.user = user
+        self._metrics = None
+        self._lock = threading.Lock()
+
+    def _load_metrics(self) -> tuple[float, float]:
+        """Reads the user's most recent height and weight."""
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        cursor.execute("""
+            SELECT Height, Weight
+            FROM MetricsTracking
+            WHERE UserID = ?
+            ORDER BY MetricDate DESC, MetricID DESC
+            LIMIT 1
+        """, (self.user.user_id,))
+        result = cursor.fetchone()
+        connection.close()
+
+        if result is None:
+            return 0.0, 0.0
+        height, weight = result
+        return (float(height) if height is not None else 0.0,
+                float(weight) if weight is not None else 0.0)
+
+    def latest_metrics(self) -> tuple[float, float]:
+        """
+        Returns:
+            The user's latest (height, weight), or 0.0 for anything not recorded.
+        """
+        with self._lock:
+            if self._metrics is None:
+                self._metrics = self._load_metrics()
+            return self._metrics
+
+    @property
+    def height(self) -> float:
+        """The user's latest height in cm."""
+        return self.latest_metrics()[0]
+
+    @property
+    def weight(self) -> float:
+        """The user's latest weight in kg."""
+        return self.latest_metrics()[1]
+
+    def invalidate(self) -> None:
+        """Drops the cached data so it is read again when next needed."""
+        with self._lock:
+            self._metrics = None
+
+
+_contexts = {}
+_contexts_lock = threading.Lock()
+
+
+def get_user_context(user: User) -> UserContext:
+    """
+    Returns the cached context for a user, creating it the first time they are seen.
+
+    Args:
+        user: The logged-in user.
+    """
+    with _contexts_lock:
+        context = _contexts.get(user.user_id)
+        if context is None:
+            context = UserContext(user)
+            _contexts[user.user_id] = context
+        else:
+            # Keep the newest User object, e.g. after a password rehash
+            context.user = user
+        return context
+
+
+def _on_data_changed(table: str, user_id: int) -> None:
+    """Change bus listener that invalidates the context of the user whose data changed."""
+    if table not in CONTEXT_TABLES:
+        return
+    with _contexts_lock:
+        context = _contexts.get(user_id)
+    if context is not None:
+        context.invalidate()
+
+
+subscribe_changes(_on_data_changed)
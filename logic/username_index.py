@@ -0,0 +1,66 @@
+"""
+Username_Index Module - ReHealth
+
+In-memory set of every registered username, loaded once from the database and
+kept up to date as accounts are created. Availability checks while registering
+are answered from memory; the UNIQUE constraint on User.Username still guards
+against accounts created elsewhere, e.g. by provision_users.py.
+"""
+
+import threading
+
+from db.db_handler import get_db_connection
+
+
+class UsernameIndex:
+    """
+    Set of registered usernames. Matches are exact, like the UNIQUE constraint.
+    """
+
+    def __init__(self) -> None:
+        self.usernames = set()
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Reads every username from the database, replacing the current contents."""
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        cursor.execute("SELECT Username FROM User")
+        usernames = {username for (username,) in cursor.fetchall()}
+        connection.close()
+
+        with self._lock:
+            self.usernames = usernames
+
+    def is_taken(self, username: str) -> bool:
+        """
+        Checks whether a username is registered, without touching the database.
+
+        Args:
+            username: Username to check.
+
+        Returns:
+            True if the username exists, False otherwise.
+        """
+        return username in self.usernames
+
+    def add(self, username: str) -> None:
+        """Records a newly registered username."""
+        with self._lock:
+            self.usernames.add(username)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_username_index() -> UsernameIndex:
+    """
+    Returns the shared UsernameIndex, loading it from the database the first time.
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = UsernameIndex()
+            _index.load()
+        return _index
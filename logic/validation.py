@@ -0,0 +1,89 @@
+"""Validation Module - ReHealth
+
+Checks for registration details, shared by the login screen and bulk provisioning.
+"""
+
+import re
+from datetime import date
+
+
+def validate_username(username: str) -> tuple[bool, str]:
+    """
+    Validates username inpit, returns error messages.
+
+    Args:
+        username: The username inputted by the user.
+
+    Returns:
+        A tuple describing the validity of the input possibly accompanied by an error message.
+    """
+    if not re.match(r"^[A-Za-z0-9_.]{3,20}$", username):
+        return False, "Username must be between 3-20 characters inclusive, letters, numbers, underscores, or dots."
+    return True, ""
+
+
+def validate_password(password: str) -> tuple[bool, str]:
+    """
+    Validates password strength and returns error messages.
+
+    Args:
+        password: The password inputted by the user.
+
+    Returns:
+        A tuple describing the validity of the input possibly accompanied by an error message.
+    """
+    if len(password) < 8 or len(password) > 20:
+        return False, "Password must be between 8 and 20 characters inclusive."
+
+    password_score = 0
+    if re.search(r"[A-Z]", password):
+        password_score += 1
+    if re.search(r"[a-z]", password):
+        password_score += 1
+    if re.search(r"[0-9]", password):
+        password_score += 1
+    if re.search(r"[^A-Za-z0-9]", password):
+        password_score += 1
+
+    if password_score < 3:
+        return False, "Password should mix uppercase, lowercase, numbers, and special characters."
+
+    return True, ""
+
+
+def validate_sex(sex: str) -> tuple[bool, str]:
+    """
+    Validates The sex that the user inputs and returns a descriptive error message.
+
+    Args:
+        sex: Biological sex selected by the user
+
+    Returns:
+        A tuple describing the validity of the input possibly accompanied by an error message.
+    """
+    if not sex or sex not in ("Male", "Female"):
+        return False, "Please select a biological sex."
+    return True, ""
+
+
+def validate_date_of_birth(day: int, month: int, year: int) -> tuple[bool, date, str]:
+    """
+    Validates the date of birth inputted by the user.
+
+    Args:
+        day: Day selected by the user
+        month: Month selected by the user
+        year: Year selected by the user
+
+    Returns:
+        A tuple containing whether the input is valid, the date the user inputted and a possible error message.
+    """
+    try:
+        dob_date = date(year, month, day)
+
+        if dob_date > date.today():
+            return False, None, "Date of birth cannot be in the future."
+
+        return True, dob_date, ""
+    except ValueError:
+        return False, None, "Please enter a valid date of birth."
@@ -0,0 +1,266 @@
+"""
+ReHealth - Bulk User Provisioning
+Creates accounts for a whole member roster at once.
+
+The roster is a CSV file with a header row and the columns
+username, password, sex and date_of_birth (YYYY-MM-DD), e.g.
+
+    username,password,sex,date_of_birth
+    jsmith,Str0ng!Pass,Male,1990-04-12
+
+Rows are checked with the same rules as the registration screen. Passwords
+are hashed across a process pool and users are inserted in batched
+transactions. Usernames that already exist, or appear twice in the roster,
+are reported and skipped rather than retried.
+
+Usage:
+    python provision_users.py ROSTER.csv [--workers N] [--batch-size N] [--report FILE]
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+
+# Add the current directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from db.db_handler import get_db_connection  # noqa: E402
+from logic.user import User  # noqa: E402
+from logic.validation import (  # noqa: E402
+    validate_date_of_birth,
+    validate_password,
+    validate_sex,
+    validate_username
+)
+
+ROSTER_COLUMNS = ["username", "password", "sex", "date_of_birth"]
+BATCH_SIZE = 500
+# SQLite allows at most 999 parameters in older builds
+LOOKUP_CHUNK = 900
+
+
+def read_roster(path: str) -> tuple[list[tuple], list[tuple]]:
+    """
+    Reads and validates every row of a roster file.
+
+    Returns:
+        (members, problems). Members are (username, password, sex, dob) tuples;
+        problems are (line number, username, reason) tuples for rows that were
+        invalid or repeated a username from earlier in the file.
+    """
+    members = []
+    problems = []
+    seen = set()
+
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        missing = set(ROSTER_COLUMNS) - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"Roster is missing the column(s): {', '.join(sorted(missing))}")
+
+        # Line 1 is the header
+        for line, row in enumerate(reader, start=2):
+            username = (row["username"] or "").strip()
+            # Passwords are kept exactly as written, spaces included
+            password = row["password"] or ""
+            sex = (row["sex"] or "").strip().title()
+
+            try:
+                dob = datetime.strptime((row["date_of_birth"] or "").strip(), "%Y-%m-%d").date()
+                dob_valid, _, dob_error = validate_date_of_birth(dob.day, dob.month, dob.year)
+            except ValueError:
+                dob, dob_valid, dob_error = None, False, "Date of birth must be YYYY-MM-DD."
+
+            for valid, error in (
+                validate_username(username),
+                validate_password(password),
+                validate_sex(sex),
+                (dob_valid, dob_error),
+            ):
+                if not valid:
+                    problems.append((line, username, error))
+                    break
+            else:
+                if username in seen:
+                    problems.append((line, username, "Username appears earlier in the roster."))
+                    continue
+                seen.add(username)
+                members.append((username, password, sex, dob))
+
+    return members, problems
+
+
+def find_existing_usernames(usernames: list[str]) -> set[str]:
+    """
+    Returns which of the usernames are already registered.
+    """
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    existing = set()
+    for start in range(0, len(usernames), LOOKUP_CHUNK):
+        chunk = usernames[start:start + LOOKUP_CHUNK]
+        placeholders = ", ".join("?" * len(chunk))
+        cursor.execute(f"SELECT Username FROM User WHERE Username IN ({placeholders})", chunk)
+        existing.update(username for (username,) in cursor.fetchall())
+
+    connection.close()
+    return existing
+
+
+def _hash_password(password: str) -> str:
+    """Worker process task: hashes one password with the deployment's cost."""
+    return User.password_hasher(password)
+
+
+def insert_batch(connection, batch: list[tuple]) -> list[str]:
+    """
+    Inserts one batch of users in a single transaction, rolled back if any insert fails.
+
+    The write lock is taken before checking for existing usernames, so an
+    account registered while provisioning runs is reported, never retried.
+
+    Args:
+        connection: Open database connection.
+        batch: (username, password hash, sex, dob, join date) tuples.
+
+    Returns:
+        The usernames that were skipped because they already exist.
+    """
+    cursor = connection.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
+
+    usernames = [row[0] for row in batch]
+    try:
+        taken = set()
+        for start in range(0, len(usernames), LOOKUP_CHUNK):
+            chunk = usernames[start:start + LOOKUP_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor.execute(f"SELECT Username FROM User WHERE Username IN ({placeholders})", chunk)
+            taken.update(username for (username,) in cursor.fetchall())
+
+        cursor.executemany("""
+            INSERT INTO User (Username, Password, Sex, DateOfBirth, JoinDate)
+            VALUES (?, ?, ?, ?, ?)
+        """, [row for row in batch if row[0] not in taken])
+
+        connection.commit()
+    except Exception:
+        # Leave no part of the batch behind, and release the write lock
+        connection.rollback()
+        raise
+    return [username for username in usernames if username in taken]
+
+
+def provision_users(members: list[tuple], workers: int | None = None,
+                    batch_size: int = BATCH_SIZE) -> tuple[int, list[str], float]:
+    """
+    Hashes passwords across a process pool and inserts the users in batches.
+
+    Args:
+        members: Validated (username, password, sex, dob) tuples.
+        workers: Number of hashing processes, defaults to the CPU count.
+        batch_size: Users inserted per transaction.
+
+    Returns:
+        A tuple of (users created, usernames skipped as already registered, seconds taken).
+    """
+    start = time.perf_counter()
+
+    # Existing usernames are skipped before paying for their hashes
+    existing = find_existing_usernames([member[0] for member in members])
+    skipped = [member[0] for member in members if member[0] in existing]
+    members = [member for member in members if member[0] not in existing]
+    if not members:
+        return 0, skipped, time.perf_counter() - start
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, min(batch_size, len(members) // (workers * 4)))
+    today = date.today()
+    created = 0
+
+    connection = get_db_connection()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map yields hashes in roster order, so batches are inserted while later ones hash
+            hashes = pool.map(_hash_password, [member[1] for member in members], chunksize=chunksize)
+
+            batch = []
+            for (username, _, sex, dob), password_hash in zip(members, hashes):
+                batch.append((username, password_hash, sex, dob, today))
+                if len(batch) == batch_size:
+                    taken = insert_batch(connection, batch)
+                    created += len(batch) - len(taken)
+                    skipped.extend(taken)
+                    batch = []
+
+            if batch:
+                taken = insert_batch(connection, batch)
+                created += len(batch) - len(taken)
+                skipped.extend(taken)
+    finally:
+        connection.close()
+
+    return created, skipped, time.perf_counter() - start
+
+
+def write_report(path: str, problems: list[tuple], skipped: list[str]) -> None:
+    """
+    Writes every row that was not provisioned, and why, to a CSV file.
+    """
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["line", "username", "reason"])
+        writer.writerows(problems)
+        writer.writerows(("", username, "Username already exists.") for username in skipped)
+
+
+def main() -> None:
+    """
+    Parses command line arguments and provisions the roster.
+    """
+    parser = argparse.ArgumentParser(description="Create ReHealth accounts from a member roster CSV.")
+    parser.add_argument("roster", help="CSV file with username, password, sex and date_of_birth columns")
+    parser.add_argument("--workers", type=int, default=None, help="number of hashing processes")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="users inserted per transaction")
+    parser.add_argument("--report", default=None, help="CSV file listing every row that was skipped")
+    args = parser.parse_args()
+    if args.batch_size <= 0:
+        parser.error("--batch-size must be at least 1")
+
+    from db.db_make import initialise_db
+    initialise_db()
+
+    try:
+        members, problems = read_roster(args.roster)
+    except (OSError, ValueError) as e:
+        print(f"Error reading roster: {e}")
+        sys.exit(1)
+
+    created, skipped, elapsed = provision_users(members, args.workers, args.batch_size)
+
+    rate = created / elapsed * 60 if elapsed else 0.0
+    print(f"Created {created} accounts in {elapsed:.2f}s ({rate:,.0f} accounts/min)")
+
+    if skipped:
+        print(f"Skipped {len(skipped)} username(s) that already exist: "
+              f"{', '.join(skipped[:10])}{' ...' if len(skipped) > 10 else ''}")
+    for line, username, reason in problems[:10]:
+        print(f"Line {line} ({username or 'no username'}): {reason}")
+    if len(problems) > 10:
+        print(f"... and {len(problems) - 10} more invalid or repeated row(s)")
+
+    if args.report and (problems or skipped):
+        write_report(args.report, problems, skipped)
+        print(f"Skipped rows written to {args.report}")
+
+
+if __name__ == "__main__":
+    """
+    Ensures file will not be ran if imported to a different file
+    """
+    main()
@@ -0,0 +1,51 @@
+"""
+Shared pytest setup - ReHealth
+
+Adds the project root to the Python path, as the top level scripts do, so the
+tests import the app's packages however pytest is started, and provides the
+fixtures shared between test modules.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from db import db_handler  # noqa: E402
+from tests.food_api_stub import StubFoodServer  # noqa: E402
+
+
+@pytest.fixture
+def scratch_db(tmp_path, monkeypatch):
+    """
+    Points db_handler at a fresh database with every table created.
+
+    Returns the path of the database file.
+    """
+    from db.db_make import initialise_db
+
+    path = str(tmp_path / "rehealth.db")
+    monkeypatch.setattr(db_handler, "DB_PATH", path)
+    initialise_db()
+    return path
+
+
+@pytest.fixture
+def food_server():
+    """
+    Starts local stand-ins for the food API, stopping them after the test.
+
+    Returns a function taking StubFoodServer's arguments and returning a started server.
+    """
+    servers = []
+
+    def start(foods=None, delay=0.0, fail_with=None):
+        server = StubFoodServer(foods if foods is not None else {"apple": 95}, delay=delay, fail_with=fail_with)
+        servers.append(server.start())
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
@@ -0,0 +1,109 @@
+"""
+Food_API_Stub - ReHealth tests
+
+A local stand-in for the Spoonacular search endpoint, so FoodApiClient can be
+exercised without network access or an API key. It serves canned results from
+a background thread and counts the requests it receives. Tests get one through
+the food_server fixture in conftest.py.
+
+Example:
+    with StubFoodServer({"apple": 95}, delay=0.1) as server:
+        client = FoodApiClient(base_url=server.url, cache=ResponseCache(path))
+        client.lookup("Apple")
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class StubFoodServer:
+    """
+    HTTP server on localhost answering /food/ingredients/search from a dictionary.
+    """
+
+    def __init__(self, foods, delay=0.0, fail_with=None):
+        """
+        Args:
+            foods: Mapping of lowercase food name to calories.
+            delay: Seconds to wait before answering, to simulate a slow API.
+            fail_with: HTTP status to answer every request with instead, e.g. 503.
+        """
+        self.foods = foods
+        self.delay = delay
+        self.fail_with = fail_with
+        self.request_count = 0
+        self.queries = []
+        self._count_lock = threading.Lock()
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        """Base URL to pass to FoodApiClient."""
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def _make_handler(self):
+        """Builds the request handler class bound to this server's data."""
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stub._count_lock:
+                    stub.request_count += 1
+                if stub.delay:
+                    time.sleep(stub.delay)
+
+                url = urlparse(self.path)
+                if url.path != "/food/ingredients/search":
+                    self.send_error(404)
+                    return
+                if stub.fail_with:
+                    self.send_error(stub.fail_with)
+                    return
+
+                query = parse_qs(url.query).get("query", [""])[0].lower()
+                with stub._count_lock:
+                    stub.queries.append(query)
+
+                results = []
+                if query in stub.foods:
+                    results.append({
+                        "name": query,
+                        "nutrition": {"nutrients": [{"name": "Calories", "amount": stub.foods[query]}]},
+                    })
+
+                body = json.dumps({"results": results}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Keep test and benchmark output quiet
+                pass
+
+        return Handler
+
+    def start(self):
+        """Starts answering requests in the background."""
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stops the server and frees its port."""
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,95 @@
+"""
+Tests - ReHealth calculations
+
+Every NumPy array formula must give exactly the results of its scalar version,
+including on the branch boundaries and on values halfway between two rounded
+results, where np.round and round() can disagree.
+"""
+
+import numpy as np
+import pytest
+
+from logic.calculations import (
+    bmi_calc,
+    bmi_calc_array,
+    bmi_status,
+    bmi_status_array,
+    calories_burnt,
+    calories_burnt_array,
+    sleep_calc,
+    sleep_calc_array,
+)
+
+
+@pytest.mark.parametrize("duration", [0, 0.5, 0.99, 1, 1.01, 3.5, 6.99, 7, 7.01, 8, 8.99, 9, 9.01, 10, 12, 20])
+@pytest.mark.parametrize("quality", [0, 1, 2.5, 5])
+def test_sleep_calc_array_matches_scalar_on_boundaries(duration, quality):
+    assert sleep_calc_array([duration], [quality]).tolist() == [sleep_calc(duration, quality)]
+
+
+def test_sleep_calc_array_matches_scalar_sweep():
+    durations = np.round(np.arange(0, 16, 0.1), 1)
+    qualities = np.resize(np.arange(1, 6, dtype=float), durations.size)
+
+    expected = [sleep_calc(d, q) for d, q in zip(durations.tolist(), qualities.tolist())]
+    assert sleep_calc_array(durations, qualities).tolist() == expected
+
+
+@pytest.mark.parametrize("bmi", [0, 10, 18.4, 18.49, 18.5, 18.51, 24.9, 24.99, 25, 25.01, 29.9, 29.99, 30, 30.01, 45])
+def test_bmi_status_array_matches_scalar_on_boundaries(bmi):
+    assert bmi_status_array([bmi]).tolist() == [bmi_status(bmi)]
+
+
+@pytest.mark.parametrize("weight, height", [
+    (0, 170),
+    (0.0, 100),
+    # Exactly halfway between two results at one decimal place
+    (22.25, 100),
+    (22.75, 100),
+    (18.45, 100),
+    (89.0, 200),
+    (99.0, 200),
+    # BMI landing on the status boundaries
+    (18.5, 100),
+    (25.0, 100),
+    (30.0, 100),
+])
+def test_bmi_calc_array_matches_scalar_on_boundaries(weight, height):
+    assert bmi_calc_array([weight], [height]).tolist() == [bmi_calc(weight, height)]
+
+
+def test_bmi_calc_array_matches_scalar_sweep():
+    weights, heights = np.meshgrid(np.round(np.arange(30, 200, 0.1), 1), np.round(np.arange(150, 200, 0.5), 1))
+    weights = weights.ravel()
+    heights = heights.ravel()
+
+    expected = [bmi_calc(w, h) for w, h in zip(weights.tolist(), heights.tolist())]
+    assert bmi_calc_array(weights, heights).tolist() == expected
+
+
+@pytest.mark.parametrize("steps, weight", [
+    (0, 0.0),
+    (0, 70.0),
+    (10000, 0.0),
+    (10000, 70.0),
+    # 125 steps with no weight is 4.875 kcal, halfway at two decimal places
+    (125, 0.0),
+    (375, 0.0),
+    (625, 62.5),
+])
+def test_calories_burnt_array_matches_scalar_on_boundaries(steps, weight):
+    assert calories_burnt_array([steps], [weight]).tolist() == [calories_burnt(steps, weight)]
+
+
+def test_calories_burnt_array_matches_scalar_sweep():
+    steps = np.arange(0, 40000, 7)
+    weights = np.resize(np.array([0.0, 55.5, 62.5, 70.0, 81.3, 120.0]), steps.size)
+
+    expected = [calories_burnt(s, w) for s, w in zip(steps.tolist(), weights.tolist())]
+    assert calories_burnt_array(steps, weights).tolist() == expected
+
+
+def test_bmi_status_array_matches_scalar_on_calculated_bmis():
+    weights = np.round(np.arange(30, 200, 0.1), 1)
+    bmis = bmi_calc_array(weights, np.full_like(weights, 175.0))
+    assert bmi_status_array(bmis).tolist() == [bmi_status(bmi) for bmi in bmis.tolist()]
@@ -0,0 +1,136 @@
+"""
+Tests - ReHealth food API client
+
+Runs FoodApiClient against the local stand-in server, checking that lookups
+for the same food share one request, that results are served from the cache
+until they expire, and that API failures are reported rather than cached.
+"""
+
+import pytest
+import requests
+
+from logic import food_api
+from logic.food_api import FoodApiClient, ResponseCache
+
+APPLE = {"name": "apple", "calories": 95}
+
+
+@pytest.fixture
+def make_client(tmp_path):
+    """Returns a function creating a client for a stub server, closing every client after the test."""
+    clients = []
+
+    def make(server, ttl_seconds=60, max_workers=8):
+        cache = ResponseCache(str(tmp_path / "food_cache.db"), ttl_seconds=ttl_seconds)
+        client = FoodApiClient(base_url=server.url, api_key="test", cache=cache, max_workers=max_workers)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+def test_lookup_parses_result(food_server, make_client):
+    client = make_client(food_server())
+
+    assert client.lookup("apple") == APPLE
+    assert client.lookup("dragon fruit") is None
+
+
+def test_concurrent_lookups_share_one_request(food_server, make_client):
+    server = food_server(delay=0.3)
+    client = make_client(server)
+
+    futures = [client.lookup_async(name) for name in ["apple", "Apple", "  APPLE "] * 4]
+
+    assert [future.result() for future in futures] == [APPLE] * 12
+    assert server.request_count == 1
+
+
+def test_cached_result_is_not_requested_again(food_server, make_client):
+    server = food_server()
+
+    assert make_client(server).lookup("apple") == APPLE
+    assert make_client(server).lookup("Apple") == APPLE
+    assert server.request_count == 1
+
+
+def test_unknown_food_is_cached(food_server, make_client):
+    server = food_server()
+    client = make_client(server)
+
+    assert client.lookup("dragon fruit") is None
+    assert client.lookup("dragon fruit") is None
+    assert server.request_count == 1
+
+
+def test_expired_result_is_requested_again(food_server, make_client, monkeypatch):
+    server = food_server()
+    client = make_client(server, ttl_seconds=60)
+    now = food_api.time.time()
+
+    monkeypatch.setattr(food_api.time, "time", lambda: now)
+    assert client.lookup("apple") == APPLE
+    monkeypatch.setattr(food_api.time, "time", lambda: now + 59)
+    assert client.lookup("apple") == APPLE
+    assert server.request_count == 1
+
+    monkeypatch.setattr(food_api.time, "time", lambda: now + 61)
+    assert client.lookup("apple") == APPLE
+    assert server.request_count == 2
+
+
+def test_clear_expired_removes_old_results(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path / "food_cache.db"), ttl_seconds=60)
+    now = food_api.time.time()
+
+    monkeypatch.setattr(food_api.time, "time", lambda: now)
+    cache.put("apple", APPLE)
+    monkeypatch.setattr(food_api.time, "time", lambda: now + 61)
+    cache.clear_expired()
+
+    monkeypatch.setattr(food_api.time, "time", lambda: now)
+    assert cache.get("apple") == (False, None)
+
+
+def test_http_error_is_raised_and_not_cached(food_server, make_client):
+    # 404 is not retried, so raise_for_status sees it on the first response
+    server = food_server(fail_with=404)
+    client = make_client(server)
+
+    with pytest.raises(requests.HTTPError):
+        client.lookup("apple")
+    assert server.request_count == 1
+
+    server.fail_with = None
+    assert client.lookup("apple") == APPLE
+    assert server.request_count == 2
+
+
+def test_concurrent_lookups_share_one_failure(food_server, make_client):
+    server = food_server(delay=0.3, fail_with=404)
+    client = make_client(server)
+
+    futures = [client.lookup_async("apple") for _ in range(5)]
+
+    for future in futures:
+        with pytest.raises(requests.HTTPError):
+            future.result()
+    assert server.request_count == 1
+
+
+def test_lookup_many_returns_none_for_failures(food_server, make_client):
+    client = make_client(food_server(fail_with=404))
+
+    assert client.lookup_many(["apple", "banana"]) == {"apple": None, "banana": None}
+
+
+def test_lookup_many_keeps_one_entry_per_name(food_server, make_client):
+    server = food_server(foods={"apple": 95, "banana": 105})
+    client = make_client(server)
+
+    results = client.lookup_many(["apple", "banana", "apple", "kiwi"])
+
+    assert results == {"apple": APPLE, "banana": {"name": "banana", "calories": 105}, "kiwi": None}
+    assert server.request_count == 3
@@ -0,0 +1,76 @@
+"""
+Tests - ReHealth keyset pagination
+
+Reading a history page by page must return every row exactly once, in the
+same order as one unpaginated query, including the legacy rows with no date
+that the schema allows.
+"""
+
+import pytest
+
+from db.db_handler import get_db_connection, get_metrics_page, get_sleep_page, get_steps_page, iter_pages
+
+USER_ID = 1
+
+# Dates in insert order, so undated rows sit between dated ones by primary key
+DATES = [None, "2025-01-03", "2025-01-01", None, "2025-01-03", None, "2025-01-02", None, None, "2025-01-01"]
+
+HISTORIES = {
+    "steps": (
+        get_steps_page,
+        "INSERT INTO Steps (UserID, Date, StepCount, StepsGoal) VALUES (?, ?, ?, 10000)",
+        "SELECT Date, StepCount, StepsGoal FROM Steps WHERE UserID = ? ORDER BY Date DESC, StepID DESC",
+    ),
+    "sleep": (
+        get_sleep_page,
+        "INSERT INTO Sleep (UserID, SleepDate, SleepDuration, SleepRating) VALUES (?, ?, ?, 80)",
+        "SELECT SleepDate, SleepDuration, SleepRating FROM Sleep WHERE UserID = ? "
+        "ORDER BY SleepDate DESC, SleepID DESC",
+    ),
+    "metrics": (
+        get_metrics_page,
+        "INSERT INTO MetricsTracking (UserID, MetricDate, Weight, Height) VALUES (?, ?, ?, 170)",
+        "SELECT MetricDate, Height, Weight FROM MetricsTracking WHERE UserID = ? "
+        "ORDER BY MetricDate DESC, MetricID DESC",
+    ),
+}
+
+
+def read_all_pages(get_page, page_size):
+    """Follows the cursor from the first page to the last, returning every row."""
+    return [row for page in iter_pages(get_page, USER_ID, page_size) for row in page]
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 4, 6, 10, 11])
+@pytest.mark.parametrize("history", HISTORIES)
+def test_pages_return_every_row_including_undated(scratch_db, history, page_size):
+    get_page, insert_query, select_query = HISTORIES[history]
+    connection = get_db_connection()
+    connection.executemany(insert_query, [(USER_ID, day, 60 + index) for index, day in enumerate(DATES)])
+    # Another user's rows must not leak into the pages
+    connection.executemany(insert_query, [(USER_ID + 1, day, 0) for day in DATES])
+    connection.commit()
+    expected = connection.execute(select_query, (USER_ID,)).fetchall()
+    connection.close()
+
+    rows = read_all_pages(get_page, page_size)
+
+    assert rows == expected
+    assert [row[0] for row in rows].count(None) == DATES.count(None)
+
+
+def test_page_ending_on_undated_row_continues(scratch_db):
+    connection = get_db_connection()
+    connection.executemany(
+        "INSERT INTO Steps (UserID, Date, StepCount, StepsGoal) VALUES (?, ?, ?, 10000)",
+        [(USER_ID, "2025-01-01", 100), (USER_ID, None, 200), (USER_ID, None, 300)]
+    )
+    connection.commit()
+    connection.close()
+
+    first, after = get_steps_page(USER_ID, None, 2)
+    second, after = get_steps_page(USER_ID, after, 2)
+
+    assert [row[1] for row in first] == [100, 300]
+    assert [row[1] for row in second] == [200]
+    assert after is None
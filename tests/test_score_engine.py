@@ -0,0 +1,70 @@
+"""
+Tests - ReHealth score engine
+
+Checks the score gain shown on the achievements page is measured from the
+end-of-day snapshot before its window, so activity on the window's first day
+is counted.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from db.db_handler import get_db_connection
+from logic.score_engine import get_user_score, record_activity
+from ui.page_data import SCORE_HISTORY_DAYS, get_score_gain
+
+USER_ID = 1
+
+
+@pytest.fixture
+def user(scratch_db):
+    """Creates a user with no activity, returning their ID."""
+    connection = get_db_connection()
+    connection.execute("""
+        INSERT INTO User (UserID, Username, Password, Sex, DateOfBirth, JoinDate)
+        VALUES (?, 'tester', 'x', 'Female', '1990-01-01', '2024-01-01')
+    """, (USER_ID,))
+    connection.commit()
+    connection.close()
+    return USER_ID
+
+
+def add_snapshots(user_id, snapshots):
+    """Stores (days ago, score) end-of-day snapshots."""
+    connection = get_db_connection()
+    connection.executemany(
+        "INSERT INTO ScoreHistory (UserID, ScoreDate, Score, RankName) VALUES (?, ?, ?, 'Bronze Beginner')",
+        [(user_id, date.today() - timedelta(days=days_ago), score) for days_ago, score in snapshots]
+    )
+    connection.commit()
+    connection.close()
+
+
+def test_gain_counts_activity_logged_only_today(user):
+    connection = get_db_connection()
+    record_activity(connection.cursor(), user, steps=20000)
+    connection.commit()
+    connection.close()
+
+    score = get_user_score(user)["score"]
+    assert score > 0
+    assert get_score_gain(user) == score
+
+
+def test_gain_counts_the_first_snapshot_inside_the_window(user):
+    add_snapshots(user, [(SCORE_HISTORY_DAYS - 1, 40), (3, 70)])
+
+    assert get_score_gain(user) == 70
+
+
+def test_gain_is_measured_from_the_snapshot_before_the_window(user):
+    add_snapshots(user, [(SCORE_HISTORY_DAYS + 5, 25), (SCORE_HISTORY_DAYS, 30), (SCORE_HISTORY_DAYS - 1, 40), (0, 95)])
+
+    assert get_score_gain(user) == 65
+
+
+def test_gain_is_zero_without_activity_in_the_window(user):
+    add_snapshots(user, [(SCORE_HISTORY_DAYS + 5, 25)])
+
+    assert get_score_gain(user) == 0
@@ -0,0 +1,71 @@
+"""
+ReHealth - Account Transfer
+Exports a user's whole account to a single archive, or imports one as a new account.
+
+Usage:
+    python transfer_account.py export USERNAME [--output FILE]
+    python transfer_account.py import ARCHIVE [--username NAME]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the current directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from db.db_handler import get_all_users  # noqa: E402
+from logic.account_archive import archive_filename, export_account, import_account, read_archive_manifest  # noqa: E402
+
+
+def main() -> None:
+    """
+    Parses command line arguments and exports or imports an account.
+    """
+    parser = argparse.ArgumentParser(description="Move a ReHealth account between installs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="write a user's account to an archive")
+    export_parser.add_argument("username")
+    export_parser.add_argument("--output", default=None, help="archive path, defaults to metric_logs")
+
+    import_parser = commands.add_parser("import", help="create an account from an archive")
+    import_parser.add_argument("archive")
+    import_parser.add_argument("--username", default=None, help="username for the account if the archived one is taken")
+    args = parser.parse_args()
+
+    from db.db_make import initialise_db
+    initialise_db()
+
+    start = time.perf_counter()
+    if args.command == "export":
+        user_ids = {username: user_id for user_id, username in get_all_users()}
+        if args.username not in user_ids:
+            print(f"Error: there is no user called {args.username}")
+            sys.exit(1)
+
+        filename = args.output or archive_filename(args.username)
+        export_account(user_ids[args.username], filename)
+        counts = read_archive_manifest(filename)["counts"]
+        print(f"Exported {sum(counts.values())} rows for {args.username} to {filename} "
+              f"in {time.perf_counter() - start:.2f}s ({os.path.getsize(filename) / 1_000_000:.1f} MB)")
+        return
+
+    try:
+        manifest = read_archive_manifest(args.archive)
+        user_id = import_account(args.archive, args.username)
+    except (OSError, ValueError) as e:
+        print(f"Error importing account: {e}")
+        sys.exit(1)
+
+    username = args.username or manifest["account"]["username"]
+    print(f"Imported {sum(manifest['counts'].values())} rows as {username} (UserID {user_id}) "
+          f"in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    """
+    Ensures file will not be ran if imported to a different file
+    """
+    main()
@@ -1,13 +1,10 @@
 import ttkbootstrap as tb
 
-from db.db_handler import (
-    get_total_steps,
-    get_total_sleep_hours,
-    get_total_weight_lifted,
-    get_weight
-)
-from logic.calculations import get_rehealth_level, calculate_lifetime_score, calories_burnt
+from logic.calculations import calories_burnt
 from logic.user import User
+from logic.user_context import get_user_context
+from ui.leaderboard import Leaderboard
+from ui.page_data import PAGE_DATA, SCORE_HISTORY_DAYS
 from ui.ui_handler import return_to_dashboard, BasePage
 
 RANK_COLOURS: dict[str, str] = {
@@ -75,24 +72,29 @@ class Achievements(BasePage):
 
     def _obtain_stats(self, user: User) -> None:
         """Loads user stats that are needed before building the UI"""
-        self.total_steps = get_total_steps(user.user_id)
-        self.total_cals = round(calories_burnt(self.total_steps, get_weight(user.user_id)))
-        self.total_sleep = get_total_sleep_hours(user.user_id)
-        self.total_weight = get_total_weight_lifted(user.user_id)
-
-        self.user_score = calculate_lifetime_score(
-            self.total_steps,
-            self.total_sleep,
-            self.total_weight,
-        )
-        self.user_rank = get_rehealth_level(self.user_score)
+        # Totals, score and rank are precomputed by the score engine as activity is saved
+        user_score = PAGE_DATA.get(user.user_id, "score")
+        self.total_steps = user_score["steps"]
+        self.total_cals = round(calories_burnt(self.total_steps, get_user_context(user).weight))
+        self.total_sleep = user_score["sleep_hours"]
+        self.total_weight = user_score["weight_lifted"]
+
+        self.user_score = user_score["score"]
+        self.user_rank = user_score["rank"]
+        self.streaks = PAGE_DATA.get(user.user_id, "streaks")
+
+        # Recorded by the score engine each time activity changes the score or rank
+        self.rank_events = PAGE_DATA.get(user.user_id, "rank_events")
+        self.score_gain = PAGE_DATA.get(user.user_id, "score_gain")
 
     def _build_ui(self) -> None:
         """Builds all UI components."""
         self._create_title()
         self._create_rank_display()
         self._create_progress_section()
+        self._create_leaderboard_button()
         self._create_statistics_labels()
+        self._create_rank_history()
         self._create_dashboard_button()
 
     def _create_title(self) -> None:
@@ -164,6 +166,16 @@ class Achievements(BasePage):
         )
         self.progress_text_label.grid(row=2, column=0, pady=(5, 20), sticky="n")
 
+    def _create_leaderboard_button(self) -> None:
+        """Creates the button that opens the leaderboard."""
+        self.leaderboard_button = tb.Button(
+            self.frame,
+            text="Leaderboard",
+            command=self.show_leaderboard,
+            width=22,
+        )
+        self.leaderboard_button.grid(row=4, column=0, pady=(0, 10), sticky="n")
+
     def _create_statistics_labels(self) -> None:
         """Creates labels displaying lifetime statistics."""
         # Total steps
@@ -198,6 +210,43 @@ class Achievements(BasePage):
         )
         self.weight_label.grid(row=8, column=0, pady=10, sticky="n")
 
+        # Longest streaks
+        self.streak_label = tb.Label(
+            self.frame,
+            text=(
+                f"Best Streaks: Logging {self.streaks['logging'][1]} | "
+                f"Step Goal {self.streaks['steps_goal'][1]} | "
+                f"Sleep {self.streaks['sleep_target'][1]}"
+            ),
+            font=("roboto", 12),
+        )
+        self.streak_label.grid(row=9, column=0, pady=10, sticky="n")
+
+    def _create_rank_history(self) -> None:
+        """Creates labels showing the score gained over the last month and the latest rank changes."""
+        self.score_history_label = tb.Label(
+            self.frame,
+            text=f"Score gained in the last {SCORE_HISTORY_DAYS} days: {self.score_gain:+,}",
+            font=("roboto", 12),
+        )
+        self.score_history_label.grid(row=10, column=0, pady=(20, 5), sticky="n")
+
+        if self.rank_events:
+            events_text = "Recent Rank Changes:\n" + "\n".join(
+                f"{event_date}: {old_rank} -> {new_rank} ({score:,})"
+                for event_date, old_rank, new_rank, score in self.rank_events
+            )
+        else:
+            events_text = "No rank changes yet"
+
+        self.rank_events_label = tb.Label(
+            self.frame,
+            text=events_text,
+            font=("roboto", 12),
+            justify="center",
+        )
+        self.rank_events_label.grid(row=11, column=0, pady=(5, 10), sticky="n")
+
     def _create_dashboard_button(self) -> None:
         """Create the back to dashboard button."""
         self.dash_button = tb.Button(
@@ -206,9 +255,16 @@ class Achievements(BasePage):
             command=self.return_to_dash,
             width=22,
         )
-        self.dash_button.grid(row=9, column=0, pady=(200, 10), sticky="n")
+        self.dash_button.grid(row=12, column=0, pady=(40, 10), sticky="n")
 
-        self.frame.grid_rowconfigure(9, minsize=200)
+        self.frame.grid_rowconfigure(12, minsize=100)
+
+    def show_leaderboard(self) -> None:
+        """
+        Opens the leaderboard screen.
+        """
+        self.frame.destroy()
+        Leaderboard(self.root, self.user)
 
     def return_to_dash(self) -> None:
         """
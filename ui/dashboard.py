@@ -1,8 +1,10 @@
 """Dashboard Module - ReHealth"""
 
+from datetime import date
+
 import ttkbootstrap as tb
 
-from logic.dashboard_data import get_sleep, get_steps, get_calories
+from db.db_handler import DataVersionWatcher, subscribe_changes, unsubscribe_changes
 from logic.user import User
 from ui.food import Food
 from ui.measurement import Measurement
@@ -10,8 +12,16 @@ from ui.sleep import Sleep
 from ui.steps import Steps
 from ui.workout import Workouts
 from ui.achievements import Achievements
+from ui.downloads import Downloads
+from ui.page_data import PAGE_DATA
 from ui.ui_handler import BasePage
 
+# How often the dashboard checks the database for changes made elsewhere
+REFRESH_INTERVAL_MS = 2000
+
+# Tables whose changes affect the dashboard labels
+DASHBOARD_TABLES = ("Steps", "Food", "Sleep", "Exercises", "MetricsTracking")
+
 
 class Dashboard(BasePage):
     """
@@ -35,6 +45,7 @@ class Dashboard(BasePage):
         self._create_metric_displays()
         self._create_achievements_button()
         self._create_navigation_tabs()
+        self._start_live_refresh()
 
     def _create_welcome_label(self) -> None:
         """Create a welcome label to initially greet the user."""
@@ -47,15 +58,9 @@ class Dashboard(BasePage):
 
     def _create_metric_displays(self) -> None:
         """Create labels for the user's: steps, calories, sleep."""
-        # Fetch current metrics
-        steps = get_steps(self.user.user_id)
-        calories = get_calories(self.user.user_id)
-        sleep = get_sleep(self.user.user_id)
-
         # Steps display
         self.dash_steps = tb.Label(
             self.frame,
-            text=f"Steps: {steps}",
             font=("roboto", 14)
         )
         self.dash_steps.grid(row=1, column=0, pady=(5, 5))
@@ -63,7 +68,6 @@ class Dashboard(BasePage):
         # Calories display
         self.dash_cals = tb.Label(
             self.frame,
-            text=f"Calories: {calories}",
             font=("roboto", 14)
         )
         self.dash_cals.grid(row=2, column=0, pady=(5, 5))
@@ -71,26 +75,117 @@ class Dashboard(BasePage):
         # Sleep score display
         self.dash_sleep = tb.Label(
             self.frame,
-            text=f"SleepScore: {round(sleep, 2) * 100}%",
             font=("roboto", 14)
         )
         self.dash_sleep.grid(row=3, column=0, pady=(5, 5))
 
+        # Logging streak display
+        self.dash_streak = tb.Label(
+            self.frame,
+            font=("roboto", 14)
+        )
+        self.dash_streak.grid(row=4, column=0, pady=(5, 5))
+
+        # Fetch current metrics in one round-trip
+        self.snapshot = None
+        self._refresh_metrics()
+
+    def _refresh_metrics(self) -> None:
+        """Re-reads today's metrics and updates the labels in place if anything changed."""
+        self.snapshot_day = date.today()
+        snapshot = PAGE_DATA.get(self.user.user_id, "dashboard")
+        if snapshot == self.snapshot:
+            return
+        self.snapshot = snapshot
+
+        self.dash_steps.config(text=f"Steps: {snapshot['steps']}")
+        self.dash_cals.config(text=f"Calories: {snapshot['calories']}")
+        self.dash_sleep.config(text=f"SleepScore: {round(snapshot['sleep'], 2) * 100}%")
+        self.dash_streak.config(
+            text=f"Streak: {snapshot['logging_streak']} days | Step Goal: {snapshot['steps_goal_streak']} days"
+        )
+
+    def _start_live_refresh(self) -> None:
+        """
+        Keeps the metric labels up to date while the dashboard is open.
+
+        Saves made in this process are pushed through the db_handler change bus,
+        while writes from other ReHealth instances are picked up by polling
+        PRAGMA data_version, which is cheap and leaves unchanged data unqueried.
+        """
+        self.watcher = DataVersionWatcher()
+        subscribe_changes(self._on_data_changed)
+        self.frame.bind("<Destroy>", self._stop_live_refresh, add="+")
+        self.refresh_job = self.frame.after(REFRESH_INTERVAL_MS, self._poll_for_changes)
+
+    def _on_data_changed(self, table: str, user_id: int) -> None:
+        """
+        Change bus listener that refreshes the labels when this user's data changes.
+        It runs on the thread that saved the data, so the refresh is scheduled on the Tk thread.
+        """
+        if user_id == self.user.user_id and table in DASHBOARD_TABLES:
+            self.frame.after(0, self._apply_data_change)
+
+    def _apply_data_change(self) -> None:
+        """Refreshes the labels after a save made in this process."""
+        if not self.frame.winfo_exists():
+            return
+        # Consume the version bump before re-reading, so a write landing
+        # during the read is still picked up by the next poll
+        self.watcher.has_changed()
+        self._refresh_metrics()
+
+    def _poll_for_changes(self) -> None:
+        """Refreshes the labels if the database or the date has changed since the last poll."""
+        if self.watcher.has_changed():
+            # PAGE_DATA sees the same write and reloads rather than returning stale data
+            self._refresh_metrics()
+        elif date.today() != self.snapshot_day:
+            self._refresh_metrics()
+        self.refresh_job = self.frame.after(REFRESH_INTERVAL_MS, self._poll_for_changes)
+
+    def _stop_live_refresh(self, event) -> None:
+        """Stops polling and releases the watcher once the dashboard is destroyed."""
+        if event.widget is not self.frame:
+            return
+        self.frame.after_cancel(self.refresh_job)
+        unsubscribe_changes(self._on_data_changed)
+        self.watcher.close()
+
     def _create_achievements_button(self) -> None:
-        """Create the button to go to achievements in the menu."""
+        """Create the buttons to go to achievements, switch user or download records in the menu."""
+        self.menu_frame = tb.Frame(self.frame)
+        self.menu_frame.grid(row=5, pady=(0, 360), column=0)
+
         self.achievements_button = tb.Button(
-            self.frame,
+            self.menu_frame,
             text="Achievements",
             command=self.show_achievements,
             width=13
         )
-        self.achievements_button.grid(row=4, pady=(0, 400), column=0)
+        self.achievements_button.grid(row=0, column=0, padx=4)
+
+        self.switch_user_button = tb.Button(
+            self.menu_frame,
+            text="Switch User",
+            command=self.switch_user,
+            width=13
+        )
+        self.switch_user_button.grid(row=0, column=1, padx=4)
+
+        self.downloads_button = tb.Button(
+            self.menu_frame,
+            text="Downloads",
+            command=self.show_downloads,
+            width=13
+        )
+        self.downloads_button.grid(row=0, column=2, padx=4)
 
     def _create_navigation_tabs(self) -> None:
         """Create the navigation tab buttons at the bottom."""
         # Create tab frame
         self.tab_frame = tb.Frame(self.frame)
-        self.tab_frame.grid(row=4, column=0, pady=(390, 20))
+        self.tab_frame.grid(row=5, column=0, pady=(350, 20))
 
         # Create individual tab buttons
         self.measurements_button = tb.Button(
@@ -165,6 +260,18 @@ class Dashboard(BasePage):
         self.frame.destroy()
         Achievements(self.root, self.user)
 
+    def show_downloads(self) -> None:
+        """Opens the Downloads tab."""
+        self.frame.destroy()
+        Downloads(self.root, self.user)
+
+    def switch_user(self) -> None:
+        """Returns to the login screen so another member can log in or resume their session."""
+        # Imported here as the login module imports this one
+        from ui.login import App
+        self.frame.destroy()
+        App(self.root)
+
 
 if __name__ == "__main__":
     """
@@ -0,0 +1,229 @@
+"""Downloads Module - ReHealth"""
+
+from functools import partial
+from tkinter import filedialog, messagebox, simpledialog
+
+import ttkbootstrap as tb
+
+from logic.account_archive import archive_filename, export_account, import_account, read_archive_manifest
+from logic.exports import (
+    EXPORTS,
+    available_formats,
+    count_export_rows,
+    export_filename,
+    export_history,
+    metric_logs_folder,
+)
+from logic.user import User
+from logic.username_index import get_username_index
+from logic.validation import validate_username
+from ui.ui_handler import BackgroundTask, BasePage
+
+
+class Downloads(BasePage):
+    """
+    Class created to download any of the user's histories in the chosen format,
+    or to move a whole account between installs as a single archive.
+    """
+
+    def __init__(self, root: tb.Window, user: User) -> None:
+        """
+        Args:
+            root: Main application window.
+            user: Logged-in user.
+        """
+        # Initialise attributes
+        self.record_counts = {}
+
+        # Call parent constructor
+        super().__init__(root, user, "Downloads")
+
+    def _build_ui(self) -> None:
+        """Builds all UI components."""
+        self._create_title()
+        self._create_format_selector()
+        self._create_history_rows()
+        self._create_account_buttons()
+        self._create_navigation_buttons()
+
+    def _create_title(self) -> None:
+        """Creates the main title label."""
+        self.title_label = self.create_title_label("Download Records")
+        self.title_label.grid(row=0, column=0, columnspan=3, pady=(20, 20))
+
+    def _create_format_selector(self) -> None:
+        """Creates the combobox choosing the file format of every download."""
+        tb.Label(self.frame, text="Format:", font=("roboto", 14)).grid(
+            row=1, column=0, pady=(0, 20), sticky="e", padx=(0, 10)
+        )
+
+        self.format_combobox = tb.Combobox(
+            self.frame,
+            values=available_formats(),
+            state="readonly",
+            width=10
+        )
+        self.format_combobox.current(0)
+        self.format_combobox.grid(row=1, column=1, columnspan=2, pady=(0, 20), sticky="w")
+
+    def _create_history_rows(self) -> None:
+        """Creates a label showing the number of records and a download button for each history."""
+        for row, (history, (title, *_)) in enumerate(EXPORTS.items(), start=2):
+            self.record_counts[history] = count_export_rows(history, self.user.user_id)
+
+            tb.Label(
+                self.frame,
+                text=f"{title} ({self.record_counts[history]})",
+                font=("roboto", 12)
+            ).grid(row=row, column=0, columnspan=2, pady=5, sticky="w", padx=(0, 20))
+
+            tb.Button(
+                self.frame,
+                text="Download",
+                command=partial(self.download_records, [history]),
+                width=10
+            ).grid(row=row, column=2, pady=5)
+
+    def _create_account_buttons(self) -> None:
+        """Creates the buttons to export the whole account to an archive or import one as a new account."""
+        account_frame = tb.Frame(self.frame)
+        account_frame.grid(row=len(EXPORTS) + 2, column=0, columnspan=3, pady=(30, 0))
+
+        tb.Button(
+            account_frame,
+            text="Export Account",
+            command=self.export_account
+        ).grid(row=0, column=0, padx=(0, 5))
+
+        tb.Button(
+            account_frame,
+            text="Import Account",
+            command=self.import_account
+        ).grid(row=0, column=1, padx=(5, 0))
+
+    def _create_navigation_buttons(self) -> None:
+        """Creates the "Download All" and "Back to Dashboard" buttons."""
+        button_frame = tb.Frame(self.frame)
+        button_frame.grid(row=len(EXPORTS) + 3, column=0, columnspan=3, pady=(30, 10))
+
+        tb.Button(
+            button_frame,
+            text="Download All",
+            command=lambda: self.download_records(list(EXPORTS))
+        ).grid(row=0, column=0, padx=(0, 5))
+
+        tb.Button(
+            button_frame,
+            text="Back to Dashboard",
+            command=self.return_to_dashboard
+        ).grid(row=0, column=1, padx=(5, 0))
+
+    def download_records(self, histories: list[str]) -> None:
+        """
+        Downloads the chosen histories in the background, skipping any with nothing recorded.
+
+        Args:
+            histories: Keys from EXPORTS.
+        """
+        histories = [history for history in histories if self.record_counts[history]]
+        if not histories:
+            messagebox.showinfo("No Records", "There are no records to download yet.")
+            return
+
+        file_format = self.format_combobox.get()
+        jobs = [
+            partial(
+                self._download_job,
+                history,
+                export_filename(history, self.user.username, file_format),
+                file_format
+            )
+            for history in histories
+        ]
+        BackgroundTask(self.root, "Downloading records", jobs, self._download_finished)
+
+    def _download_job(self, history: str, filename: str, file_format: str, cancel_event, report_progress) -> str | None:
+        """Worker thread job that writes one history."""
+        return export_history(
+            history, self.user.user_id, self.user.username, filename,
+            cancel_event, report_progress, file_format=file_format
+        )
+
+    def _download_finished(self, filenames: list, errors: list, cancelled: bool) -> None:
+        """Reports the outcome of a background download."""
+        if errors:
+            messagebox.showerror("Error", f"Failed to download records: {errors[0]}")
+        elif cancelled:
+            messagebox.showinfo("Cancelled", f"Download cancelled. {len(filenames)} file(s) were saved.")
+        elif len(filenames) == 1:
+            messagebox.showinfo("Success", f"Records downloaded successfully to {filenames[0]}")
+        else:
+            messagebox.showinfo("Success", f"{len(filenames)} files downloaded to the metric_logs folder")
+
+    def export_account(self) -> None:
+        """Writes every table of the user's account to a single archive in the background."""
+        job = partial(export_account, self.user.user_id, archive_filename(self.user.username))
+        BackgroundTask(self.root, "Exporting account", [job], self._download_finished, max_workers=1)
+
+    def import_account(self) -> None:
+        """
+        Creates a new account from an archive in the background, asking for
+        another valid username if the archived one is already taken.
+        """
+        filename = filedialog.askopenfilename(
+            title="Import Account",
+            initialdir=metric_logs_folder(),
+            filetypes=[("ReHealth account archive", "*.zip")]
+        )
+        if not filename:
+            return
+
+        try:
+            username = read_archive_manifest(filename)["account"]["username"]
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Failed to import account: {e}")
+            return
+
+        problem = f"The username {username} is already taken." if get_username_index().is_taken(username) else ""
+        # Ask until the replacement username could be registered, or the user cancels
+        while problem:
+            username = simpledialog.askstring(
+                "Import Account",
+                f"{problem}\nEnter a username for the imported account:",
+                parent=self.root
+            )
+            if username is None:
+                return
+
+            username = username.strip()
+            username_valid, problem = validate_username(username)
+            if username_valid and get_username_index().is_taken(username):
+                problem = f"The username {username} is already taken."
+
+        job = partial(import_account, filename, username)
+        BackgroundTask(
+            self.root, "Importing account", [job],
+            partial(self._import_finished, username), max_workers=1
+        )
+
+    def _import_finished(self, username: str, user_ids: list, errors: list, cancelled: bool) -> None:
+        """Reports the outcome of a background import."""
+        if errors:
+            messagebox.showerror("Error", f"Failed to import account: {errors[0]}")
+        elif cancelled:
+            messagebox.showinfo("Cancelled", "Import cancelled. No account was created.")
+        else:
+            get_username_index().add(username)
+            messagebox.showinfo("Success", f"Account imported. Switch user to log in as {username}.")
+
+
+if __name__ == "__main__":
+    """
+    Allows testing to be made on this specific window.
+    Only runs if the file is executed directly (not through imports)
+    """
+    root = tb.Window(themename="darkly")
+    test_user = User("TestUser", "1234567", "Male", "26/12/2007", "29/08/2025")
+    test_user.user_id = 1
+    app = Downloads(root, test_user)
+    root.mainloop()
@@ -4,8 +4,11 @@ from tkinter import messagebox
 
 import ttkbootstrap as tb
 
-from db.db_handler import save_food, get_last_7_days_calories_convert
+from db.db_handler import save_food
+from logic.food_catalog import display_food_name, get_food_suggester
+from logic.nutrition_db import get_nutrition_database
 from logic.user import User
+from ui.history_search import HistorySearch
 from ui.ui_handler import return_to_dashboard, GraphTemplate, BasePage
 
 MEAL_TYPE_OPTIONS = ["breakfast", "lunch", "dinner", "snack"]
@@ -76,6 +79,11 @@ class Food(BasePage):
             root: Main application window.
             user: Logged-in user
         """
+        # The user's foods ranked by how often and recently they log them
+        self.food_suggester = get_food_suggester(user.user_id)
+        # Offline calorie data for foods the user has not logged before
+        self.nutrition_db = get_nutrition_database()
+
         # Call parent constructor
         super().__init__(root, user, "Food")
 
@@ -105,7 +113,13 @@ class Food(BasePage):
         )
         self.food_entry_label.grid(row=1, column=0, pady=(10, 10), padx=(20, 10), sticky="e")
 
-        self.food_textbox = tb.Entry(self.frame, width=25)
+        self.food_textbox = tb.Combobox(
+            self.frame,
+            width=23,
+            postcommand=self._suggest_foods
+        )
+        self.food_textbox.bind("<KeyRelease>", self._suggest_foods)
+        self.food_textbox.bind("<<ComboboxSelected>>", self._fill_calories)
         self.food_textbox.grid(row=1, column=1, pady=(10, 10), padx=(10, 20), sticky="w")
 
         # Calorie input
@@ -135,13 +149,23 @@ class Food(BasePage):
         self.meal_type_combobox.grid(row=3, column=1, pady=(10, 10), padx=(10, 20), sticky="w")
 
     def _create_add_button(self) -> None:
-        """Create the button to add food to database."""
+        """Create the buttons to add food to database and to search past meals."""
+        self.button_frame = tb.Frame(self.frame)
+        self.button_frame.grid(row=4, column=0, pady=(30, 10), columnspan=2)
+
         self.db_add_button = tb.Button(
-            self.frame,
+            self.button_frame,
             text="Add to Database",
             command=self.database_inc
         )
-        self.db_add_button.grid(row=4, column=0, pady=(30, 10), columnspan=2)
+        self.db_add_button.grid(row=0, column=0, padx=(0, 5))
+
+        self.search_button = tb.Button(
+            self.button_frame,
+            text="Search History",
+            command=self.show_history_search
+        )
+        self.search_button.grid(row=0, column=1, padx=(5, 0))
 
     def _create_graph_section(self) -> None:
         """Create the graph frame and initialise the graph widget."""
@@ -155,6 +179,36 @@ class Food(BasePage):
             self.root
         )
 
+    def _suggest_foods(self, event=None) -> None:
+        """
+        Offers the user's most logged foods starting with the text typed so far,
+        followed by matching foods from the nutrition database.
+        """
+        typed = self.food_textbox.get()
+        suggestions = self.food_suggester.suggest(typed)
+
+        known = {name.lower() for name in suggestions}
+        for name, _, _ in self.nutrition_db.search(typed):
+            if name.lower() not in known:
+                suggestions.append(name)
+
+        self.food_textbox["values"] = suggestions
+
+    def _fill_calories(self, event=None) -> None:
+        """
+        Fills in the calories the picked food was last logged at,
+        or its typical serving from the nutrition database.
+        """
+        food_name = self.food_textbox.get()
+        calories = self.food_suggester.calories_for(food_name)
+        if calories is None:
+            nutrition = self.nutrition_db.lookup(food_name)
+            calories = None if nutrition is None else nutrition[2]
+
+        if calories is not None:
+            self.calorie_textbox.delete(0, 'end')
+            self.calorie_textbox.insert(0, str(calories))
+
     def database_inc(self) -> None:
         """
         Validates user inputs and saves a food entry to the database.
@@ -198,6 +252,8 @@ class Food(BasePage):
         """
         # Save food to the database
         save_food(self.user.user_id, foodname, calorie_amount, meal_type.lower())
+        self.food_suggester.record(foodname, int(calorie_amount))
+        foodname = display_food_name(foodname)
 
         messagebox.showinfo(
             "Success",
@@ -216,31 +272,19 @@ class Food(BasePage):
         self.calorie_graph.refresh_graph()
         self.root.update_idletasks()
 
+    def show_history_search(self) -> None:
+        """
+        Opens the search over past meals and workouts.
+        """
+        self.frame.destroy()
+        HistorySearch(self.root, self.user, return_page=Food)
+
 
 class CalorieGraph(GraphTemplate):
     """
     Class plots and displays a 7 day graph depicting the user's calorie count.
     """
-
-    def plot_data(self) -> None:
-        # Clear graph and replace it with updated information from the last 7 days.
-
-        self.ax.clear()
-        days, calories = get_last_7_days_calories_convert(self.user.user_id)
-
-        # Plot and style graph
-
-        self.ax.plot(
-            days,
-            calories,
-            marker='o',
-            color='#4e73df',
-            linewidth=2,
-            markersize=8
-        )
-
-        self.style_axes("Days", "Calories", "Calories Over Time")
-        self.canvas.draw()
+    graph_type = "calories"
 
     def get_graph_filename(self) -> str:
         return f"{self.user.username}_calories_graph_week.png"
@@ -0,0 +1,259 @@
+"""
+Graph_Render Module - ReHealth
+
+Tk-free helpers for drawing the weekly graphs and caching the rendered images.
+"""
+
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from db.db_handler import (
+    get_last_7_days_steps_convert,
+    get_last_7_days_sleep_convert,
+    get_last_7_days_calories_convert,
+    get_metrics_page
+)
+from logic.calculations import bmi_calc
+from logic.score_engine import get_last_7_days_score_convert
+
+GRAPH_THEME = "darkly"
+GRAPH_FIGSIZE = (6, 4)
+GRAPH_DPI = 67
+
+EXPORT_FORMATS = ["png", "svg", "pdf"]
+
+THEME_COLOURS: dict[str, dict[str, str]] = {
+    "darkly": {
+        "figure": "#222222",
+        "axes": "#2b3e50",
+        "line": "#4e73df",
+        "label": "#adb5bd",
+        "title": "#ffffff",
+    },
+}
+
+# Axis labels and title for each kind of graph
+GRAPH_LABELS: dict[str, tuple[str, str, str]] = {
+    "steps": ("Days", "Steps", "Steps Over Time"),
+    "sleep": ("Days", "Hours", "Sleep Over Time"),
+    "calories": ("Days", "Calories", "Calories Over Time"),
+    "bmi": ("Measurements", "BMI", "BMI Over Time"),
+    "score": ("Days", "Score", "ReHealth Score Over Time"),
+}
+
+
+def get_last_7_bmi_convert(user_id: int) -> tuple[list, list]:
+    """
+    Calculates BMI for the user's 7 most recent measurements.
+
+    Returns:
+        Measurement numbers (oldest first) and the BMI for each.
+    """
+    records, _ = get_metrics_page(user_id, limit=7)
+    records.reverse()
+    bmi_values = [bmi_calc(weight, height) for _, height, weight in records]
+    return list(range(1, len(bmi_values) + 1)), bmi_values
+
+
+# Functions that fetch the (days, values) series for each kind of graph
+GRAPH_SOURCES = {
+    "steps": get_last_7_days_steps_convert,
+    "sleep": get_last_7_days_sleep_convert,
+    "calories": get_last_7_days_calories_convert,
+    "bmi": get_last_7_bmi_convert,
+    "score": get_last_7_days_score_convert,
+}
+
+
+def fetch_graph_data(graph_type: str, user_id: int) -> tuple[list, list]:
+    """
+    Fetches the series plotted on a graph.
+
+    Args:
+        graph_type: Key from GRAPH_SOURCES e.g. "steps".
+        user_id: The user's ID.
+
+    Returns:
+        A tuple of (days, values).
+    """
+    days, values = GRAPH_SOURCES[graph_type](user_id)
+    return list(days), list(values)
+
+
+def create_figure(theme: str = GRAPH_THEME) -> tuple[Figure, object]:
+    """
+    Creates a figure and axes styled for ReHealth graphs.
+
+    Returns:
+        A tuple of (figure, axes).
+    """
+    colours = THEME_COLOURS[theme]
+    fig = Figure(figsize=GRAPH_FIGSIZE, dpi=GRAPH_DPI, facecolor=colours["figure"])
+    ax = fig.add_subplot(111)
+    ax.set_facecolor(colours["axes"])
+    return fig, ax
+
+
+def style_axes(ax, xlabel: str, ylabel: str, title: str, theme: str = GRAPH_THEME) -> None:
+    """Apply consistent styling to axes"""
+    colours = THEME_COLOURS[theme]
+    ax.set_xlabel(xlabel, color=colours["label"])
+    ax.set_ylabel(ylabel, color=colours["label"])
+    ax.set_title(title, color=colours["title"])
+    ax.tick_params(colors=colours["label"])
+
+    for spine in ax.spines.values():
+        spine.set_color(colours["label"])
+
+    ax.grid(True, alpha=0.2, color=colours["label"])
+
+
+def plot_line(ax, days: list, values: list, graph_type: str, theme: str = GRAPH_THEME) -> None:
+    """
+    Clears the axes and plots a weekly line graph.
+
+    Args:
+        ax: Axes to draw on.
+        days: X values (day numbers 1-7).
+        values: Y values for each day.
+        graph_type: Key from GRAPH_LABELS used for the labels and title.
+        theme: Colour theme to draw with.
+    """
+    ax.clear()
+    ax.set_facecolor(THEME_COLOURS[theme]["axes"])
+    ax.plot(
+        days,
+        values,
+        marker='o',
+        color=THEME_COLOURS[theme]["line"],
+        linewidth=2,
+        markersize=8
+    )
+    style_axes(ax, *GRAPH_LABELS[graph_type], theme=theme)
+
+
+def render_png(fig: Figure) -> bytes:
+    """
+    Renders a figure with the Agg backend and returns it as PNG bytes.
+    """
+    canvas = FigureCanvasAgg(fig)
+    buffer = io.BytesIO()
+    canvas.print_png(buffer)
+    return buffer.getvalue()
+
+
+def export_graph(graph_type: str, user_id: int, filename: str, dpi: int = 100,
+                 cancel_event=None, report_progress=None) -> str | None:
+    """
+    Renders a graph on its own figure and saves it, so it is safe to call from a worker thread.
+
+    The file is written next to its destination first and renamed into place,
+    so a cancelled or failed export never leaves a half written graph behind.
+
+    Args:
+        graph_type: Key from GRAPH_SOURCES e.g. "steps".
+        user_id: The user's ID.
+        filename: Destination path; the extension picks the format (png, svg or pdf).
+        dpi: Resolution used for raster output.
+        cancel_event: Optional threading.Event checked before and after rendering.
+        report_progress: Optional function called with the fraction done after
+            the data is fetched, the graph is plotted and the file is saved.
+
+    Returns:
+        The saved filename, or None if the export was cancelled.
+    """
+    if cancel_event is not None and cancel_event.is_set():
+        return None
+
+    days, values = fetch_graph_data(graph_type, user_id)
+    if report_progress is not None:
+        report_progress(1 / 3)
+
+    fig, ax = create_figure()
+    plot_line(ax, days, values, graph_type)
+    if report_progress is not None:
+        report_progress(2 / 3)
+
+    file_format = os.path.splitext(filename)[1].lstrip(".").lower()
+    temp_filename = f"{filename}.part"
+    try:
+        fig.savefig(temp_filename, format=file_format, dpi=dpi, facecolor=THEME_COLOURS[GRAPH_THEME]["figure"])
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+        os.replace(temp_filename, filename)
+        if report_progress is not None:
+            report_progress(1.0)
+    finally:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+
+    return filename
+
+
+def graph_cache_key(graph_type: str, user_id: int, data, theme: str = GRAPH_THEME) -> tuple:
+    """
+    Builds the cache key for a rendered graph.
+
+    The plotted data is reduced to a fingerprint so that any change in the
+    last 7 days produces a different key.
+    """
+    fingerprint = hashlib.sha1(repr(data).encode()).hexdigest()
+    size = (GRAPH_FIGSIZE, GRAPH_DPI)
+    return graph_type, user_id, fingerprint, size, theme
+
+
+class GraphCache:
+    """
+    Least recently used cache of rendered graph images, bounded by total bytes.
+    Safe to share with the prefetch thread.
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024, max_entries: int = 64) -> None:
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.total_bytes = 0
+        self._images: OrderedDict[tuple, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def get(self, key: tuple) -> bytes | None:
+        """Returns the cached image for key, or None if it has not been rendered."""
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+
+    def put(self, key: tuple, image: bytes) -> None:
+        """Stores an image, evicting the least recently used ones if over budget."""
+        if len(image) > self.max_bytes:
+            return
+
+        with self._lock:
+            old_image = self._images.pop(key, None)
+            if old_image is not None:
+                self.total_bytes -= len(old_image)
+
+            self._images[key] = image
+            self.total_bytes += len(image)
+
+            while self.total_bytes > self.max_bytes or len(self._images) > self.max_entries:
+                _, evicted = self._images.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        """Removes every cached image."""
+        with self._lock:
+            self._images.clear()
+            self.total_bytes = 0
+
+
+GRAPH_CACHE = GraphCache()
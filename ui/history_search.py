@@ -0,0 +1,159 @@
+"""History_Search Module - ReHealth"""
+
+import ttkbootstrap as tb
+
+from logic.history_search import HISTORY_PAGE_SIZE, search_history
+from logic.user import User
+from ui.ui_handler import BasePage
+
+
+class HistorySearch(BasePage):
+    """
+    Class created to let the user find past meals and workouts by name.
+    """
+
+    def __init__(self, root: tb.Window, user: User, return_page=None) -> None:
+        """
+        Args:
+            root: Main application window.
+            user: Logged-in user.
+            return_page: Page class the back button opens, defaults to the dashboard.
+        """
+        # Initialise attributes
+        self.return_page = return_page
+        self.search_text = ""
+        self.page = 0
+
+        # Call parent constructor
+        super().__init__(root, user, "History Search")
+
+    def _build_ui(self) -> None:
+        """Builds all UI components."""
+        self._create_title()
+        self._create_search_bar()
+        self._create_results_table()
+        self._create_page_controls()
+        self._create_navigation_buttons()
+
+    def _create_title(self) -> None:
+        """Creates the main title label."""
+        self.search_label = tb.Label(
+            self.frame,
+            text="Search Your History",
+            font=("roboto", 18, "bold"),
+        )
+        self.search_label.grid(row=0, column=0, pady=(20, 20), sticky="n")
+
+    def _create_search_bar(self) -> None:
+        """Creates the search entry and button."""
+        search_frame = tb.Frame(self.frame)
+        search_frame.grid(row=1, column=0, pady=(0, 15), sticky="n")
+
+        self.search_textbox = tb.Entry(search_frame, width=30)
+        self.search_textbox.bind("<Return>", lambda event: self.run_search())
+        self.search_textbox.grid(row=0, column=0, padx=(0, 5))
+        self.search_textbox.focus()
+
+        tb.Button(
+            search_frame,
+            text="Search",
+            command=self.run_search
+        ).grid(row=0, column=1, padx=(5, 0))
+
+    def _create_results_table(self) -> None:
+        """Creates the table listing matching entries."""
+        self.table = tb.Treeview(
+            self.frame,
+            columns=("kind", "date", "name", "details"),
+            show="headings",
+            height=HISTORY_PAGE_SIZE // 2
+        )
+        self.table.heading("kind", text="Type")
+        self.table.heading("date", text="Date")
+        self.table.heading("name", text="Name")
+        self.table.heading("details", text="Details")
+        self.table.column("kind", width=65, anchor="w")
+        self.table.column("date", width=85, anchor="w")
+        self.table.column("name", width=130, anchor="w")
+        self.table.column("details", width=170, anchor="w")
+        self.table.grid(row=2, column=0, pady=(0, 10), sticky="n")
+
+    def _create_page_controls(self) -> None:
+        """Creates the previous and next page buttons and the page label."""
+        page_frame = tb.Frame(self.frame)
+        page_frame.grid(row=3, column=0, pady=(0, 10), sticky="n")
+
+        self.previous_button = tb.Button(
+            page_frame,
+            text="< Previous",
+            command=lambda: self.show_page(self.page - 1),
+            state="disabled"
+        )
+        self.previous_button.grid(row=0, column=0, padx=(0, 10))
+
+        self.page_label = tb.Label(page_frame, text="", font=("roboto", 12))
+        self.page_label.grid(row=0, column=1)
+
+        self.next_button = tb.Button(
+            page_frame,
+            text="Next >",
+            command=lambda: self.show_page(self.page + 1),
+            state="disabled"
+        )
+        self.next_button.grid(row=0, column=2, padx=(10, 0))
+
+    def _create_navigation_buttons(self) -> None:
+        """Creates the back button."""
+        tb.Button(
+            self.frame,
+            text="Back",
+            command=self.go_back
+        ).grid(row=4, column=0, pady=(100, 10), sticky="n")
+
+    def run_search(self) -> None:
+        """Searches for the text in the entry and shows the first page of results."""
+        self.search_text = self.search_textbox.get().strip()
+        self.show_page(0)
+
+    def show_page(self, page: int) -> None:
+        """
+        Fills the table with one page of results for the current search.
+
+        Args:
+            page: Page to show, starting at 0.
+        """
+        results, has_more = search_history(self.user.user_id, self.search_text, page)
+        self.page = page
+
+        self.table.delete(*self.table.get_children())
+        for row in results:
+            self.table.insert("", "end", values=row)
+
+        if not results:
+            self.page_label.config(text="No matching entries." if self.search_text else "")
+        else:
+            first = page * HISTORY_PAGE_SIZE + 1
+            self.page_label.config(text=f"Results {first}-{first + len(results) - 1}")
+
+        self.previous_button.config(state="normal" if page > 0 else "disabled")
+        self.next_button.config(state="normal" if has_more else "disabled")
+
+    def go_back(self) -> None:
+        """Returns to the page the search was opened from."""
+        if self.return_page is None:
+            self.return_to_dashboard()
+            return
+        self.frame.destroy()
+        self.return_page(self.root, self.user)
+
+
+if __name__ == "__main__":
+    """
+    Allows testing to be made on this specific window.
+    Only runs if the file is executed directly (not through imports)
+    """
+    root = tb.Window(themename="darkly")
+    test_user = User("TestUser", "1234567", "Male", "26/12/2007", "29/08/2025")
+    test_user.user_id = 1
+    app = HistorySearch(root, test_user)
+    root.mainloop()
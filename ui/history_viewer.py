@@ -0,0 +1,201 @@
+"""History_Viewer Module - ReHealth"""
+
+from functools import partial
+
+import ttkbootstrap as tb
+
+from db.db_handler import count_metrics, count_workouts, get_metrics_page, get_workouts_page
+from logic.calculations import bmi_calc
+from logic.keyset_pager import KeysetPager
+from logic.user import User
+from ui.ui_handler import BasePage
+
+# Rows shown at once; only this many table rows are ever created
+VISIBLE_ROWS = 15
+WHEEL_ROWS = 3
+
+
+def _format_amount(value, unit: str) -> str:
+    """Formats a value with its unit, or "" for the missing values legacy rows may have."""
+    return "" if value is None else f"{value:g} {unit}"
+
+
+def _format_workout(row: tuple) -> tuple:
+    """Formats a (date, name, weight, sets, reps) row for the table."""
+    day, name, weight, sets, reps = row
+    sets, reps = ("" if value is None else value for value in (sets, reps))
+    return day or "", name or "Unknown", _format_amount(weight, "kg"), sets, reps
+
+
+def _format_measurement(row: tuple) -> tuple:
+    """Formats a (date, height, weight) row for the table, adding the BMI."""
+    day, height, weight = row
+    bmi = bmi_calc(weight, height) if height and weight else ""
+    return day or "", _format_amount(height, "cm"), _format_amount(weight, "kg"), bmi
+
+
+# Each history: title, (column, heading, width) for each column, page function, count function, formatter
+HISTORY_VIEWS = {
+    "workouts": (
+        "Workout History",
+        [("date", "Date", 90), ("name", "Exercise", 150), ("weight", "Weight", 80),
+         ("sets", "Sets", 50), ("reps", "Reps", 50)],
+        get_workouts_page,
+        count_workouts,
+        _format_workout,
+    ),
+    "measurements": (
+        "Measurement History",
+        [("date", "Date", 110), ("height", "Height", 100), ("weight", "Weight", 100), ("bmi", "BMI", 80)],
+        get_metrics_page,
+        count_metrics,
+        _format_measurement,
+    ),
+}
+
+
+class HistoryViewer(BasePage):
+    """
+    Class created to scroll through every past workout or measurement.
+
+    The table only ever holds VISIBLE_ROWS items, refilled from a KeysetPager as
+    the user scrolls, so memory use stays the same however long the history is.
+    """
+
+    def __init__(self, root: tb.Window, user: User, history: str, return_page=None) -> None:
+        """
+        Args:
+            root: Main application window.
+            user: Logged-in user.
+            history: Key from HISTORY_VIEWS, "workouts" or "measurements".
+            return_page: Page class the back button opens, defaults to the dashboard.
+        """
+        # Initialise attributes
+        self.return_page = return_page
+        (self.history_title, self.columns, fetch_page,
+         count_rows, self.format_row) = HISTORY_VIEWS[history]
+        self.pager = KeysetPager(partial(fetch_page, user.user_id), count_rows(user.user_id))
+        self.offset = 0
+
+        # Call parent constructor
+        super().__init__(root, user, self.history_title)
+
+    def _build_ui(self) -> None:
+        """Builds all UI components."""
+        self._create_title()
+        self._create_table()
+        self._create_position_label()
+        self._create_navigation_buttons()
+        self.show_rows(0)
+
+    def _create_title(self) -> None:
+        """Creates the main title label."""
+        self.history_label = tb.Label(
+            self.frame,
+            text=f"{self.user.username}'s {self.history_title}",
+            font=("roboto", 18, "bold"),
+        )
+        self.history_label.grid(row=0, column=0, pady=(20, 20), sticky="n")
+
+    def _create_table(self) -> None:
+        """Creates the table and its scrollbar, which scroll by moving the offset rather than the items."""
+        table_frame = tb.Frame(self.frame)
+        table_frame.grid(row=1, column=0, pady=(0, 10), sticky="n")
+
+        self.table = tb.Treeview(
+            table_frame,
+            columns=[column for column, _, _ in self.columns],
+            show="headings",
+            height=VISIBLE_ROWS,
+            selectmode="none"
+        )
+        for column, heading, width in self.columns:
+            self.table.heading(column, text=heading)
+            self.table.column(column, width=width, anchor="w")
+        self.table.grid(row=0, column=0)
+
+        self.scrollbar = tb.Scrollbar(table_frame, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        # The items are created once and only their values change as the user scrolls
+        self.row_ids = [self.table.insert("", "end", values=()) for _ in range(VISIBLE_ROWS)]
+
+        self.table.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.table.bind("<Button-4>", lambda event: self.show_rows(self.offset - WHEEL_ROWS))
+        self.table.bind("<Button-5>", lambda event: self.show_rows(self.offset + WHEEL_ROWS))
+        self.table.bind("<Prior>", lambda event: self.show_rows(self.offset - VISIBLE_ROWS))
+        self.table.bind("<Next>", lambda event: self.show_rows(self.offset + VISIBLE_ROWS))
+        self.table.bind("<Home>", lambda event: self.show_rows(0))
+        self.table.bind("<End>", lambda event: self.show_rows(self.pager.total))
+        self.table.focus_set()
+
+    def _create_position_label(self) -> None:
+        """Creates the label showing which rows are visible."""
+        self.position_label = tb.Label(self.frame, text="", font=("roboto", 12))
+        self.position_label.grid(row=2, column=0, pady=(0, 10), sticky="n")
+
+    def _create_navigation_buttons(self) -> None:
+        """Creates the back button."""
+        tb.Button(
+            self.frame,
+            text="Back",
+            command=self.go_back
+        ).grid(row=3, column=0, pady=(70, 10), sticky="n")
+
+    def show_rows(self, offset: int) -> None:
+        """
+        Fills the table with the rows starting at a position in the history.
+
+        Args:
+            offset: Position of the first visible row, clamped to the history.
+        """
+        total = self.pager.total
+        self.offset = max(0, min(offset, total - VISIBLE_ROWS))
+        rows = self.pager.rows(self.offset, VISIBLE_ROWS)
+
+        for index, row_id in enumerate(self.row_ids):
+            values = self.format_row(rows[index]) if index < len(rows) else ()
+            self.table.item(row_id, values=values)
+
+        if total:
+            self.scrollbar.set(self.offset / total, (self.offset + len(rows)) / total)
+            self.position_label.config(
+                text=f"Showing {self.offset + 1}-{self.offset + len(rows)} of {total}"
+            )
+        else:
+            self.scrollbar.set(0, 1)
+            self.position_label.config(text="Nothing recorded yet.")
+
+    def _on_scrollbar(self, action: str, amount: str, unit: str | None = None) -> None:
+        """Moves the visible rows when the scrollbar is dragged or clicked."""
+        if action == "moveto":
+            self.show_rows(round(float(amount) * self.pager.total))
+        elif unit == "pages":
+            self.show_rows(self.offset + int(amount) * VISIBLE_ROWS)
+        else:
+            self.show_rows(self.offset + int(amount))
+
+    def _on_mouse_wheel(self, event) -> str:
+        """Scrolls a few rows per wheel notch on Windows and macOS."""
+        self.show_rows(self.offset - WHEEL_ROWS * (1 if event.delta > 0 else -1))
+        return "break"
+
+    def go_back(self) -> None:
+        """Returns to the page the history was opened from."""
+        if self.return_page is None:
+            self.return_to_dashboard()
+            return
+        self.frame.destroy()
+        self.return_page(self.root, self.user)
+
+
+if __name__ == "__main__":
+    """
+    Allows testing to be made on this specific window.
+    Only runs if the file is executed directly (not through imports)
+    """
+    root = tb.Window(themename="darkly")
+    test_user = User("TestUser", "1234567", "Male", "26/12/2007", "29/08/2025")
+    test_user.user_id = 1
+    app = HistoryViewer(root, test_user, "workouts")
+    root.mainloop()
@@ -0,0 +1,145 @@
+"""Leaderboard Module - ReHealth"""
+
+import ttkbootstrap as tb
+
+from logic.leaderboard import (
+    get_score_position,
+    get_top_scores,
+    get_top_weekly_steps,
+    get_weekly_steps_position
+)
+from logic.user import User
+from ui.ui_handler import BasePage
+
+BOARD_OPTIONS = ["Lifetime Score", "Weekly Steps"]
+LEADERBOARD_SIZE = 10
+
+
+class Leaderboard(BasePage):
+    """
+    Class created to rank the user against every other ReHealth member.
+    """
+
+    def __init__(self, root: tb.Window, user: User) -> None:
+        """
+        Args:
+            root: Main application window.
+            user: Logged-in user.
+        """
+        # Call parent constructor
+        super().__init__(root, user, "Leaderboard")
+
+    def _build_ui(self) -> None:
+        """Builds all UI components."""
+        self._create_title()
+        self._create_board_selector()
+        self._create_table()
+        self._create_position_label()
+        self._create_navigation_buttons()
+        self.show_board()
+
+    def _create_title(self) -> None:
+        """Creates the main title label."""
+        self.leaderboard_label = tb.Label(
+            self.frame,
+            text="ReHealth Leaderboard",
+            font=("roboto", 18, "bold"),
+        )
+        self.leaderboard_label.grid(row=0, column=0, pady=(20, 20), sticky="n")
+
+    def _create_board_selector(self) -> None:
+        """Creates the dropdown used to switch between leaderboards."""
+        self.board_combobox = tb.Combobox(
+            self.frame,
+            values=BOARD_OPTIONS,
+            state="readonly",
+            width=20
+        )
+        self.board_combobox.current(0)
+        self.board_combobox.bind("<<ComboboxSelected>>", lambda event: self.show_board())
+        self.board_combobox.grid(row=1, column=0, pady=(0, 15), sticky="n")
+
+    def _create_table(self) -> None:
+        """Creates the table listing the top members."""
+        self.table = tb.Treeview(
+            self.frame,
+            columns=("position", "username", "value"),
+            show="headings",
+            height=LEADERBOARD_SIZE
+        )
+        self.table.heading("position", text="#")
+        self.table.heading("username", text="User")
+        self.table.heading("value", text="Score")
+        self.table.column("position", width=50, anchor="center")
+        self.table.column("username", width=200, anchor="w")
+        self.table.column("value", width=150, anchor="e")
+        self.table.grid(row=2, column=0, pady=(0, 15), sticky="n")
+
+    def _create_position_label(self) -> None:
+        """Creates the label showing the user's own position."""
+        self.position_label = tb.Label(
+            self.frame,
+            font=("roboto", 14, "bold"),
+        )
+        self.position_label.grid(row=3, column=0, pady=(5, 5), sticky="n")
+
+    def _create_navigation_buttons(self) -> None:
+        """Creates the back to achievements and back to dashboard buttons."""
+        button_frame = tb.Frame(self.frame)
+        button_frame.grid(row=4, column=0, pady=(80, 10), sticky="n")
+
+        tb.Button(
+            button_frame,
+            text="Back to Achievements",
+            command=self.show_achievements
+        ).grid(row=0, column=0, padx=(0, 5))
+
+        tb.Button(
+            button_frame,
+            text="Back to Dashboard",
+            command=self.return_to_dashboard
+        ).grid(row=0, column=1, padx=(5, 0))
+
+    def show_board(self) -> None:
+        """Fills the table and position label for the selected leaderboard."""
+        if self.board_combobox.get() == "Weekly Steps":
+            rows = [
+                (position, username, f"{steps:,}")
+                for position, username, steps in get_top_weekly_steps(LEADERBOARD_SIZE)
+            ]
+            position = get_weekly_steps_position(self.user.user_id)
+            self.table.heading("value", text="Steps This Week")
+        else:
+            rows = [
+                (position, username, f"{score:,}")
+                for position, username, score, _ in get_top_scores(LEADERBOARD_SIZE)
+            ]
+            position = get_score_position(self.user.user_id)
+            self.table.heading("value", text="Score")
+
+        self.table.delete(*self.table.get_children())
+        for row in rows:
+            self.table.insert("", "end", values=row)
+
+        if position is None:
+            self.position_label.config(text="You are not ranked yet.")
+        else:
+            self.position_label.config(text=f"Your position: #{position[0]:,} of {position[1]:,}")
+
+    def show_achievements(self) -> None:
+        """Returns to the achievements screen."""
+        from ui.achievements import Achievements
+        self.frame.destroy()
+        Achievements(self.root, self.user)
+
+
+if __name__ == "__main__":
+    """
+    Allows testing to be made on this specific window.
+    Only runs if the file is executed directly (not through imports)
+    """
+    root = tb.Window(themename="darkly")
+    test_user = User("TestUser", "1234567", "Male", "26/12/2007", "29/08/2025")
+    test_user.user_id = 1
+    app = Leaderboard(root, test_user)
+    root.mainloop()
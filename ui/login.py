@@ -1,16 +1,32 @@
 """Login Module - ReHealth"""
 
 import random
-import re
-import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
 from tkinter import messagebox
 
 import ttkbootstrap as tb
 
-from db.db_handler import save_user_to_db, DB_PATH, get_db_connection
+from db.db_handler import save_user_to_db, get_db_connection, update_password_hash
+from logic.sessions import (
+    create_session,
+    forget_session,
+    load_remembered_sessions,
+    remember_session,
+    resume_session
+)
 from logic.user import User
+from logic.user_context import get_user_context
+from logic.username_index import get_username_index
+from logic.validation import (
+    validate_date_of_birth,
+    validate_password,
+    validate_sex,
+    validate_username
+)
 from ui.dashboard import Dashboard
+from ui.page_data import prefetch_page_data
 
 
 def get_random_quote():
@@ -30,91 +46,70 @@ def get_random_quote():
     return random.choice(quote_list)
 
 
-def validate_username(username: str) -> tuple[bool, str]:
-    """
-    Validates username inpit, returns error messages.
+# How often the Tk thread checks whether password hashing has finished
+HASH_POLL_MS = 50
 
-    Args:
-        username: The username inputted by the user.
 
-    Returns:
-        A tuple describing the validity of the input possibly accompanied by an error message.
-    """
-    if not re.match(r"^[A-Za-z0-9_.]{3,20}$", username):
-        return False, "Username must be between 3-20 characters inclusive, letters, numbers, underscores, or dots."
-    return True, ""
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash with the current cost, made once, for usernames that do not exist."""
+    return User.password_hasher("ReHealth dummy password")
 
 
-def validate_password(password: str) -> tuple[bool, str]:
+def authenticate_user(username: str, password: str) -> User | None:
     """
-    Validates password strength and returns error messages.
-
-    Args:
-        password: The password inputted by the user.
-
-    Returns:
-        A tuple describing the validity of the input possibly accompanied by an error message.
-    """
-    if len(password) < 8 or len(password) > 20:
-        return False, "Password must be between 8 and 20 characters inclusive."
-
-    password_score = 0
-    if re.search(r"[A-Z]", password):
-        password_score += 1
-    if re.search(r"[a-z]", password):
-        password_score += 1
-    if re.search(r"[0-9]", password):
-        password_score += 1
-    if re.search(r"[^A-Za-z0-9]", password):
-        password_score += 1
-
-    if password_score < 3:
-        return False, "Password should mix uppercase, lowercase, numbers, and special characters."
+    Looks the user up and checks their password, upgrading a legacy or
+    outdated hash to the current format once the password is known to match.
 
-    return True, ""
-
-
-def validate_sex(sex: str) -> tuple[bool, str]:
-    """
-    Validates The sex that the user inputs and returns a descriptive error message.
+    Slow by design, so it is run off the Tk thread.
 
     Args:
-        sex: Biological sex selected by the user
+        username: Username entered.
+        password: Password entered.
 
     Returns:
-        A tuple describing the validity of the input possibly accompanied by an error message.
+        The logged-in User, or None if the username or password is wrong.
     """
-    if not sex or sex not in ("Male", "Female"):
-        return False, "Please select a biological sex."
-    return True, ""
+    connection = get_db_connection()
+    cursor = connection.cursor()
+    cursor.execute(
+        """
+        SELECT UserID, Username, Password, Sex, DateOfBirth, JoinDate
+        FROM User WHERE Username = ?
+        """,
+        (username,)
+    )
+    result = cursor.fetchone()
+    connection.close()
 
+    if result is None:
+        # Checked anyway so failed logins take the same time whether or not the account exists
+        User.verify_password(_dummy_password_hash(), password)
+        return None
 
-def validate_date_of_birth(day: int, month: int, year: int) -> tuple[bool, date, str]:
-    """
-    Validates the date of birth inputted by the user.
+    fetched_user = User(
+        username=result[1],
+        password=result[2],
+        sex=result[3],
+        dob=result[4],
+        join_date=result[5],
+        user_id=result[0]
+    )
 
-    Args:
-        day: Day selected by the user
-        month: Month selected by the user
-        year: Year selected by the user
+    # Checks input password against hash stored in database
+    if not fetched_user.password_check(password):
+        return None
 
-    Returns:
-        A tuple containing whether the input is valid, the date the user inputted and a possible error message.
-    """
-    try:
-        dob_date = date(year, month, day)
+    if User.needs_rehash(fetched_user.password):
+        fetched_user.password = User.password_hasher(password)
+        update_password_hash(fetched_user.user_id, fetched_user.password)
 
-        if dob_date > date.today():
-            return False, None, "Date of birth cannot be in the future."
-
-        return True, dob_date, ""
-    except ValueError:
-        return False, None, "Please enter a valid date of birth."
+    return fetched_user
 
 
 def check_username_exists(username: str) -> bool:
     """
-    Checks if a username already exists in the database.
+    Checks if a username already exists, using the in-memory username index.
 
     Args:
         username: Username to be checked
@@ -122,14 +117,7 @@ def check_username_exists(username: str) -> bool:
     Returns:
         True if username exists, False otherwise.
     """
-
-    # Set up a db connection and look for a matching user
-    connection = sqlite3.connect(DB_PATH)
-    cursor = connection.cursor()
-    cursor.execute("SELECT Username FROM User WHERE Username = ?", (username,))
-    exists = cursor.fetchone() is not None
-    connection.close()
-    return exists
+    return get_username_index().is_taken(username)
 
 
 class App:
@@ -141,6 +129,11 @@ class App:
             root: Main application window.
         """
         self.root = root
+        # Password hashing runs here so the window keeps responding
+        self.hash_executor = ThreadPoolExecutor(max_workers=1)
+        # Warm the username index in the background so availability checks never wait on disk
+        self.hash_executor.submit(get_username_index)
+        self.registering = False
 
         self._configure_window()
         self._create_main_frame()
@@ -189,6 +182,7 @@ class App:
             font=("roboto", 12, "bold")
         )
         self.username_entry = tb.Entry(self.mainframe)
+        self.username_entry.bind("<KeyRelease>", lambda event: self._update_username_status())
 
         self.password_label = tb.Label(
             self.mainframe,
@@ -203,8 +197,47 @@ class App:
             command=self.login_func
         )
 
+        self.remember_var = tb.BooleanVar(value=False)
+        self.remember_checkbutton = tb.Checkbutton(
+            self.mainframe,
+            text="Remember me on this device",
+            variable=self.remember_var
+        )
+
+        # Members remembered on this device can switch in without their password
+        self.session_frame = tb.Frame(self.mainframe)
+        self.session_label = tb.Label(
+            self.session_frame,
+            text="Remembered Members",
+            font=("roboto", 12, "bold")
+        )
+        self.session_combobox = tb.Combobox(self.session_frame, state="readonly", width=20)
+        self.session_button = tb.Button(
+            self.session_frame,
+            text="Continue",
+            command=self.resume_func
+        )
+        self.forget_button = tb.Button(
+            self.session_frame,
+            text="Forget",
+            command=self.forget_func,
+            bootstyle="secondary"
+        )
+        self.session_label.grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 5))
+        self.session_combobox.grid(row=1, column=0, sticky="ew", padx=(0, 5))
+        self.session_button.grid(row=1, column=1, padx=5)
+        self.forget_button.grid(row=1, column=2, padx=(5, 0))
+        self.session_frame.grid_columnconfigure(0, weight=1)
+
     def _create_registration_widgets(self) -> None:
         """Widgets and dropdown displays for dob and bilogical sex."""
+        # Shows whether the typed username is free, next to the username label
+        self.username_status_label = tb.Label(
+            self.mainframe,
+            text="",
+            font=("roboto", 10)
+        )
+
         self.sex_label = tb.Label(
             self.mainframe,
             text="Biological Sex",
@@ -276,6 +309,49 @@ class App:
         self.password_entry.grid(row=5, column=0, sticky="ew", padx=10, pady=(0, 25))
 
         self.login_button.grid(row=6, column=0, padx=10, pady=10, sticky="ew")
+        self._show_session_widgets()
+
+    def _show_session_widgets(self) -> None:
+        """Shows the remember me option, and the remembered members if there are any."""
+        self.remember_checkbutton.grid(row=7, column=0, sticky="w", padx=10, pady=(0, 15))
+
+        usernames = sorted(load_remembered_sessions())
+        self.session_combobox.config(values=usernames)
+        if not usernames:
+            self.session_frame.grid_forget()
+            return
+
+        if self.session_combobox.get() not in usernames:
+            self.session_combobox.current(0)
+        self.session_frame.grid(row=8, column=0, sticky="ew", padx=10, pady=(15, 0))
+
+    def _hide_session_widgets(self) -> None:
+        """Hides the session widgets while registering."""
+        self.remember_checkbutton.grid_forget()
+        self.session_frame.grid_forget()
+
+    def _run_hashing_job(self, button: tb.Button, busy_text: str, job, on_done) -> None:
+        """
+        Runs a password hashing job on the worker thread, disabling the button until it finishes.
+
+        Args:
+            button: Button that started the job.
+            busy_text: Text shown on the button meanwhile.
+            job: Callable run on the worker thread.
+            on_done: Called on the Tk thread with the job's Future once it finishes.
+        """
+        idle_text = button.cget("text")
+        button.config(state="disabled", text=busy_text)
+        future = self.hash_executor.submit(job)
+
+        def poll() -> None:
+            if not future.done():
+                self.root.after(HASH_POLL_MS, poll)
+                return
+            button.config(state="normal", text=idle_text)
+            on_done(future)
+
+        self.root.after(HASH_POLL_MS, poll)
 
     def login_func(self) -> None:
         """
@@ -284,43 +360,63 @@ class App:
         username_attempt = self.username_entry.get()
         password_attempt = self.password_entry.get()
 
-        connection = get_db_connection()
-        cursor = connection.cursor()
+        self._run_hashing_job(
+            self.login_button,
+            "CHECKING...",
+            lambda: authenticate_user(username_attempt, password_attempt),
+            self._login_finished
+        )
 
-        # Search for a matching user in the database
+    def _login_finished(self, future) -> None:
+        """Loads the dashboard if the credentials were correct."""
+        try:
+            fetched_user = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to log in: {e}")
+            return
 
-        cursor.execute(
-            """
-            SELECT UserID, Username, Password, Sex, DateOfBirth, JoinDate
-            FROM User WHERE Username = ?
-            """,
-            (username_attempt,)
-        )
-        result = cursor.fetchone()
-        connection.close()
-
-        # Create a user object if a match is found
-
-        if result:
-            fetched_user = User(
-                username=result[1],
-                password=result[2],
-                sex=result[3],
-                dob=result[4],
-                join_date=result[5],
-                user_id=result[0]
-            )
-
-            # Checks input password against hash stored in database
-
-            if fetched_user.password_check(password_attempt):
-                messagebox.showinfo("Success", "Login successful!")
-                self.mainframe.grid_forget()
-                Dashboard(self.root, fetched_user)
-            else:
-                self._login_failed()
-        else:
+        if fetched_user is None:
             self._login_failed()
+            return
+
+        if self.remember_var.get():
+            remember_session(fetched_user.username, create_session(fetched_user.user_id))
+
+        messagebox.showinfo("Success", "Login successful!")
+        self._open_dashboard(fetched_user)
+
+    def resume_func(self) -> None:
+        """Logs a remembered member straight in with their session token."""
+        username = self.session_combobox.get()
+        token = load_remembered_sessions().get(username)
+        user = resume_session(token) if token else None
+
+        if user is None:
+            forget_session(username)
+            self._show_session_widgets()
+            messagebox.showerror("Session Expired", "Please log in with your password again.")
+            return
+
+        self._open_dashboard(user)
+
+    def forget_func(self) -> None:
+        """Removes the selected member from this device's remembered members."""
+        username = self.session_combobox.get()
+        if username:
+            forget_session(username)
+            self.session_combobox.set("")
+            self._show_session_widgets()
+
+    def _open_dashboard(self, user: User) -> None:
+        """Replaces the login window with the user's dashboard."""
+        # Caches the user's profile for every page opened in this session, and
+        # loads each tab's data in the background so the first visit is instant
+        get_user_context(user)
+        prefetch_page_data(user)
+
+        self.mainframe.destroy()
+        self.hash_executor.shutdown(wait=False)
+        Dashboard(self.root, user)
 
     def _login_failed(self) -> None:
         """Handles failed login attempts."""
@@ -345,6 +441,7 @@ class App:
         messagebox.showinfo("Register", "Please fill in the fields to register a new account.")
 
         self._clear_all_fields()
+        self._hide_session_widgets()
 
         # Configure mainframe grid
         self.mainframe.grid_rowconfigure((1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12), weight=0)
@@ -355,6 +452,8 @@ class App:
 
         self.username_label.grid(row=2, column=0, sticky="w", padx=10, pady=(15, 0))
         self.username_entry.grid(row=3, column=0, sticky="ew", padx=10, pady=(0, 25))
+        self.username_status_label.grid(row=2, column=0, sticky="e", padx=10, pady=(15, 0))
+        self.registering = True
 
         self.password_label.grid(row=4, column=0, sticky="w", padx=10, pady=(15, 0))
         self.password_entry.grid(row=5, column=0, sticky="ew", padx=10, pady=(0, 25))
@@ -379,6 +478,21 @@ class App:
         self.login_button.grid_forget()
         self.register_button.grid(row=11, column=0, padx=10, pady=10, sticky="ew")
 
+    def _update_username_status(self) -> None:
+        """Tells the user, while registering, whether the username typed so far is taken."""
+        if not self.registering:
+            return
+
+        username = self.username_entry.get().strip()
+        if not username:
+            self.username_status_label.config(text="", bootstyle="default")
+        elif check_username_exists(username):
+            self.username_status_label.config(text="Username taken", bootstyle="danger")
+        elif validate_username(username)[0]:
+            self.username_status_label.config(text="Available", bootstyle="success")
+        else:
+            self.username_status_label.config(text="", bootstyle="default")
+
     def register_submit(self) -> None:
         """
         Validates registration inputs and creates a new user record for the database
@@ -422,26 +536,47 @@ class App:
 
         # Create a user object from registration information and catch db error(s)
 
-        try:
-            self._create_user(username_input, password_input, sex_input, dob_date)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to register user: {e}")
+        self._run_hashing_job(
+            self.register_button,
+            "CREATING ACCOUNT...",
+            lambda: self._create_user(username_input, password_input, sex_input, dob_date),
+            self._registration_finished
+        )
 
-    def _create_user(self, username: str, password: str, sex: str, dob: date) -> None:
+    def _create_user(self, username: str, password: str, sex: str, dob: date) -> bool:
         """
-        Creates a new user and saves to database.
+        Creates a new user and saves to database. Runs on the hashing worker thread.
 
         Args:
             username: User's chosen username.
             password: User's password (will be hashed).
             sex: User's biological sex.
             dob: User's date of birth.
+
+        Returns:
+            True if the user was saved, False if the username was taken meanwhile.
         """
         today = date.today()
         hashed_password = User.password_hasher(password)
 
         new_user = User(username, hashed_password, sex, dob, today)
-        save_user_to_db(new_user)
+        saved = save_user_to_db(new_user)
+
+        # The username is taken either way, by this account or one created elsewhere meanwhile
+        get_username_index().add(username)
+        return saved
+
+    def _registration_finished(self, future) -> None:
+        """Returns to the login view once the new user is saved, catching db error(s)."""
+        try:
+            saved = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to register user: {e}")
+            return
+
+        if not saved:
+            messagebox.showerror("Error", "Username already exists. Please choose another.")
+            return
 
         messagebox.showinfo("Success", "Registration complete! You can now log in.")
 
@@ -457,13 +592,17 @@ class App:
         self.dob_label.grid_forget()
         self.dob_frame.grid_forget()
         self.register_button.grid_forget()
+        self.username_status_label.grid_forget()
+        self.registering = False
 
         self.login_button.grid(row=6, column=0, pady=10, padx=10, sticky="ew")
+        self._show_session_widgets()
 
     def _clear_all_fields(self) -> None:
         """Clears all input fields."""
         self.username_entry.delete(0, 'end')
         self.password_entry.delete(0, 'end')
+        self.username_status_label.config(text="", bootstyle="default")
         self.sex_combobox.set('')
         self.day_spinbox.set(1)
         self.month_combobox.current(0)
@@ -2,16 +2,18 @@
 Measurement Module - ReHealth
 """
 
-import os
-from datetime import datetime
+from functools import partial
 from tkinter import messagebox
 
 import ttkbootstrap as tb
 
-from db.db_handler import save_metrics, get_all_days_metrics
+from db.db_handler import save_metrics
 from logic.calculations import bmi_calc, bmi_status
+from logic.exports import count_export_rows, export_filename, export_history
 from logic.user import User
-from ui.ui_handler import return_to_dashboard, BasePage
+from logic.user_context import get_user_context
+from ui.history_viewer import HistoryViewer
+from ui.ui_handler import return_to_dashboard, BackgroundTask, BasePage
 
 
 def _validate_positive_float(metric_input: str, field_name: str, desired_unit: str) -> tuple[bool, float, str]:
@@ -43,61 +45,13 @@ def _validate_positive_float(metric_input: str, field_name: str, desired_unit: s
     return True, value, ""
 
 
-def _make_metric_logs_dir() -> str:
-    """
-    Create (if needed) and return the absolute path to metric_logs.
-    """
-    directory = os.path.join(os.path.dirname(__file__), "..", "metric_logs")
-    directory = os.path.abspath(directory)
-    os.makedirs(directory, exist_ok=True)
-    return directory
-
-
-def _build_metrics_filename(username: str) -> str:
-    """
-    Args:
-        username: The user's username to include in the filename.
-    """
-    current_date = datetime.now().strftime("%d-%m-%Y")
-    return os.path.join(_make_metric_logs_dir(), f"{username}_metric_log_{current_date}.txt")
-
-
-def _write_metrics_log(filename: str, username: str, records: list[tuple]) -> None:
-    """
-    Writes measurement records to a text file.
-
-    Args:
-        filename: Full file path for the user metrics.
-        username: Username for the title of the file.
-        records: DB records in form (date, height, weight).
-    """
-    with open(filename, "w", encoding="utf-8") as file:
-        # Label the metrics file
-        file.write(f"Measurement Records for {username}\n")
-        file.write(f"Downloaded on: {datetime.now().strftime('%d-%m-%Y %H:%M')}\n")
-        file.write("=" * 60 + "\n\n")
-
-        # Unpack records tuple and place contents in the file
-
-        for record in records:
-            date, height, weight = record
-            bmi = bmi_calc(weight, height)
-            status = bmi_status(bmi)
-
-            file.write(f"Date: {date}\n")
-            file.write(f"Height: {height} cm\n")
-            file.write(f"Weight: {weight} kg\n")
-            file.write(f"BMI: {bmi} ({status})\n")
-            file.write("-" * 60 + "\n")
-
-
 class Measurement(BasePage):
     """GUI screen for recording height/weight and calculating BMI + exporting history."""
 
     def __init__(self, root: tb.Window, user: User) -> None:
-        self.height_val: float = 0.0
-        self.weight_val: float = 0.0
-        self.bmi_val: float = 0.0
+        # Start from the latest recorded measurements, cached for the session
+        self.height_val, self.weight_val = get_user_context(user).latest_metrics()
+        self.bmi_val: float = bmi_calc(self.weight_val, self.height_val) if self.height_val else 0.0
 
         # Call parent constructor
         super().__init__(root, user, "Measurement")
@@ -122,21 +76,21 @@ class Measurement(BasePage):
 
         self.height_value_label = tb.Label(
             self.frame,
-            text="Height: 0 cm",
+            text=f"Height: {self.height_val} cm",
             font=("roboto", 14),
         )
         self.height_value_label.grid(row=1, column=0, columnspan=3, pady=(10, 10), padx=20)
 
         self.weight_value_label = tb.Label(
             self.frame,
-            text="Weight: 0 kg",
+            text=f"Weight: {self.weight_val} kg",
             font=("roboto", 14),
         )
         self.weight_value_label.grid(row=2, column=0, columnspan=3, pady=(10, 10), padx=20)
 
         self.bmi_label = tb.Label(
             self.frame,
-            text="BMI: 0",
+            text=f"BMI: {self.bmi_val} ({bmi_status(self.bmi_val)})" if self.bmi_val else "BMI: 0",
             font=("roboto", 14),
         )
         self.bmi_label.grid(row=3, column=0, pady=(10, 30), columnspan=3, padx=20)
@@ -185,12 +139,19 @@ class Measurement(BasePage):
         )
         self.download_button.grid(row=6, column=1, columnspan=2, pady=(30, 10), padx=10)
 
+        self.history_button = tb.Button(
+            self.frame,
+            text="View Measurement History",
+            command=self.show_history,
+        )
+        self.history_button.grid(row=7, column=0, columnspan=3, pady=(10, 10), padx=10)
+
         self.dash_button = tb.Button(
             self.frame,
             text="Back to Dashboard",
             command=self.return_to_dash,
         )
-        self.dash_button.grid(row=7, column=0, columnspan=3, pady=(170, 20), padx=20)
+        self.dash_button.grid(row=8, column=0, columnspan=3, pady=(120, 20), padx=20)
 
     def calculate_and_save_bmi(self) -> None:
         """
@@ -242,24 +203,35 @@ class Measurement(BasePage):
 
     def download_records(self) -> None:
         """
-        Downloads all past measurement records for the user to a text file.
+        Downloads all past measurement records for the user to a text file in the background.
         """
         try:
-            records = get_all_days_metrics(self.user.user_id)
-
-            # Attempt to fetch records and return an appropriate error message if one occurs
-            if not records:
+            # Return an appropriate message if there is nothing to download
+            if count_export_rows("measurements", self.user.user_id) == 0:
                 messagebox.showinfo("No Records", "No measurement records found for this user.")
                 return
 
-            filename = _build_metrics_filename(self.user.username)
-            _write_metrics_log(filename, self.user.username, records)
-
-            messagebox.showinfo("Success", f"Records downloaded successfully to {filename}")
+            filename = export_filename("measurements", self.user.username)
+            job = partial(export_history, "measurements", self.user.user_id, self.user.username, filename)
+            BackgroundTask(self.root, "Downloading measurements", [job], self._download_finished, max_workers=1)
 
         except Exception as exc:
             messagebox.showerror("Error", f"Failed to download records: {exc}")
 
+    def _download_finished(self, filenames: list, errors: list, cancelled: bool) -> None:
+        """Reports the outcome of a background download."""
+        if errors:
+            messagebox.showerror("Error", f"Failed to download records: {errors[0]}")
+        elif cancelled:
+            messagebox.showinfo("Cancelled", "Download cancelled. No file was saved.")
+        else:
+            messagebox.showinfo("Success", f"Records downloaded successfully to {filenames[0]}")
+
+    def show_history(self) -> None:
+        """Opens the scrollable list of every recorded measurement."""
+        self.frame.destroy()
+        HistoryViewer(self.root, self.user, "measurements", return_page=Measurement)
+
     def return_to_dash(self) -> None:
         """Returns to the dashboard screen."""
         return_to_dashboard(self.frame, self.root, self.user)
@@ -0,0 +1,203 @@
+"""
+Page_Data Module - ReHealth
+
+Cache of the data pages load when they open, filled on a background thread
+right after login so the first visit to each tab does not wait on the
+database or matplotlib. Entries are dropped when the db_handler change bus
+reports a save to a table they were read from, and only last for the day
+they were loaded on, as the weekly series move with the date. Every read also
+checks PRAGMA data_version, so a write from another ReHealth instance clears
+the cache whichever page is open.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import partial
+
+from db.db_handler import DataVersionWatcher, subscribe_changes
+from logic.dashboard_data import get_dashboard_snapshot
+from logic.exercise_catalog import build_exercise_index
+from logic.food_catalog import get_food_suggester
+from logic.nutrition_db import get_nutrition_database
+from logic.score_engine import get_rank_events, get_score_before, get_score_history, get_user_score
+from logic.streaks import get_streaks
+from logic.user import User
+from logic.user_context import get_user_context
+from ui.graph_render import GRAPH_CACHE, create_figure, fetch_graph_data, graph_cache_key, plot_line, render_png
+
+ACTIVITY_TABLES = ("Steps", "Food", "Sleep", "Exercises", "MetricsTracking")
+SCORED_TABLES = ("Steps", "Sleep", "Exercises")
+
+# Days the achievements page shows the score gained over
+SCORE_HISTORY_DAYS = 30
+
+
+def get_score_gain(user_id: int, days: int = SCORE_HISTORY_DAYS) -> int:
+    """
+    Score gained over the last few days, today included.
+
+    Each snapshot is a day's end-of-day score, so the gain is measured from the
+    latest snapshot before the window rather than the first one inside it.
+    """
+    today = date.today()
+    start = today - timedelta(days=days - 1)
+    baseline = get_score_before(user_id, start)
+    history = get_score_history(user_id, start, today)
+    return (history[-1][1] if history else baseline) - baseline
+
+# Each page's data: name -> (loader called with the user's ID, tables it is read from)
+PAGE_SOURCES = {
+    "dashboard": (get_dashboard_snapshot, ACTIVITY_TABLES),
+    "score": (get_user_score, SCORED_TABLES),
+    "rank_events": (partial(get_rank_events, limit=3), SCORED_TABLES),
+    "score_gain": (get_score_gain, SCORED_TABLES),
+    "streaks": (get_streaks, ("Steps", "Food", "Sleep", "Exercises")),
+    "exercise_index": (lambda user_id: build_exercise_index(), ("Exercises",)),
+    "graph:steps": (partial(fetch_graph_data, "steps"), ("Steps",)),
+    "graph:sleep": (partial(fetch_graph_data, "sleep"), ("Sleep",)),
+    "graph:calories": (partial(fetch_graph_data, "calories"), ("Food",)),
+    "graph:bmi": (partial(fetch_graph_data, "bmi"), ("MetricsTracking",)),
+    "graph:score": (partial(fetch_graph_data, "score"), SCORED_TABLES),
+}
+
+# Sources that are the same for every user, cached once rather than per user
+SHARED_SOURCES = {"exercise_index"}
+
+
+class PageDataCache:
+    """
+    Page data keyed by user, source name and day.
+    """
+
+    def __init__(self) -> None:
+        self._entries = {}
+        # Bumped on every invalidation so a load that started before it is not stored
+        self._generations = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        # Opened on first use, as the database may not exist when this module is imported
+        self._watcher = None
+
+    def _owner(self, user_id: int, name: str) -> int | None:
+        return None if name in SHARED_SOURCES else user_id
+
+    def _generation(self, owner: int | None) -> tuple[int, int]:
+        return self._epoch, self._generations.get(owner, 0)
+
+    def _check_external_writes(self) -> None:
+        """
+        Drops every entry if another connection has committed since the last check.
+        Must be called with the lock held.
+        """
+        if self._watcher is None:
+            self._watcher = DataVersionWatcher(check_same_thread=False)
+        elif self._watcher.has_changed():
+            # The write could be to any table for any user
+            self._entries.clear()
+            self._epoch += 1
+
+    def get(self, user_id: int, name: str):
+        """
+        Returns a page's data, loading and caching it if it is not cached yet.
+
+        Args:
+            user_id: The user's ID.
+            name: Key from PAGE_SOURCES.
+        """
+        owner = self._owner(user_id, name)
+        key = (owner, name, date.today())
+
+        with self._lock:
+            self._check_external_writes()
+            if key in self._entries:
+                return self._entries[key]
+            generation = self._generation(owner)
+
+        loader, _ = PAGE_SOURCES[name]
+        value = loader(user_id)
+
+        with self._lock:
+            if self._generation(owner) == generation:
+                self._entries[key] = value
+        return value
+
+    def invalidate(self, user_id: int, table: str | None = None) -> None:
+        """
+        Drops cached data read from a table, or all of a user's data if no table is given.
+        Shared sources read from the table are dropped whatever the user.
+        """
+        with self._lock:
+            for owner in (user_id, None):
+                self._generations[owner] = self._generations.get(owner, 0) + 1
+
+            for key in list(self._entries):
+                owner, name, _ = key
+                if owner is not None and owner != user_id:
+                    continue
+                if owner is None and table is None:
+                    continue
+                if table is None or table in PAGE_SOURCES[name][1]:
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """Removes every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self._epoch += 1
+
+
+PAGE_DATA = PageDataCache()
+
+# A single worker keeps prefetching from competing with itself for the database
+_prefetch_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def _prefetch_graph(user: User, graph_type: str) -> None:
+    """Loads a graph's data and renders it into the graph cache if it is not there yet."""
+    data = PAGE_DATA.get(user.user_id, f"graph:{graph_type}")
+    key = graph_cache_key(graph_type, user.user_id, data)
+    if GRAPH_CACHE.get(key) is not None:
+        return
+
+    fig, ax = create_figure()
+    plot_line(ax, *data, graph_type)
+    GRAPH_CACHE.put(key, render_png(fig))
+
+
+def _prefetch(user: User) -> None:
+    """Worker thread job loading every page's data for a user."""
+    for name in PAGE_SOURCES:
+        try:
+            if name.startswith("graph:"):
+                _prefetch_graph(user, name.split(":", 1)[1])
+            else:
+                PAGE_DATA.get(user.user_id, name)
+        except Exception as e:
+            print(f"Error prefetching {name}: {e}")
+
+    # Per-session caches kept by other modules
+    try:
+        get_user_context(user).latest_metrics()
+        get_food_suggester(user.user_id)
+        get_nutrition_database()
+    except Exception as e:
+        print(f"Error prefetching user data: {e}")
+
+
+def prefetch_page_data(user: User):
+    """
+    Starts loading every page's data for a user in the background.
+
+    Returns:
+        A Future that completes once everything is cached.
+    """
+    return _prefetch_executor.submit(_prefetch, user)
+
+
+def _on_data_changed(table: str, user_id: int) -> None:
+    """Change bus listener that drops the data read from the changed table."""
+    PAGE_DATA.invalidate(user_id, table)
+
+
+subscribe_changes(_on_data_changed)
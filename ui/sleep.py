@@ -4,7 +4,7 @@ from tkinter import messagebox
 
 import ttkbootstrap as tb
 
-from db.db_handler import save_sleep, get_last_7_days_sleep_convert
+from db.db_handler import save_sleep
 from logic.calculations import sleep_calc
 from logic.user import User
 from ui.ui_handler import return_to_dashboard, GraphTemplate, BasePage
@@ -231,24 +231,7 @@ class SleepGraph(GraphTemplate):
     """
     Class for plotting a graph showing the user's sleep over the course of the last 7 years.
     """
-    def plot_data(self) -> None:
-        """
-        Fetches sleep values and plot/style the graph
-        """
-        self.ax.clear()
-        days, sleep_hours = get_last_7_days_sleep_convert(self.user.user_id)
-
-        self.ax.plot(
-            days,
-            sleep_hours,
-            marker='o',
-            color='#4e73df',
-            linewidth=2,
-            markersize=8
-        )
-
-        self.style_axes("Days", "Hours", "Sleep Over Time")
-        self.canvas.draw()
+    graph_type = "sleep"
 
     def get_graph_filename(self) -> str:
         return f"{self.user.username}_sleep_graph_week.png"
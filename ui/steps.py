@@ -4,9 +4,10 @@ from tkinter import messagebox
 
 import ttkbootstrap as tb
 
-from db.db_handler import get_weight, save_steps, get_last_7_days_steps_convert
+from db.db_handler import save_steps
 from logic.calculations import calories_burnt
 from logic.user import User
+from logic.user_context import get_user_context
 from ui.ui_handler import return_to_dashboard, GraphTemplate, BasePage
 
 
@@ -157,7 +158,7 @@ class Steps(BasePage):
         self.step_count = steps_value
         self.count_label.config(text=f"Step Count: {self.step_count}")
         # Estimate calories burnt and update calorie label
-        weight = get_weight(self.user.user_id)
+        weight = get_user_context(self.user).weight
         self.calorie_count = calories_burnt(steps_value, weight)
         self.calorie_label.config(
             text=f"Calories Burnt: {round(self.calorie_count)} kcal"
@@ -174,16 +175,7 @@ class Steps(BasePage):
 
 class StepGraph(GraphTemplate):
     """Class created to plot a graph conveying user steps over the course of the past  days"""
-    def plot_data(self) -> None:
-
-        # Clear old graph and fetch steps from database
-        self.ax.clear()
-        days, steps = get_last_7_days_steps_convert(self.user.user_id)
-        # Plot and style the graph
-        self.ax.plot(days, steps, marker='o', color='#4e73df',
-                     linewidth=2, markersize=8)
-        self.style_axes('Days', 'Steps', 'Steps Over Time')
-        self.canvas.draw()
+    graph_type = "steps"
 
     def get_graph_filename(self) -> str:
         return f"{self.user.username}_steps_graph_week.png"
@@ -1,10 +1,26 @@
+import base64
 import os
+import threading
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from tkinter import messagebox
 import ttkbootstrap as tb
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
 from abc import ABC, abstractmethod
 
+from ui.graph_render import (
+    EXPORT_FORMATS,
+    GRAPH_CACHE,
+    GRAPH_SOURCES,
+    create_figure,
+    export_graph,
+    graph_cache_key,
+    plot_line,
+    render_png,
+    style_axes
+)
+from ui.page_data import PAGE_DATA
+
 
 def return_to_dashboard(frame, root, user):
     """
@@ -15,15 +31,144 @@ def return_to_dashboard(frame, root, user):
     Dashboard(root, user)
 
 
+def _images_folder():
+    """
+    Create (if needed) and return the absolute path to the images folder.
+    """
+    images_folder = os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "images")
+    )
+    os.makedirs(images_folder, exist_ok=True)
+    return images_folder
+
+
+class ProgressDialog:
+    """Small window showing a determinate progress bar and a cancel button"""
+
+    def __init__(self, root, title, on_cancel):
+        self.window = tb.Toplevel(root)
+        self.window.title(title)
+        self.window.resizable(False, False)
+        self.window.transient(root)
+        self.window.protocol("WM_DELETE_WINDOW", on_cancel)
+
+        self.status_label = tb.Label(self.window, text=f"{title}...", font=("roboto", 12))
+        self.status_label.grid(row=0, column=0, padx=20, pady=(20, 10))
+
+        self.progress_bar = tb.Progressbar(
+            self.window,
+            orient="horizontal",
+            mode="determinate",
+            length=300,
+            maximum=100,
+            bootstyle="info-striped"
+        )
+        self.progress_bar.grid(row=1, column=0, padx=20, pady=(0, 10))
+
+        self.cancel_button = tb.Button(
+            self.window,
+            text="Cancel",
+            command=on_cancel,
+            bootstyle="danger"
+        )
+        self.cancel_button.grid(row=2, column=0, pady=(0, 20))
+
+    def set_progress(self, percent, text):
+        """Updates the bar and status text"""
+        self.progress_bar["value"] = percent
+        self.status_label.config(text=text)
+
+    def close(self):
+        """Closes the dialog window"""
+        self.window.destroy()
+
+
+class BackgroundTask:
+    """
+    Runs jobs on worker threads while a progress dialog keeps the window responsive.
+
+    Each job is called as job(cancel_event, report_progress) where report_progress
+    takes a fraction between 0 and 1. Tk is only touched from the main thread,
+    which polls the workers with root.after.
+    """
+
+    POLL_MS = 100
+
+    def __init__(self, root, title, jobs, on_finish, max_workers=4):
+        self.root = root
+        self.on_finish = on_finish
+        self.cancel_event = threading.Event()
+        self.job_progress = [0.0] * len(jobs)
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.futures = [
+            self.executor.submit(job, self.cancel_event, partial(self._report_progress, index))
+            for index, job in enumerate(jobs)
+        ]
+
+        self.dialog = ProgressDialog(root, title, self.cancel)
+        self.root.after(self.POLL_MS, self._poll)
+
+    def _report_progress(self, index, fraction):
+        """Called from worker threads to record how far through a job they are"""
+        self.job_progress[index] = fraction
+
+    def cancel(self):
+        """Stops jobs that have not started and asks running ones to stop"""
+        self.cancel_event.set()
+        for future in self.futures:
+            future.cancel()
+        self.dialog.status_label.config(text="Cancelling...")
+        self.dialog.cancel_button.config(state="disabled")
+
+    def _poll(self):
+        """Updates the dialog and finishes once every job is done"""
+        finished = sum(1 for future in self.futures if future.done())
+        fractions = [
+            1.0 if future.done() else self.job_progress[index]
+            for index, future in enumerate(self.futures)
+        ]
+        percent = sum(fractions) / len(self.futures) * 100 if self.futures else 100
+
+        if finished < len(self.futures):
+            if not self.cancel_event.is_set():
+                self.dialog.set_progress(percent, f"{finished} of {len(self.futures)} complete")
+            self.root.after(self.POLL_MS, self._poll)
+            return
+
+        self.executor.shutdown(wait=False)
+        self.dialog.close()
+
+        results = []
+        errors = []
+        for future in self.futures:
+            if future.cancelled():
+                continue
+            if future.exception() is not None:
+                errors.append(future.exception())
+            elif future.result() is not None:
+                results.append(future.result())
+
+        self.on_finish(results, errors, self.cancel_event.is_set())
+
+
 class GraphTemplate(ABC):
     """Template class designed for all user graphs"""
 
+    # Key into graph_render.GRAPH_SOURCES / GRAPH_LABELS, set by subclasses
+    graph_type = None
+
     def __init__(self, graph_frame, user, parent_frame, root):
         self.graph_frame = graph_frame
         self.user = user
         self.parent_frame = parent_frame
         self.root = root
 
+        self.fig = None
+        self.ax = None
+        self.data = None
+        self.graph_image = None
+
         self._configure_frame()
         self._create_graph()
         self._create_buttons()
@@ -37,20 +182,41 @@ class GraphTemplate(ABC):
         """
         "Creates main blueprint for later graphs
         """
-        self.fig = Figure(figsize=(6, 4), dpi=67, facecolor='#222222')
-        self.ax = self.fig.add_subplot(111)
-        self.ax.set_facecolor('#2b3e50')
-
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.graph_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
+        self.canvas_widget = tb.Label(self.graph_frame)
+        self._render_graph()
+        self.canvas_widget.grid(row=0, column=0, pady=(0, 10))
 
+    def _render_graph(self):
+        """
+        Displays the graph, reusing a cached image when the plotted data has not changed.
+        """
+        self.data = self.fetch_data()
+        key = graph_cache_key(self.graph_type, self.user.user_id, self.data)
+
+        image = GRAPH_CACHE.get(key)
+        if image is None:
+            # Only draw with matplotlib when this exact graph has not been rendered before
+            self._draw_figure()
+            image = render_png(self.fig)
+            GRAPH_CACHE.put(key, image)
+
+        self.graph_image = tk.PhotoImage(master=self.graph_frame, data=base64.b64encode(image))
+        self.canvas_widget.configure(image=self.graph_image)
+
+    def _draw_figure(self):
+        """Creates the figure if needed and plots the current data on it"""
+        if self.fig is None:
+            self.fig, self.ax = create_figure()
         self.plot_data()
-        self.canvas_widget.grid(row=0, column=0, pady=(0, 10))
 
-    @abstractmethod
+    def fetch_data(self):
+        """Fetch the (days, values) series shown on the graph, usually already prefetched"""
+        return PAGE_DATA.get(self.user.user_id, f"graph:{self.graph_type}")
+
     def plot_data(self):
-        """Fetch and plot data - must be implemented by subclasses"""
-        pass
+        """Plot the fetched data - can be overridden by subclasses"""
+        days, values = self.data
+        plot_line(self.ax, days, values, self.graph_type)
 
     @abstractmethod
     def get_graph_filename(self):
@@ -59,38 +225,60 @@ class GraphTemplate(ABC):
 
     def style_axes(self, xlabel, ylabel, title):
         """Apply consistent styling to axes"""
-        self.ax.set_xlabel(xlabel, color='#adb5bd')
-        self.ax.set_ylabel(ylabel, color='#adb5bd')
-        self.ax.set_title(title, color='#ffffff')
-        self.ax.tick_params(colors='#adb5bd')
-
-        for spine in self.ax.spines.values():
-            spine.set_color('#adb5bd')
-
-        self.ax.grid(True, alpha=0.2, color='#adb5bd')
+        style_axes(self.ax, xlabel, ylabel, title)
 
     def refresh_graph(self):
         """Refresh graph with new data"""
-        self.plot_data()
+        self._render_graph()
+
+    def _export_filename(self, file_format):
+        """Path in the images folder for this graph in the chosen format"""
+        base_name = os.path.splitext(self.get_graph_filename())[0]
+        return os.path.join(_images_folder(), f"{base_name}.{file_format}")
 
     def save_graph(self):
-        """Save graph to images folder"""
-        try:
-            images_folder = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), "..", "images")
+        """Save graph to images folder in the background"""
+        file_format = self.format_combobox.get()
+        filename = self._export_filename(file_format)
+        job = partial(self._export_job, self.graph_type, filename)
+
+        BackgroundTask(self.root, "Saving graph", [job], self._export_finished, max_workers=1)
+
+    def save_all_graphs(self):
+        """Save every one of the user's graphs to the images folder concurrently"""
+        file_format = self.format_combobox.get()
+        jobs = [
+            partial(
+                self._export_job,
+                graph_type,
+                os.path.join(_images_folder(), f"{self.user.username}_{graph_type}_graph_week.{file_format}")
             )
-            os.makedirs(images_folder, exist_ok=True)
+            for graph_type in GRAPH_SOURCES
+        ]
 
-            filename = os.path.join(images_folder, self.get_graph_filename())
-            self.fig.savefig(filename, dpi=100, facecolor='#222222')
+        BackgroundTask(self.root, "Saving graphs", jobs, self._export_finished)
 
-            messagebox.showinfo("Success", f"Graph saved to {filename}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save graph: {e}")
+    def _export_job(self, graph_type, filename, cancel_event, report_progress):
+        """Worker thread job that renders and saves one graph"""
+        return export_graph(
+            graph_type, self.user.user_id, filename, dpi=100,
+            cancel_event=cancel_event, report_progress=report_progress
+        )
+
+    def _export_finished(self, filenames, errors, cancelled):
+        """Reports the outcome of a background export"""
+        if errors:
+            messagebox.showerror("Error", f"Failed to save graph: {errors[0]}")
+        elif cancelled:
+            messagebox.showinfo("Cancelled", f"Export cancelled. {len(filenames)} graph(s) were saved.")
+        elif len(filenames) == 1:
+            messagebox.showinfo("Success", f"Graph saved to {filenames[0]}")
+        else:
+            messagebox.showinfo("Success", f"{len(filenames)} graphs saved to {_images_folder()}")
 
     def _create_buttons(self):
         """
-        Creates necessary navigation buttons ("Download" and "Back to Dashboard")
+        Creates necessary navigation buttons ("Download", "Download All" and "Back to Dashboard")
         """
         button_frame = tb.Frame(self.graph_frame)
         button_frame.grid(row=1, column=0, pady=(0, 20))
@@ -101,11 +289,26 @@ class GraphTemplate(ABC):
             command=self.save_graph
         ).grid(row=0, column=0, padx=(0, 5))
 
+        self.format_combobox = tb.Combobox(
+            button_frame,
+            values=EXPORT_FORMATS,
+            state="readonly",
+            width=5
+        )
+        self.format_combobox.current(0)
+        self.format_combobox.grid(row=0, column=1, padx=5)
+
+        tb.Button(
+            button_frame,
+            text="Download All",
+            command=self.save_all_graphs
+        ).grid(row=0, column=2, padx=5)
+
         tb.Button(
             button_frame,
             text="Back to Dashboard",
             command=self.return_to_dashboard
-        ).grid(row=0, column=1, padx=(5, 0))
+        ).grid(row=0, column=3, padx=(5, 0))
 
     def return_to_dashboard(self):
         """Return to dashboard"""
@@ -1,14 +1,18 @@
 """Workout Module - ReHealth"""
 
-import os
-from datetime import datetime
+from functools import partial
 from tkinter import messagebox
 
 import ttkbootstrap as tb
 
-from db.db_handler import save_workout, get_all_workouts
+from db.db_handler import save_workout
+from logic.exercise_catalog import display_exercise_name
+from logic.exports import count_export_rows, export_filename, export_history
 from logic.user import User
-from ui.ui_handler import return_to_dashboard, BasePage
+from ui.history_search import HistorySearch
+from ui.history_viewer import HistoryViewer
+from ui.page_data import PAGE_DATA
+from ui.ui_handler import return_to_dashboard, BackgroundTask, BasePage
 
 
 def validate_exercise_name(exercise_name: str) -> tuple[bool, str]:
@@ -129,6 +133,9 @@ class Workouts(BasePage):
         self.exercise_reps = None
         self.exercise_sets = None
 
+        # Every known exercise name, searched as the user types
+        self.exercise_index = PAGE_DATA.get(user.user_id, "exercise_index")
+
         # Call parent constructor
         super().__init__(root, user, "Workouts")
 
@@ -158,7 +165,8 @@ class Workouts(BasePage):
         )
         self.name_label.grid(row=1, column=0, pady=(10, 10), sticky="e", padx=(20, 10))
 
-        self.name_textbox = tb.Entry(self.frame, width=20)
+        self.name_textbox = tb.Combobox(self.frame, width=18)
+        self.name_textbox.bind("<KeyRelease>", self._suggest_exercises)
         self.name_textbox.grid(row=1, column=1, pady=(10, 10), padx=(10, 20), columnspan=2)
 
         # Create and place weight and sets labels/entries
@@ -212,6 +220,20 @@ class Workouts(BasePage):
         )
         self.download_button.grid(row=0, column=1, padx=(5, 0))
 
+        self.search_button = tb.Button(
+            self.button_frame,
+            text="Search History",
+            command=self.show_history_search
+        )
+        self.search_button.grid(row=1, column=0, padx=(0, 5), pady=(10, 0))
+
+        self.history_button = tb.Button(
+            self.button_frame,
+            text="View History",
+            command=self.show_history
+        )
+        self.history_button.grid(row=1, column=1, padx=(5, 0), pady=(10, 0))
+
     def _create_dashboard_button(self) -> None:
         """Create the back to dashboard button."""
         self.dash_button = tb.Button(
@@ -219,7 +241,13 @@ class Workouts(BasePage):
             text="Back to Dashboard",
             command=self.return_to_dash
         )
-        self.dash_button.grid(row=6, column=0, columnspan=3, pady=(230, 20), padx=20)
+        self.dash_button.grid(row=6, column=0, columnspan=3, pady=(185, 20), padx=20)
+
+    def _suggest_exercises(self, event=None) -> None:
+        """
+        Offers the known exercises starting with the text typed so far in the name dropdown.
+        """
+        self.name_textbox["values"] = self.exercise_index.search(self.name_textbox.get())
 
     def database_inc(self) -> None:
         """
@@ -272,7 +300,7 @@ class Workouts(BasePage):
             reps: Number of reps per set.
         """
         # Save to database and display a detailed success message
-        save_workout(
+        personal_records = save_workout(
             self.user.user_id,
             exercise_name,
             weight,
@@ -280,10 +308,15 @@ class Workouts(BasePage):
             reps
         )
 
-        messagebox.showinfo(
-            "Success",
-            f"{exercise_name}: {weight}kg x {sets} sets x {reps} reps logged successfully!"
-        )
+        exercise_name = display_exercise_name(exercise_name)
+        # A spelling variant of a known exercise is already indexed under its first spelling
+        if exercise_name not in self.exercise_index:
+            self.exercise_index.add(exercise_name)
+
+        message = f"{exercise_name}: {weight}kg x {sets} sets x {reps} reps logged successfully!"
+        if personal_records:
+            message += f"\n\nNew personal record: {', '.join(personal_records)}!"
+        messagebox.showinfo("Success", message)
 
         # Clear all fields for next entry
         self.name_textbox.delete(0, 'end')
@@ -294,71 +327,50 @@ class Workouts(BasePage):
 
     def download_records(self) -> None:
         """
-        Downloads all past workout records for the user to a text file.
+        Downloads all past workout records for the user to a text file in the background.
         """
         try:
-            # Fetch all workouts using db_handler function
-            records = get_all_workouts(self.user.user_id)
-
-            if not records:
+            if count_export_rows("workouts", self.user.user_id) == 0:
                 messagebox.showinfo(
                     "No Records",
                     "No workout records found for this user."
                 )
                 return
 
-            # Create directory path for workout logs
-            met_log_directory = os.path.join(
-                os.path.dirname(__file__),
-                "..",
-                "metric_logs"
-            )
-            met_log_directory = os.path.abspath(met_log_directory)
-            os.makedirs(met_log_directory, exist_ok=True)
-
-            # Create filename with current date
-            current_date = datetime.now().strftime("%d-%m-%y")
-            filename = os.path.join(
-                met_log_directory,
-                f"{self.user.username}_workout_log_{current_date}.txt"
-            )
+            filename = export_filename("workouts", self.user.username)
+            job = partial(export_history, "workouts", self.user.user_id, self.user.username, filename)
+            BackgroundTask(self.root, "Downloading workouts", [job], self._download_finished, max_workers=1)
 
-            # Write records to file
-            self._write_workout_file(filename, records)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to download records: {str(e)}")
 
+    def _download_finished(self, filenames: list, errors: list, cancelled: bool) -> None:
+        """
+        Reports the outcome of a background download.
+        """
+        if errors:
+            messagebox.showerror("Error", f"Failed to download records: {errors[0]}")
+        elif cancelled:
+            messagebox.showinfo("Cancelled", "Download cancelled. No file was saved.")
+        else:
             messagebox.showinfo(
                 "Success",
-                f"Workout records downloaded successfully to {filename}"
+                f"Workout records downloaded successfully to {filenames[0]}"
             )
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to download records: {str(e)}")
-
-    def _write_workout_file(self, filename: str, records: list) -> None:
+    def show_history_search(self) -> None:
+        """
+        Opens the search over past meals and workouts.
         """
-        Writes workout records to a text file.
+        self.frame.destroy()
+        HistorySearch(self.root, self.user, return_page=Workouts)
 
-        Args:
-            filename: Path to the output file.
-            records: List of workout records from database.
+    def show_history(self) -> None:
         """
-        # Open and label the workout text file with dates and username
-        with open(filename, 'w') as file:
-            file.write(f"Workout Records for {self.user.username}\n")
-            file.write(
-                f"Downloaded on: {datetime.now().strftime('%d-%m-%Y %H:%M')}\n"
-            )
-            file.write("=" * 60 + "\n\n")
-            # Unpack workout tuple from database and write each field to file
-            for record in records:
-                date, exercise_name, weight, sets, reps = record
-
-                file.write(f"Date: {date}\n")
-                file.write(f"Exercise: {exercise_name}\n")
-                file.write(f"Weight: {weight} kg\n")
-                file.write(f"Sets: {sets}\n")
-                file.write(f"Reps: {reps}\n")
-                file.write("-" * 60 + "\n")
+        Opens the scrollable list of every logged workout.
+        """
+        self.frame.destroy()
+        HistoryViewer(self.root, self.user, "workouts", return_page=Workouts)
 
     def return_to_dash(self) -> None:
         """